@@ -3,131 +3,265 @@ Flask Web Application for Quick Sort Comparison
 Aplikasi web sederhana untuk membandingkan Quick Sort Rekursif vs Iteratif
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, g
 import time
-import copy
-import csv
-import random
 import sys
+import os
+from array import array
+
+from sort_keys import parse_sort_spec, describe_sort_spec, build_sort_keys
+from sort_engines import get_engine, engine_label
+from partial_sort import argsort_top_k
+from snapshot import load_product_table
+from product_data import (generate_product_table, insert_product, update_product,
+                          delete_product, query_products, find_column_index, column_index_key)
+from sort_cache import PermutationCache
+from sorted_index import SortedIndex
+from dataset_registry import DatasetRegistry, DEFAULT_DATASET_ID
+from benchmark import iter_benchmark_sizes
+from benchmark_jobs import BenchmarkJobQueue, JobQueueFull, benchmark_row
+from fast_json import RowJsonCache, ENCODER_NAME, encode_payload, dumps
+from metrics import MetricsRegistry, PhaseTimer, COMPARISON_ENGINES, counting_keys
 
 # Increase recursion limit for large datasets
 sys.setrecursionlimit(50000)
 
 app = Flask(__name__)
 
-# ============ Quick Sort Implementations ============
-
-def partition(arr, low, high, key=None, reverse=False):
-    """Fungsi partisi untuk Quick Sort."""
-    if key is None:
-        key = lambda x: x
+# ============ Global Data Storage ============
+# Cache permutasi sorting per (dataset, versi dataset, spesifikasi sort)
+sort_cache = PermutationCache(
+    max_bytes=int(os.environ.get('SORT_CACHE_MAX_MB', 64)) * 1024 * 1024
+)
+
+
+# Byte JSON per baris disimpan di objek dataset untuk versinya saat ini;
+# response disusun dengan concat. Batas baris/byte cache: fast_json.ROW_CACHE_MAX_*
+
+
+def discard_dataset_caches(dataset):
+    """Membuang permutasi dan JSON baris di cache milik versi dataset yang tidak berlaku lagi."""
+    key_prefix = (dataset.id, dataset.version)
+    sort_cache.discard_where(lambda key: key[:2] == key_prefix)
+    dataset.row_json = None
+
+
+def row_json_cache(dataset):
+    """
+    Mengambil (atau membuat) cache JSON baris untuk versi dataset saat ini.
+    Dipanggil di bawah dataset.lock, sehingga versi tidak berubah selama cache dipakai;
+    cache versi lama tidak pernah dikembalikan.
+    """
+    entry = dataset.row_json
+    if entry is None or entry[0] != dataset.version:
+        entry = dataset.row_json = (dataset.version, RowJsonCache(dataset.table))
+    return entry[1]
+
+
+# Dataset bernama (dataset_id) yang dipakai bersama oleh semua thread request.
+# Setiap dataset menyimpan indeks terurutnya sendiri (diperbarui inkremental)
+datasets = DatasetRegistry(
+    max_bytes=int(os.environ.get('DATASET_MAX_MB', 1024)) * 1024 * 1024,
+    on_invalidate=discard_dataset_caches,
+)
+
+NO_DATA_MESSAGE = 'Tidak ada data. Muat data terlebih dahulu.'
+
+# Job benchmark latar belakang; jumlah job paralel dibatasi agar request sorting
+# interaktif tetap mendapat CPU
+benchmark_jobs = BenchmarkJobQueue(
+    max_running=int(os.environ.get('BENCHMARK_MAX_RUNNING', 1)),
+    max_queued=int(os.environ.get('BENCHMARK_MAX_QUEUED', 16)),
+)
+
+# Ukuran halaman maksimum untuk pagination JSON dan jumlah baris per blok streaming NDJSON
+MAX_PAGE_SIZE = 10000
+STREAM_BLOCK_ROWS = 1000
+
+# Jumlah proses untuk parsing CSV paralel saat snapshot belum ada
+CSV_LOAD_WORKERS = int(os.environ.get('CSV_LOAD_WORKERS', 1))
+
+# Batas opsi engine 'parallel' dari request: jumlah proses worker maksimum dan
+# ukuran data minimum sebelum proses worker dipakai
+PARALLEL_MAX_WORKERS = int(os.environ.get('PARALLEL_MAX_WORKERS', os.cpu_count() or 1))
+PARALLEL_MIN_THRESHOLD = int(os.environ.get('PARALLEL_MIN_THRESHOLD', 10000))
+
+# Endpoint yang mengubah state milik satu proses: dataset yang dimuat lewat API,
+# perubahan baris, dan job benchmark. Saat serve.py menjalankan beberapa worker
+# (app.config['PREFORK_WORKERS'] > 1) state ini tidak terbagi antar worker, jadi
+# endpoint ini ditolak; dataset dimuat sebelum fork lewat serve.py --csv/--generate
+PROCESS_LOCAL_ENDPOINTS = {
+    'load_csv', 'generate', 'delete_dataset',
+    'add_product', 'edit_product', 'remove_product',
+    'create_benchmark_job', 'list_benchmark_jobs', 'benchmark_job_status', 'cancel_benchmark_job',
+}
+PREFORK_DISABLED_MESSAGE = ('Endpoint tidak tersedia pada server multi-worker: dataset, perubahan '
+                            'baris, dan job benchmark tidak terbagi antar worker. Muat data dengan '
+                            'serve.py --csv/--generate atau jalankan dengan --workers 1.')
+
+# Metrik Prometheus di /metrics (per proses; di mode prefork setiap worker terpisah)
+metrics = MetricsRegistry()
+HTTP_REQUESTS = metrics.counter(
+    'quicksort_http_requests_total', 'Jumlah request HTTP', ('endpoint', 'method', 'status'))
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    'quicksort_http_request_seconds', 'Durasi request HTTP (detik)', ('endpoint',))
+SORT_PHASE_SECONDS = metrics.histogram(
+    'quicksort_sort_phase_seconds', 'Durasi setiap fase /api/sort (detik)', ('phase',))
+SORT_SECONDS = metrics.histogram(
+    'quicksort_sort_seconds', 'Durasi sort per algoritma dan kolom (detik)', ('algorithm', 'column'))
+ROWS_PROCESSED = metrics.counter(
+    'quicksort_rows_processed_total', 'Jumlah baris yang diurutkan', ('algorithm', 'column'))
+COMPARISONS = metrics.counter(
+    'quicksort_comparisons_total', 'Jumlah perbandingan (hanya request dengan count_comparisons)',
+    ('algorithm', 'column'))
+SORT_CACHE_LOOKUPS = metrics.counter(
+    'quicksort_sort_cache_lookups_total', 'Hasil pencarian indeks/cache permutasi', ('result',))
+metrics.gauge('quicksort_datasets', 'Jumlah dataset di registry', lambda: len(datasets))
+metrics.gauge('quicksort_dataset_bytes', 'Perkiraan memori semua dataset (byte)',
+              lambda: datasets.stats()['bytes'])
+metrics.gauge('quicksort_sort_cache_bytes', 'Memori cache permutasi (byte)',
+              lambda: sort_cache.current_bytes)
+metrics.gauge('quicksort_benchmark_jobs_running', 'Jumlah job benchmark yang sedang berjalan',
+              lambda: sum(1 for job in benchmark_jobs.jobs() if job.status == 'running'))
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    start = g.get('request_start')
+    if start is not None:
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=endpoint)
+    return response
+
+
+@app.before_request
+def reject_process_local_endpoints():
+    if app.config.get('PREFORK_WORKERS', 1) <= 1:
+        return None
+    async_benchmark = (request.endpoint == 'benchmark'
+                       and (request.get_json(silent=True) or {}).get('async'))
+    if request.endpoint in PROCESS_LOCAL_ENDPOINTS or async_benchmark:
+        return jsonify({'success': False, 'message': PREFORK_DISABLED_MESSAGE}), 409
+    return None
+
+
+def observe_sort_phases(timer):
+    """Mencatat durasi fase-fase /api/sort ke histogram metrik."""
+    for phase, seconds in timer.phases.items():
+        SORT_PHASE_SECONDS.observe(seconds, phase=phase)
+
+
+def request_dataset_id(data=None):
+    """Mengambil dataset_id dari body JSON atau query string (default 'default')."""
+    dataset_id = (data or {}).get('dataset_id') or request.args.get('dataset_id')
+    return dataset_id or DEFAULT_DATASET_ID
+
+
+def publish_response(dataset, **extra):
+    """
+    Response JSON setelah dataset baru dipublikasikan.
+    Tabel yang baru dipublikasikan dibaca di bawah read lock karena request lain
+    sudah bisa mengubahnya.
+    """
+    with dataset.lock.read():
+        table = dataset.table
+        serialize_start = time.perf_counter()
+        sample = row_json_cache(dataset).encode_array(range(min(10, len(table))))
+        return fast_jsonify({
+            'success': True,
+            'dataset_id': dataset.id,
+            'version': dataset.version,
+            'count': len(table),
+            **extra,
+            'columns': table.column_names(),
+        }, {'sample': sample}, serialize_start)
+
+
+def fast_jsonify(payload, raw=None, serialize_start=None, status=200, headers=None):
+    """
+    Pengganti jsonify untuk response besar: memakai encoder cepat (orjson jika ada)
+    dan menyisipkan field yang sudah berupa byte JSON (mis. baris dari cache).
     
-    pivot_raw = key(arr[high])
-    pivot = str(pivot_raw) if pivot_raw is not None else ''
-    i = low - 1
+    Args:
+        payload: Dictionary field response
+        raw: Dictionary {nama field: bytes JSON} yang disisipkan apa adanya
+        serialize_start: perf_counter() saat serialisasi dimulai; jika diisi,
+                         payload mendapat field serialize_ms
+        status: Kode status HTTP
+        headers: Header tambahan
+    """
+    if serialize_start is not None:
+        payload['serialize_ms'] = round((time.perf_counter() - serialize_start) * 1000, 3)
+        payload['encoder'] = ENCODER_NAME
+    body = encode_payload(payload, raw)
+    headers = dict(headers or {})
+    if serialize_start is not None:
+        headers['X-Serialize-Time-Ms'] = f"{(time.perf_counter() - serialize_start) * 1000:.3f}"
+    return app.response_class(body, status=status, mimetype='application/json', headers=headers)
+
+
+def permutation_slice(perm, start, end, row_count):
+    """
+    Salinan ringkas perm[start:end] sebagai array indeks baris (4 byte per baris
+    jika jumlah baris muat di uint32), dari SortedIndex, array, atau list.
+    """
+    typecode = 'I' if row_count <= 0xFFFFFFFF else 'q'
+    if isinstance(perm, SortedIndex):
+        return array(typecode, perm.iter_rows(start, end))
+    if isinstance(perm, array):
+        # memoryview: potongan permutasi cache tanpa salinan perantara
+        return array(typecode, memoryview(perm)[start:end])
+    return array(typecode, perm[start:end])
+
+
+def stream_rows(dataset, order, headers=None):
+    """
+    Mengirim baris products[order] sebagai NDJSON (satu objek JSON per baris).
     
-    for j in range(low, high):
-        current_raw = key(arr[j])
-        current_val = str(current_raw) if current_raw is not None else ''
-        
-        if reverse:
-            condition = current_val >= pivot
-        else:
-            condition = current_val <= pivot
-            
-        if condition:
-            i += 1
-            arr[i], arr[j] = arr[j], arr[i]
-    
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
-
-
-def quick_sort_recursive(arr, low=None, high=None, key=None, reverse=False):
-    """Quick Sort Rekursif"""
-    if low is None:
-        low = 0
-    if high is None:
-        high = len(arr) - 1
+    Hanya salinan permutasi (order) yang disimpan; baris di-encode per blok
+    STREAM_BLOCK_ROWS saat response dikirim (memakai cache JSON baris), sehingga
+    memori server tetap kecil dan byte pertama langsung terkirim. Read lock
+    dataset hanya dipegang selama satu blok di-encode, jadi klien yang lambat
+    tidak menahan penulis. Jika dataset berubah di tengah streaming, response
+    diakhiri dengan satu baris {"error": ...}.
+    """
+    version = dataset.version
     
-    if low < high:
-        pivot_index = partition(arr, low, high, key, reverse)
-        quick_sort_recursive(arr, low, pivot_index - 1, key, reverse)
-        quick_sort_recursive(arr, pivot_index + 1, high, key, reverse)
+    def generate():
+        for start in range(0, len(order), STREAM_BLOCK_ROWS):
+            # yield selalu di luar lock: klien yang berhenti membaca tidak memegang lock
+            with dataset.lock.read():
+                changed = dataset.version != version
+                if not changed:
+                    block = row_json_cache(dataset).encode_rows(order[start:start + STREAM_BLOCK_ROWS])
+            if changed:
+                yield dumps({'error': 'Dataset berubah selama streaming',
+                             'dataset_id': dataset.id, 'rows_sent': start}) + b'\n'
+                return
+            yield b'\n'.join(block) + b'\n'
     
-    return arr
+    return app.response_class(generate(), mimetype='application/x-ndjson', headers=headers)
 
 
-def quick_sort_iterative(arr, key=None, reverse=False):
-    """Quick Sort Iteratif dengan stack eksplisit"""
-    if len(arr) <= 1:
-        return arr
-    
-    stack = []
-    low = 0
-    high = len(arr) - 1
-    
-    stack.append((low, high))
-    
-    while stack:
-        low, high = stack.pop()
-        
-        if low < high:
-            pivot_index = partition(arr, low, high, key, reverse)
-            
-            if pivot_index - 1 > low:
-                stack.append((low, pivot_index - 1))
-            
-            if pivot_index + 1 < high:
-                stack.append((pivot_index + 1, high))
-    
-    return arr
-
-
-# ============ Data Functions ============
-
-def load_products_from_csv(filepath):
-    """Membaca data produk dari file CSV."""
-    products = []
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                product = {}
-                for key, value in row.items():
-                    clean_key = key.strip().lower()
-                    try:
-                        if '.' in str(value):
-                            product[clean_key] = float(value)
-                        else:
-                            product[clean_key] = int(value)
-                    except (ValueError, TypeError):
-                        product[clean_key] = value.strip() if value else ''
-                products.append(product)
-    except Exception as e:
-        print(f"Error: {e}")
-    return products
-
-
-def generate_random_products(n):
-    """Menghasilkan n produk random."""
-    product_names = ["Laptop", "Mouse", "Keyboard", "Monitor", "Headset",
-                     "Speaker", "Webcam", "SSD", "RAM", "Processor"]
-    brands = ["Tech", "Pro", "Max", "Ultra", "Elite", "Premium"]
-    
-    products = []
-    for i in range(1, n + 1):
-        products.append({
-            "id": i,
-            "name": f"{random.choice(product_names)} {random.choice(brands)} {random.randint(1, 999)}",
-            "price": random.randint(50000, 20000000),
-            "stock": random.randint(0, 100)
-        })
-    return products
-
-
-# ============ Global Data Storage ============
-current_products = []
+def parse_engine_options(algorithm, data):
+    """
+    Mengambil opsi engine dari body request (mis. jumlah worker untuk 'parallel').
+    Jumlah worker dibatasi 1..PARALLEL_MAX_WORKERS dan threshold minimal
+    PARALLEL_MIN_THRESHOLD, agar satu request tidak bisa mem-fork ribuan proses.
+    """
+    options = {}
+    if algorithm == 'parallel':
+        if data.get('workers') is not None:
+            options['workers'] = min(max(int(data['workers']), 1), PARALLEL_MAX_WORKERS)
+        if data.get('parallel_threshold') is not None:
+            options['threshold'] = max(int(data['parallel_threshold']), PARALLEL_MIN_THRESHOLD)
+    return options
 
 
 # ============ Routes ============
@@ -139,18 +273,19 @@ def index():
 
 @app.route('/api/load-csv', methods=['POST'])
 def load_csv():
-    global current_products
     try:
-        current_products = load_products_from_csv('data.csv')
+        data = request.get_json(silent=True) or {}
+        dataset_id = request_dataset_id(data)
         
-        if current_products:
-            columns = list(current_products[0].keys())
-            return jsonify({
-                'success': True,
-                'count': len(current_products),
-                'columns': columns,
-                'sample': current_products[:10]
-            })
+        start_time = time.perf_counter()
+        table, source = load_product_table('data.csv', errors='ignore',
+                                           workers=CSV_LOAD_WORKERS)
+        load_time = (time.perf_counter() - start_time) * 1000
+        
+        # File kosong tidak menimpa dataset yang sudah ada
+        if len(table):
+            dataset = datasets.publish(dataset_id, table, source)
+            return publish_response(dataset, source=source, load_time_ms=round(load_time, 3))
         return jsonify({'success': False, 'message': 'Gagal memuat data atau file kosong'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -158,111 +293,482 @@ def load_csv():
 
 @app.route('/api/generate', methods=['POST'])
 def generate():
-    global current_products
     try:
         data = request.get_json() or {}
         count = int(data.get('count', 1000))
+        seed = data.get('seed')
         
-        current_products = generate_random_products(count)
-        columns = list(current_products[0].keys())
+        dataset_id = request_dataset_id(data)
         
-        return jsonify({
-            'success': True,
-            'count': len(current_products),
-            'columns': columns,
-            'sample': current_products[:10]
-        })
+        # Generate langsung ke tabel kolumnar (tanpa dict per baris)
+        table = generate_product_table(
+            count,
+            seed=None if seed in (None, '') else int(seed),
+            price_distribution=data.get('price_distribution', 'uniform'),
+            stock_distribution=data.get('stock_distribution', 'uniform'),
+        )
+        dataset = datasets.publish(dataset_id, table, 'generate')
+        
+        return publish_response(dataset)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 
 @app.route('/api/sort', methods=['POST'])
 def sort_data():
-    global current_products
-    
     try:
-        if not current_products:
-            return jsonify({'success': False, 'message': 'Tidak ada data. Muat data terlebih dahulu.'})
-        
+        timer = PhaseTimer()
+        parse_start = time.perf_counter()
         data = request.get_json() or {}
+        dataset = datasets.get(request_dataset_id(data))
+        if dataset is None or not len(dataset):
+            return jsonify({'success': False, 'message': NO_DATA_MESSAGE})
+        
         algorithm = data.get('algorithm', 'recursive')
         sort_by = data.get('sort_by', 'price')
         reverse = data.get('reverse', False)
+        get_engine(algorithm)
+        engine_options = parse_engine_options(algorithm, data)
         
-        # Prepare key function - always convert to string for safe comparison
-        key_func = lambda x: str(x.get(sort_by, '')).lower()
+        # Preview: hanya k data teratas, sort penuh hanya jika diminta (full=true)
+        k = int(data.get('k', 50))
+        use_cache = bool(data.get('use_cache', True))
         
-        # Make a copy
-        products_copy = copy.deepcopy(current_products)
+        # Pagination (offset/limit) dan streaming NDJSON membutuhkan permutasi penuh
+        offset = max(int(data.get('offset', 0)), 0)
+        limit = data.get('limit')
+        stream = bool(data.get('stream', False))
+        paginate = limit is not None or offset > 0
+        full = bool(data.get('full', False)) or paginate or stream
+        if stream:
+            limit = None if limit is None else max(int(limit), 0)
+        else:
+            limit = min(max(int(limit if limit is not None else k), 0), MAX_PAGE_SIZE)
         
-        # Measure time
-        start_time = time.perf_counter()
+        # sort_by bisa satu kolom atau list spesifikasi multi-kolom
+        specs = parse_sort_spec(sort_by, reverse)
+        columns_label = ','.join(column for column, _ in specs)
         
-        if algorithm == 'recursive':
-            sorted_products = quick_sort_recursive(products_copy, key=key_func, reverse=reverse)
-        else:
-            sorted_products = quick_sort_iterative(products_copy, key=key_func, reverse=reverse)
+        # timings=true: rincian waktu per fase di response; count_comparisons=true:
+        # hitung perbandingan (memperlambat sort, hanya engine komparatif)
+        with_timings = bool(data.get('timings', False))
+        count_comparisons = bool(data.get('count_comparisons', False))
+        timer.add('parse', time.perf_counter() - parse_start)
+        
+        # Read lock selama dataset dibaca; streaming mengambil lock lagi per blok
+        with timer.phase('lock'):
+            dataset.lock.acquire_read()
+        try:
+            products = dataset.table
+            
+            # Kolom tak dikenal ditolak sebelum sort (juga membatasi label metrik column)
+            unknown = [column for column, _ in specs if column not in products.column_names()]
+            if unknown:
+                return jsonify({'success': False,
+                                'message': f"Kolom tidak ditemukan: {', '.join(map(str, unknown))}"}), 400
+            cache_key = (dataset.id, dataset.version, tuple(specs))
+            
+            # Indeks terurut (jika ada) selalu up to date, tidak perlu sort ulang
+            with timer.phase('lookup'):
+                perm = dataset.indexes.get(tuple(specs))
+                if perm is not None:
+                    cache_status = 'index'
+                else:
+                    perm = sort_cache.get(cache_key) if use_cache else None
+                    if perm is not None:
+                        cache_status = 'hit'
+                    else:
+                        cache_status = 'miss' if use_cache else 'bypass'
+            SORT_CACHE_LOOKUPS.inc(result=cache_status)
+            
+            rows_processed = 0
+            comparisons = None
+            if perm is None:
+                # Kunci diekstrak sekali per baris, lalu diurutkan engine (permutasi, tanpa salinan data)
+                with timer.phase('keys'):
+                    keys, key_reverse = build_sort_keys(products, sort_by, reverse)
+                if count_comparisons and (not full or algorithm in COMPARISON_ENGINES):
+                    keys, comparisons = counting_keys(keys)
+                metric_algorithm = algorithm if full else 'top_k'
+                
+                with timer.phase('sort'):
+                    if full:
+                        perm = get_engine(algorithm)(keys, reverse=key_reverse, **engine_options)
+                    else:
+                        page = argsort_top_k(keys, k, reverse=key_reverse)
+                
+                rows_processed = len(keys)
+                comparisons = comparisons[0] if comparisons is not None else None
+                SORT_SECONDS.observe(timer.phases['sort'], algorithm=metric_algorithm,
+                                     column=columns_label)
+                ROWS_PROCESSED.inc(rows_processed, algorithm=metric_algorithm, column=columns_label)
+                if comparisons is not None:
+                    COMPARISONS.inc(comparisons, algorithm=metric_algorithm, column=columns_label)
+            
+            exec_time_ms = sum(timer.phases.get(name, 0.0) for name in ('lookup', 'keys', 'sort')) * 1000
+            
+            # Simpan permutasi sort penuh untuk request berikutnya (di luar waktu sort)
+            if full and cache_status == 'miss':
+                with timer.phase('cache_store'):
+                    perm = sort_cache.put(cache_key, perm)
+            
+            if cache_status == 'index':
+                algorithm_label = 'Sorted Index'
+            elif cache_status == 'hit':
+                algorithm_label = 'Cache'
+            elif full:
+                algorithm_label = engine_label(algorithm)
+            else:
+                algorithm_label = 'Top-K (Quickselect)'
+            
+            if stream:
+                end = len(perm) if limit is None else min(offset + limit, len(perm))
+                with timer.phase('copy'):
+                    order = permutation_slice(perm, offset, end, len(products))
+                observe_sort_phases(timer)
+                return stream_rows(dataset, order, headers={
+                    'X-Dataset-Id': dataset.id,
+                    'X-Dataset-Version': str(dataset.version),
+                    'X-Sort-Algorithm': algorithm_label,
+                    'X-Sort-Spec': describe_sort_spec(specs),
+                    'X-Sort-Time-Ms': f"{exec_time_ms:.3f}",
+                    'X-Cache': cache_status,
+                    'X-Total-Count': str(len(products)),
+                    'Server-Timing': timer.server_timing(),
+                })
+            
+            serialize_start = time.perf_counter()
+            if perm is not None:
+                page = perm[offset:offset + limit] if paginate else perm[:k]
+            sample = row_json_cache(dataset).encode_rows(page)
+            timer.add('serialize', time.perf_counter() - serialize_start)
+            
+            result = {
+                'success': True,
+                'dataset_id': dataset.id,
+                'version': dataset.version,
+                'algorithm': algorithm_label,
+                'mode': 'full' if full else 'top_k',
+                'cache': cache_status,
+                'k': k,
+                'sort_by': sort_by,
+                'sort_spec': describe_sort_spec(specs),
+                'order': 'Descending' if reverse else 'Ascending',
+                'time_ms': round(exec_time_ms, 3),
+                'count': len(products),
+            }
+            if paginate:
+                next_offset = offset + len(sample)
+                result.update({
+                    'offset': offset,
+                    'limit': limit,
+                    'next_offset': next_offset if next_offset < len(products) else None,
+                })
+            if with_timings:
+                result.update({
+                    'timings': timer.as_ms(),
+                    'rows_processed': rows_processed,
+                    'comparisons': comparisons,
+                })
+            observe_sort_phases(timer)
+            return fast_jsonify(result, {'sample': b'[' + b','.join(sample) + b']'},
+                                serialize_start, headers={'Server-Timing': timer.server_timing()})
+        finally:
+            dataset.lock.release_read()
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/cache', methods=['GET'])
+def cache_stats():
+    dataset = datasets.get(request_dataset_id())
+    return jsonify({
+        'success': True,
+        'dataset_id': dataset.id if dataset else None,
+        'dataset_version': dataset.version if dataset else None,
+        **sort_cache.stats()
+    })
+
+
+@app.route('/api/datasets', methods=['GET'])
+def list_datasets():
+    return jsonify({'success': True, **datasets.stats()})
+
+
+@app.route('/api/datasets/<dataset_id>', methods=['DELETE'])
+def delete_dataset(dataset_id):
+    try:
+        if not datasets.remove(dataset_id):
+            return jsonify({'success': False, 'message': f"Dataset '{dataset_id}' tidak ditemukan"})
+        return jsonify({'success': True, 'dataset_id': dataset_id})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/indexes', methods=['GET'])
+def list_indexes():
+    dataset = datasets.get(request_dataset_id())
+    indexes = list(dataset.indexes.values()) if dataset else []
+    return jsonify({'success': True, 'indexes': [index.stats() for index in indexes]})
+
+
+@app.route('/api/indexes', methods=['POST'])
+def create_index():
+    try:
+        data = request.get_json() or {}
+        dataset = datasets.get(request_dataset_id(data))
+        if dataset is None:
+            return jsonify({'success': False, 'message': NO_DATA_MESSAGE})
+        specs = parse_sort_spec(data.get('sort_by', 'price'), data.get('reverse', False))
+        
+        # Build hanya membaca tabel; perubahan baris menunggu sampai indeks terdaftar
+        with dataset.lock.read():
+            start_time = time.perf_counter()
+            index = SortedIndex(dataset.table, specs)
+            build_time_ms = (time.perf_counter() - start_time) * 1000
+            dataset.add_index(tuple(specs), index)
+        
+        return jsonify({'success': True, 'time_ms': round(build_time_ms, 3), **index.stats()})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/query', methods=['POST'])
+def query():
+    try:
+        data = request.get_json() or {}
+        dataset = datasets.get(request_dataset_id(data))
+        if dataset is None or not len(dataset):
+            return jsonify({'success': False, 'message': NO_DATA_MESSAGE})
+        
+        column = data.get('column', 'price')
+        offset = max(int(data.get('offset', 0)), 0)
+        limit = min(max(int(data.get('limit', 50)), 0), MAX_PAGE_SIZE)
+        reverse = bool(data.get('reverse', False))
+        
+        with dataset.lock.read():
+            if column not in dataset.table.column_names():
+                raise ValueError(f"Kolom tidak ditemukan: {column}")
+            
+            # Indeks kolom dibuat sekali (waktu build ikut dihitung) lalu dipakai ulang
+            start_time = time.perf_counter()
+            # Satu indeks per kolom melayani kedua arah (desc dibaca dari belakang)
+            index_built = False
+            if find_column_index(dataset.indexes, column) is None:
+                _, index_built = dataset.get_or_build_index(
+                    column_index_key(column), lambda: SortedIndex(dataset.table, column))
+            
+            # Predikat: eq, prefix, atau rentang min/max (inklusif kecuali *_exclusive)
+            count, rows = query_products(
+                dataset.table, column,
+                eq=data.get('eq'),
+                low=data.get('min'),
+                high=data.get('max'),
+                prefix=data.get('prefix'),
+                include_low=not data.get('min_exclusive', False),
+                include_high=not data.get('max_exclusive', False),
+                offset=offset, limit=limit, reverse=reverse,
+                indexes=dataset.indexes,
+            )
+            exec_time_ms = (time.perf_counter() - start_time) * 1000
+            serialize_start = time.perf_counter()
+            rows = row_json_cache(dataset).encode_rows(rows)
         
-        end_time = time.perf_counter()
-        exec_time_ms = (end_time - start_time) * 1000
+        next_offset = offset + len(rows)
+        return fast_jsonify({
+            'success': True,
+            'dataset_id': dataset.id,
+            'column': column,
+            'index': 'built' if index_built else 'reused',
+            'count': count,
+            'offset': offset,
+            'limit': limit,
+            'next_offset': next_offset if next_offset < count else None,
+            'time_ms': round(exec_time_ms, 3),
+        }, {'rows': b'[' + b','.join(rows) + b']'}, serialize_start)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+def writable_dataset(data):
+    """Mengambil dataset untuk endpoint yang mengubah baris; ValueError jika belum ada."""
+    dataset = datasets.get(request_dataset_id(data))
+    if dataset is None:
+        raise ValueError(NO_DATA_MESSAGE)
+    return dataset
+
+
+def row_payload(data, key):
+    """Isi baris dari body request: data[key], atau seluruh body tanpa dataset_id."""
+    if key in data:
+        return data[key]
+    return {name: value for name, value in data.items() if name != 'dataset_id'}
+
+
+@app.route('/api/products', methods=['POST'])
+def add_product():
+    try:
+        data = request.get_json() or {}
+        product = row_payload(data, 'product')
+        dataset = writable_dataset(data)
+        
+        # Write lock: tidak ada request lain yang membaca dataset selama baris berubah
+        with dataset.lock.write():
+            start_time = time.perf_counter()
+            row = insert_product(dataset.table, product, dataset.indexes.values())
+            exec_time_ms = (time.perf_counter() - start_time) * 1000
+            datasets.bump_version(dataset)
+            result = {
+                'success': True,
+                'dataset_id': dataset.id,
+                'version': dataset.version,
+                'row': row,
+                'product': dataset.table[row].to_dict(),
+                'count': len(dataset.table),
+                'time_ms': round(exec_time_ms, 3),
+            }
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/products/<int:row>', methods=['PATCH', 'PUT'])
+def edit_product(row):
+    try:
+        data = request.get_json() or {}
+        changes = row_payload(data, 'changes')
+        dataset = writable_dataset(data)
         
+        with dataset.lock.write():
+            start_time = time.perf_counter()
+            update_product(dataset.table, row, changes, dataset.indexes.values())
+            exec_time_ms = (time.perf_counter() - start_time) * 1000
+            datasets.bump_version(dataset)
+            result = {
+                'success': True,
+                'dataset_id': dataset.id,
+                'version': dataset.version,
+                'row': row,
+                'product': dataset.table[row].to_dict(),
+                'time_ms': round(exec_time_ms, 3),
+            }
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/products/<int:row>', methods=['DELETE'])
+def remove_product(row):
+    try:
+        dataset = writable_dataset(request.get_json(silent=True))
+        
+        with dataset.lock.write():
+            start_time = time.perf_counter()
+            moved = delete_product(dataset.table, row, dataset.indexes.values())
+            exec_time_ms = (time.perf_counter() - start_time) * 1000
+            datasets.bump_version(dataset)
+            version, count = dataset.version, len(dataset.table)
+        
+        # Baris terakhir menempati posisi yang dihapus (moved_from = posisi lamanya)
         return jsonify({
             'success': True,
-            'algorithm': 'Rekursif' if algorithm == 'recursive' else 'Iteratif',
-            'sort_by': sort_by,
-            'order': 'Descending' if reverse else 'Ascending',
+            'dataset_id': dataset.id,
+            'version': version,
+            'row': row,
+            'moved_from': moved,
+            'count': count,
             'time_ms': round(exec_time_ms, 3),
-            'count': len(sorted_products),
-            'sample': sorted_products[:50]
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 
+def benchmark_params(data):
+    """Mengambil parameter benchmark dari body request."""
+    algorithms = data.get('algorithms', ['recursive', 'iterative'])
+    return {
+        'sizes': data.get('sizes', [100, 500, 1000, 2500, 5000]),
+        'iterations': int(data.get('iterations', 3)),
+        'algorithms': algorithms,
+        'sort_by': data.get('sort_by', 'price'),
+        'engine_options': {a: parse_engine_options(a, data) for a in algorithms},
+    }
+
+
 @app.route('/api/benchmark', methods=['POST'])
 def benchmark():
     try:
         data = request.get_json() or {}
-        sizes = data.get('sizes', [100, 500, 1000, 2500, 5000])
-        iterations = data.get('iterations', 3)
+        params = benchmark_params(data)
         
-        results = []
+        # async=true: daftarkan sebagai job latar belakang (lihat /api/benchmark/jobs)
+        if data.get('async'):
+            return submit_benchmark_job(params)
         
-        for size in sizes:
-            rec_times = []
-            iter_times = []
-            
-            for _ in range(iterations):
-                products = generate_random_products(size)
-                key_func = lambda x: str(x.get('price', 0))
-                
-                # Recursive
-                products_rec = copy.deepcopy(products)
-                start = time.perf_counter()
-                quick_sort_recursive(products_rec, key=key_func)
-                rec_times.append((time.perf_counter() - start) * 1000)
-                
-                # Iterative
-                products_iter = copy.deepcopy(products)
-                start = time.perf_counter()
-                quick_sort_iterative(products_iter, key=key_func)
-                iter_times.append((time.perf_counter() - start) * 1000)
-            
-            avg_rec = sum(rec_times) / len(rec_times)
-            avg_iter = sum(iter_times) / len(iter_times)
-            
-            results.append({
-                'size': size,
-                'recursive_ms': round(avg_rec, 3),
-                'iterative_ms': round(avg_iter, 3),
-                'faster': 'Iteratif' if avg_iter < avg_rec else 'Rekursif'
-            })
+        for algorithm in params['algorithms']:
+            get_engine(algorithm)
+        
+        results = [
+            benchmark_row(size, averages)
+            for size, averages in iter_benchmark_sizes(
+                params['sizes'], params['sort_by'], params['iterations'],
+                params['algorithms'], params['engine_options'])
+        ]
         
         return jsonify({'success': True, 'results': results})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 
+def submit_benchmark_job(params):
+    """Mendaftarkan job benchmark dan langsung mengembalikan id-nya (202 Accepted)."""
+    try:
+        job = benchmark_jobs.submit(**params)
+    except JobQueueFull as e:
+        return jsonify({'success': False, 'message': str(e)}), 429
+    return jsonify({'success': True, **job.to_dict()}), 202
+
+
+@app.route('/api/benchmark/jobs', methods=['POST'])
+def create_benchmark_job():
+    try:
+        return submit_benchmark_job(benchmark_params(request.get_json() or {}))
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/benchmark/jobs', methods=['GET'])
+def list_benchmark_jobs():
+    jobs = [job.to_dict(since=len(job.results)) for job in benchmark_jobs.jobs()]
+    return jsonify({'success': True, 'jobs': jobs})
+
+
+@app.route('/api/benchmark/jobs/<job_id>', methods=['GET'])
+def benchmark_job_status(job_id):
+    job = benchmark_jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': f"Job '{job_id}' tidak ditemukan"}), 404
+    
+    # since=n: hanya baris hasil baru sejak polling sebelumnya
+    since = max(request.args.get('since', 0, type=int), 0)
+    return jsonify({'success': True, **job.to_dict(since=since)})
+
+
+@app.route('/api/benchmark/jobs/<job_id>', methods=['DELETE'])
+def cancel_benchmark_job(job_id):
+    job = benchmark_jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': f"Job '{job_id}' tidak ditemukan"}), 404
+    return jsonify({'success': True, **job.to_dict()})
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
 # Error handlers to always return JSON
 @app.errorhandler(404)
 def not_found(e):
@@ -276,4 +782,5 @@ def server_error(e):
 if __name__ == '__main__':
     print("Starting Quick Sort Comparison Web App...")
     print("Open http://localhost:5000 in your browser")
-    app.run(debug=True, port=5000)
+    # threaded: request paralel aman karena dataset diakses lewat registry ber-lock
+    app.run(debug=True, port=5000, threaded=True)
@@ -4,10 +4,11 @@ Modul untuk mengukur dan membandingkan performa Quick Sort Rekursif vs Iteratif.
 """
 
 import time
-import copy
 from product_data import generate_random_products, load_products_from_csv
-from quicksort_recursive import quick_sort_recursive, sort_products_recursive
-from quicksort_iterative import quick_sort_iterative, sort_products_iterative
+from quicksort_recursive import sort_products_recursive
+from quicksort_iterative import sort_products_iterative
+from sort_keys import make_key_func
+from sort_engines import quick_sort, get_engine, engine_label
 
 
 def measure_time(func, *args, **kwargs):
@@ -41,14 +42,13 @@ def run_single_comparison(products, sort_by='price', reverse=False):
     Returns:
         Dictionary dengan hasil perbandingan
     """
-    # Buat salinan untuk masing-masing algoritma
-    products_recursive = copy.deepcopy(products)
-    products_iterative = copy.deepcopy(products)
+    # sort_products_* tidak mengubah data asli (mengurutkan permutasi indeks),
+    # jadi kedua algoritma bisa memakai list yang sama tanpa salinan
     
     # Ukur waktu Quick Sort Rekursif
     _, time_recursive = measure_time(
         sort_products_recursive, 
-        products_recursive, 
+        products, 
         sort_by=sort_by, 
         reverse=reverse
     )
@@ -56,7 +56,7 @@ def run_single_comparison(products, sort_by='price', reverse=False):
     # Ukur waktu Quick Sort Iteratif
     _, time_iterative = measure_time(
         sort_products_iterative, 
-        products_iterative, 
+        products, 
         sort_by=sort_by, 
         reverse=reverse
     )
@@ -71,7 +71,72 @@ def run_single_comparison(products, sort_by='price', reverse=False):
     }
 
 
-def run_benchmark(data_sizes=None, sort_by='price', iterations=3):
+class BenchmarkCancelled(Exception):
+    """Dilempar saat benchmark dihentikan lewat should_stop()."""
+
+
+def iter_benchmark_sizes(data_sizes, sort_by='price', iterations=3, algorithms=None,
+                         engine_options=None, should_stop=None):
+    """
+    Mengukur setiap ukuran data secara bertahap dan menghasilkan rata-ratanya
+    segera setelah satu ukuran selesai (untuk laporan progres).
+    
+    Args:
+        data_sizes: List ukuran data untuk diuji
+        sort_by: Atribut untuk pengurutan
+        iterations: Jumlah iterasi untuk rata-rata
+        algorithms: List nama algoritma (lihat sort_engines.ENGINES),
+                    default ['recursive', 'iterative']
+        engine_options: Dictionary {algoritma: opsi engine}
+        should_stop: Fungsi tanpa argumen; jika mengembalikan True benchmark
+                     berhenti sebelum iterasi berikutnya
+    
+    Yields:
+        Tuple (ukuran data, dictionary {algoritma: rata-rata waktu ms})
+    
+    Raises:
+        BenchmarkCancelled: Jika should_stop() mengembalikan True
+    """
+    if algorithms is None:
+        algorithms = ['recursive', 'iterative']
+    
+    # Validasi nama algoritma sebelum mulai mengukur
+    for algorithm in algorithms:
+        get_engine(algorithm)
+    
+    # Key function
+    key_func = make_key_func(sort_by)
+    
+    for size in data_sizes:
+        times = {algorithm: [] for algorithm in algorithms}
+        
+        for i in range(iterations):
+            if should_stop is not None and should_stop():
+                raise BenchmarkCancelled(f"Benchmark dihentikan pada ukuran {size:,}")
+            
+            # Generate data baru setiap iterasi
+            products = generate_random_products(size)
+            
+            for algorithm in algorithms:
+                # Reset input dari data asli: salinan dangkal (hanya referensi baris)
+                # dibuat di luar bagian yang diukur, dict produk tidak diduplikasi
+                products_copy = list(products)
+                
+                _, exec_time = measure_time(
+                    quick_sort,
+                    products_copy,
+                    key=key_func,
+                    algorithm=algorithm,
+                    engine_options=(engine_options or {}).get(algorithm)
+                )
+                times[algorithm].append(exec_time)
+        
+        # Hitung rata-rata
+        yield size, {a: sum(t) / len(t) for a, t in times.items()}
+
+
+def run_benchmark(data_sizes=None, sort_by='price', iterations=3, algorithms=None,
+                  engine_options=None):
     """
     Menjalankan benchmark lengkap untuk berbagai ukuran data.
     
@@ -79,77 +144,66 @@ def run_benchmark(data_sizes=None, sort_by='price', iterations=3):
         data_sizes: List ukuran data untuk diuji
         sort_by: Atribut untuk pengurutan
         iterations: Jumlah iterasi untuk rata-rata
+        algorithms: List nama algoritma (lihat sort_engines.ENGINES),
+                    default ['recursive', 'iterative']
+        engine_options: Dictionary {algoritma: opsi engine},
+                        misalnya {'parallel': {'workers': 8}}
     
     Returns:
         List hasil benchmark
     """
     if data_sizes is None:
         data_sizes = [100, 500, 1000, 2500, 5000, 7500, 10000]
+    if algorithms is None:
+        algorithms = ['recursive', 'iterative']
+    
+    # Validasi nama algoritma sebelum mulai mengukur
+    for algorithm in algorithms:
+        get_engine(algorithm)
     
+    labels = [engine_label(a) for a in algorithms]
     results = []
     
     print("\n" + "=" * 70)
-    print("BENCHMARK QUICK SORT: REKURSIF vs ITERATIF")
+    print(f"BENCHMARK QUICK SORT: {' vs '.join(l.upper() for l in labels)}")
     print("=" * 70)
     print(f"Atribut pengurutan: {sort_by}")
     print(f"Jumlah iterasi per ukuran data: {iterations}")
     print("=" * 70 + "\n")
     
+    measurements = iter_benchmark_sizes(data_sizes, sort_by, iterations, algorithms,
+                                        engine_options)
     for size in data_sizes:
         print(f"Testing dengan {size:,} data...", end=" ", flush=True)
+        _, averages = next(measurements)
         
-        recursive_times = []
-        iterative_times = []
-        
-        for i in range(iterations):
-            # Generate data baru setiap iterasi
-            products = generate_random_products(size)
-            
-            # Buat salinan untuk masing-masing algoritma
-            products_recursive = copy.deepcopy(products)
-            products_iterative = copy.deepcopy(products)
-            
-            # Key function
-            if sort_by == 'name':
-                key_func = lambda x: x.get(sort_by, '').lower()
-            else:
-                key_func = lambda x: x.get(sort_by, 0)
-            
-            # Ukur waktu rekursif
-            _, time_rec = measure_time(
-                quick_sort_recursive, 
-                products_recursive,
-                key=key_func
-            )
-            recursive_times.append(time_rec)
-            
-            # Ukur waktu iteratif
-            _, time_iter = measure_time(
-                quick_sort_iterative, 
-                products_iterative,
-                key=key_func
-            )
-            iterative_times.append(time_iter)
-        
-        # Hitung rata-rata
-        avg_recursive = sum(recursive_times) / len(recursive_times)
-        avg_iterative = sum(iterative_times) / len(iterative_times)
+        fastest = min(algorithms, key=averages.get)
+        slowest = max(algorithms, key=averages.get)
         
         result = {
             'data_size': size,
-            'avg_recursive_ms': avg_recursive,
-            'avg_iterative_ms': avg_iterative,
-            'difference_ms': avg_recursive - avg_iterative,
-            'faster': 'Iteratif' if avg_iterative < avg_recursive else 'Rekursif',
-            'speedup': max(avg_recursive, avg_iterative) / max(min(avg_recursive, avg_iterative), 0.001)
+            'algorithms': list(algorithms),
+            'difference_ms': averages[algorithms[0]] - averages[algorithms[-1]],
+            'faster': engine_label(fastest),
+            'speedup': averages[slowest] / max(averages[fastest], 0.001)
         }
+        for algorithm in algorithms:
+            result[f'avg_{algorithm}_ms'] = averages[algorithm]
         results.append(result)
         
-        print(f"Rekursif: {avg_recursive:.3f}ms | Iteratif: {avg_iterative:.3f}ms | Lebih cepat: {result['faster']}")
+        timings = " | ".join(
+            f"{engine_label(a)}: {averages[a]:.3f}ms" for a in algorithms
+        )
+        print(f"{timings} | Lebih cepat: {result['faster']}")
     
     return results
 
 
+def _result_algorithms(results):
+    """Mengambil daftar algoritma dari hasil benchmark."""
+    return results[0].get('algorithms', ['recursive', 'iterative'])
+
+
 def print_benchmark_table(results):
     """
     Menampilkan hasil benchmark dalam format tabel.
@@ -157,16 +211,22 @@ def print_benchmark_table(results):
     Args:
         results: List hasil benchmark
     """
-    print("\n" + "=" * 85)
+    algorithms = _result_algorithms(results)
+    headers = [f"{engine_label(a)} (ms)" for a in algorithms]
+    width = 12 + 17 * len(algorithms) + 16 + 15
+    
+    print("\n" + "=" * width)
     print("TABEL HASIL BENCHMARK")
-    print("=" * 85)
-    print(f"{'Ukuran Data':>12} | {'Rekursif (ms)':>14} | {'Iteratif (ms)':>14} | {'Selisih (ms)':>13} | {'Lebih Cepat':<12}")
-    print("-" * 85)
+    print("=" * width)
+    print(f"{'Ukuran Data':>12} | " + " | ".join(f"{h:>14}" for h in headers)
+          + f" | {'Selisih (ms)':>13} | {'Lebih Cepat':<12}")
+    print("-" * width)
     
     for r in results:
-        print(f"{r['data_size']:>12,} | {r['avg_recursive_ms']:>14.3f} | {r['avg_iterative_ms']:>14.3f} | {r['difference_ms']:>+13.3f} | {r['faster']:<12}")
+        times = " | ".join(f"{r[f'avg_{a}_ms']:>14.3f}" for a in algorithms)
+        print(f"{r['data_size']:>12,} | {times} | {r['difference_ms']:>+13.3f} | {r['faster']:<12}")
     
-    print("=" * 85)
+    print("=" * width)
 
 
 def print_complexity_analysis():
@@ -208,44 +268,62 @@ def print_complexity_analysis():
       - Random pivot selection
       - Median of three
       - Introsort (hybrid dengan Heapsort)
+    
+    • Engine 'introsort' (introsort.py) menerapkan ketiganya: pivot ninther /
+      median-of-three, insertion sort untuk range kecil, dan fallback Heapsort
+      sehingga worst case tetap O(n log n) dengan stack O(log n)
+    
+    • Engine 'radix' (radix_sort.py) tidak membandingkan elemen: counting sort
+      untuk rentang nilai kecil (stok) dan LSD radix untuk rentang besar (harga),
+      O(n * jumlah pass) dan stabil. Hanya untuk kolom integer; kolom lain
+      memakai fallback komparatif. Engine 'auto' memilih radix untuk kolom
+      integer dan Introsort untuk kolom lain.
     """)
     print("=" * 70)
 
 
 def analyze_growth_rate(results):
     """
-    Menganalisis apakah pertumbuhan waktu sesuai dengan O(n log n).
+    Menganalisis apakah pertumbuhan waktu sesuai dengan O(n log n)
+    (engine komparatif) atau O(n) (engine radix/counting).
     
     Args:
         results: List hasil benchmark
     """
     import math
     
-    print("\n" + "=" * 70)
-    print("ANALISIS PERTUMBUHAN WAKTU (Verifikasi O(n log n))")
-    print("=" * 70)
+    algorithms = _result_algorithms(results)
+    headers = [f"Rasio {engine_label(a)}" for a in algorithms]
+    width = 12 + 17 + 12 + 19 * len(algorithms)
     
-    print(f"\n{'Ukuran (n)':>12} | {'n log n':>14} | {'Rasio Rekursif':>16} | {'Rasio Iteratif':>16}")
-    print("-" * 70)
+    print("\n" + "=" * width)
+    print("ANALISIS PERTUMBUHAN WAKTU (Verifikasi O(n log n) / O(n))")
+    print("=" * width)
+    
+    print(f"\n{'Ukuran (n)':>12} | {'Rasio n':>9} | {'Rasio nlogn':>14} | "
+          + " | ".join(f"{h:>16}" for h in headers))
+    print("-" * width)
     
     base_n = results[0]['data_size']
     base_nlogn = base_n * math.log2(base_n)
-    base_rec = results[0]['avg_recursive_ms']
-    base_iter = results[0]['avg_iterative_ms']
+    base_times = {a: results[0][f'avg_{a}_ms'] for a in algorithms}
     
     for r in results:
         n = r['data_size']
         nlogn = n * math.log2(n)
         
-        expected_ratio = nlogn / base_nlogn
-        actual_rec_ratio = r['avg_recursive_ms'] / base_rec if base_rec > 0 else 0
-        actual_iter_ratio = r['avg_iterative_ms'] / base_iter if base_iter > 0 else 0
+        ratios = []
+        for a in algorithms:
+            base = base_times[a]
+            ratios.append(r[f'avg_{a}_ms'] / base if base > 0 else 0)
         
-        print(f"{n:>12,} | {nlogn:>14,.0f} | {actual_rec_ratio:>16.2f}x | {actual_iter_ratio:>16.2f}x")
+        print(f"{n:>12,} | {n / base_n:>8.2f}x | {nlogn / base_nlogn:>13.2f}x | "
+              + " | ".join(f"{x:>15.2f}x" for x in ratios))
     
-    print("-" * 70)
+    print("-" * width)
     print("Jika rasio mendekati pertumbuhan n log n, maka kompleksitas terbukti O(n log n)")
-    print("=" * 70)
+    print("Engine radix/counting seharusnya tumbuh mendekati rasio n (linear)")
+    print("=" * width)
 
 
 if __name__ == "__main__":
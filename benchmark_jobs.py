@@ -0,0 +1,228 @@
+"""
+Benchmark Jobs
+Antrian job benchmark yang dijalankan di thread latar belakang, sehingga request
+HTTP hanya mendaftarkan job lalu langsung mengembalikan id-nya.
+
+Hasil per ukuran data tersedia segera setelah ukuran itu selesai diukur, job
+dapat dibatalkan, dan jumlah job yang berjalan bersamaan dibatasi agar benchmark
+tidak menghabiskan CPU yang dibutuhkan request sorting interaktif.
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+from benchmark import iter_benchmark_sizes, BenchmarkCancelled
+from sort_engines import get_engine, engine_label
+
+# Jumlah job yang boleh berjalan bersamaan
+DEFAULT_MAX_RUNNING = 1
+
+# Jumlah job yang boleh menunggu di antrian (di luar yang sedang berjalan)
+DEFAULT_MAX_QUEUED = 16
+
+# Jumlah job selesai yang tetap disimpan untuk dibaca hasilnya
+DEFAULT_MAX_FINISHED = 50
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class JobQueueFull(RuntimeError):
+    """Dilempar saat antrian job benchmark sudah penuh."""
+
+
+def benchmark_row(size, averages):
+    """
+    Menyusun satu baris hasil benchmark untuk API/web.
+
+    Args:
+        size: Ukuran data
+        averages: Dictionary {algoritma: rata-rata waktu ms}
+
+    Returns:
+        Dictionary {'size', 'faster', '<algoritma>_ms', ...}
+    """
+    row = {'size': size, 'faster': engine_label(min(averages, key=averages.get))}
+    for algorithm, average in averages.items():
+        row[f'{algorithm}_ms'] = round(average, 3)
+    return row
+
+
+class BenchmarkJob:
+    """
+    Satu job benchmark beserta status dan hasil parsialnya.
+
+    Atribut results hanya ditambah (append) oleh thread worker, sehingga
+    pembaca bisa mengambil results[since:] tanpa lock.
+    """
+
+    def __init__(self, sizes, iterations, algorithms, sort_by='price', engine_options=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.sizes = list(sizes)
+        self.iterations = iterations
+        self.algorithms = list(algorithms)
+        self.sort_by = sort_by
+        self.engine_options = engine_options or {}
+        self.status = QUEUED
+        self.results = []
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self._cancel = Event()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def cancel(self):
+        """Meminta job berhenti; job yang masih antri langsung dibatalkan."""
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self._finish(CANCELLED)
+
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+
+    def run(self):
+        """Menjalankan benchmark (dipanggil oleh thread worker)."""
+        if self._cancel.is_set():
+            self._finish(CANCELLED)
+            return
+        self.status = RUNNING
+        self.started_at = time.time()
+        try:
+            for size, averages in iter_benchmark_sizes(
+                    self.sizes, self.sort_by, self.iterations, self.algorithms,
+                    self.engine_options, should_stop=self._cancel.is_set):
+                self.results.append(benchmark_row(size, averages))
+        except BenchmarkCancelled:
+            self._finish(CANCELLED)
+        except Exception as e:
+            self._finish(FAILED, str(e))
+        else:
+            self._finish(DONE)
+
+    def to_dict(self, since=0):
+        """
+        Ringkasan job untuk response JSON.
+
+        Args:
+            since: Hanya sertakan baris hasil mulai indeks ini (untuk polling inkremental)
+        """
+        completed = len(self.results)
+        results = self.results[since:completed]
+        elapsed_end = self.finished_at or time.time()
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'algorithms': self.algorithms,
+            'sort_by': self.sort_by,
+            'iterations': self.iterations,
+            'sizes': self.sizes,
+            'completed': completed,
+            'total': len(self.sizes),
+            'results': results,
+            'error': self.error,
+            'elapsed_ms': round((elapsed_end - self.started_at) * 1000, 3) if self.started_at else 0,
+        }
+
+
+class BenchmarkJobQueue:
+    """
+    Antrian job benchmark di atas ThreadPoolExecutor.
+
+    Args:
+        max_running: Jumlah job yang berjalan bersamaan
+        max_queued: Jumlah job yang boleh menunggu
+        max_finished: Jumlah job selesai yang disimpan; yang tertua dibuang
+    """
+
+    def __init__(self, max_running=DEFAULT_MAX_RUNNING, max_queued=DEFAULT_MAX_QUEUED,
+                 max_finished=DEFAULT_MAX_FINISHED):
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_running,
+                                            thread_name_prefix='benchmark-job')
+        self._jobs = OrderedDict()
+        self._lock = Lock()
+
+    def submit(self, sizes, iterations=3, algorithms=None, sort_by='price', engine_options=None):
+        """
+        Mendaftarkan job benchmark baru.
+
+        Args:
+            sizes: List ukuran data
+            iterations: Jumlah iterasi per ukuran
+            algorithms: List nama algoritma (default ['recursive', 'iterative'])
+            sort_by: Atribut untuk pengurutan
+            engine_options: Dictionary {algoritma: opsi engine}
+
+        Returns:
+            BenchmarkJob
+
+        Raises:
+            ValueError: Jika algoritma tidak dikenal
+            JobQueueFull: Jika terlalu banyak job yang belum selesai
+        """
+        algorithms = list(algorithms or ['recursive', 'iterative'])
+        for algorithm in algorithms:
+            get_engine(algorithm)
+        job = BenchmarkJob([int(size) for size in sizes], int(iterations), algorithms,
+                           sort_by, engine_options)
+
+        with self._lock:
+            pending = sum(1 for other in self._jobs.values() if not other.finished)
+            if pending >= self.max_running + self.max_queued:
+                raise JobQueueFull(f"Antrian benchmark penuh ({pending} job belum selesai)")
+            self._jobs[job.id] = job
+            self._prune()
+            job.future = self._executor.submit(job.run)
+        return job
+
+    def _prune(self):
+        """Membuang job selesai yang paling lama jika melebihi max_finished."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        """Mengambil job berdasarkan id, None jika tidak ada."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Membatalkan job. Job yang sedang berjalan berhenti sebelum iterasi berikutnya.
+
+        Returns:
+            BenchmarkJob, atau None jika job tidak ada
+        """
+        job = self.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel()
+        return job
+
+    def jobs(self):
+        """Mengembalikan list semua job (urutan pendaftaran)."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, wait=False):
+        """Membatalkan semua job dan menghentikan thread worker."""
+        for job in self.jobs():
+            if not job.finished:
+                job.cancel()
+        self._executor.shutdown(wait=wait)
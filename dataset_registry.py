@@ -0,0 +1,335 @@
+"""
+Dataset Registry
+Registry dataset bernama yang aman dipakai banyak thread sekaligus.
+
+Setiap dataset dipublikasikan sebagai objek baru dengan versi unik, sehingga
+request yang sedang membaca versi lama tidak terganggu saat dataset yang sama
+dimuat ulang. Perubahan per baris memakai write lock dataset, pembacaan memakai
+read lock, dan dataset yang paling lama tidak dipakai dikeluarkan jika total
+memori melebihi batas.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import count
+from threading import Condition, Lock
+
+from product_table import ProductTable
+
+# Nama dataset jika request tidak menyebutkan dataset_id
+DEFAULT_DATASET_ID = 'default'
+
+# Batas memori default semua dataset (byte)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+DATASET_ID_PATTERN = re.compile(r'^[A-Za-z0-9_.-]{1,64}$')
+
+
+class ReadWriteLock:
+    """
+    Lock banyak-pembaca / satu-penulis.
+
+    Penulis diprioritaskan: begitu ada penulis yang menunggu, pembaca baru ikut
+    menunggu agar penulis tidak kelaparan. Lock tidak reentrant.
+    """
+
+    def __init__(self):
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """Context manager untuk read lock."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """Context manager untuk write lock."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def validate_dataset_id(dataset_id):
+    """
+    Memastikan dataset_id berupa nama pendek yang aman (huruf, angka, _ . -).
+
+    Returns:
+        dataset_id sebagai string
+
+    Raises:
+        ValueError: Jika format dataset_id tidak valid
+    """
+    dataset_id = str(dataset_id)
+    if not DATASET_ID_PATTERN.match(dataset_id):
+        raise ValueError(
+            f"dataset_id '{dataset_id}' tidak valid (1-64 karakter huruf, angka, '_', '.', '-')"
+        )
+    return dataset_id
+
+
+class Dataset:
+    """
+    Satu dataset yang dipublikasikan di registry.
+
+    Atribut table hanya boleh dibaca di bawah lock.read() dan diubah di bawah
+    lock.write(); version berubah setiap kali isi tabel berubah.
+
+    Dictionary indexes tidak pernah diubah di tempat: indeks baru didaftarkan
+    lewat add_index()/get_or_build_index() yang mengganti dictionary-nya, sehingga
+    iterasi indexes.values() tanpa lock tetap aman.
+    """
+
+    def __init__(self, dataset_id, table, version, source=None):
+        self.id = dataset_id
+        self.table = table
+        self.version = version
+        self.source = source
+        self.indexes = {}
+        self.lock = ReadWriteLock()
+        self._index_lock = Lock()
+        # Cache JSON baris milik aplikasi web: tuple (version, RowJsonCache) atau None
+        self.row_json = None
+        self.created_at = time.time()
+        self.last_access = self.created_at
+        self._nbytes = None
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def nbytes(self):
+        """
+        Perkiraan memori tabel, indeks terurut (dihitung ulang setelah berubah),
+        dan cache JSON baris (dibaca langsung karena terus bertambah saat dipakai).
+        """
+        if self._nbytes is None:
+            self._nbytes = self.table.memory_usage() + sum(
+                index.memory_usage() for index in self.indexes.values())
+        row_json = self.row_json
+        return self._nbytes + (row_json[1].memory_usage() if row_json is not None else 0)
+
+    def add_index(self, key, index):
+        """
+        Mendaftarkan (atau mengganti) indeks terurut. Dipanggil di bawah lock.read()
+        atau lock.write() agar tabel tidak berubah sejak indeks dibuat.
+
+        Args:
+            key: Tuple spesifikasi sort
+            index: SortedIndex di atas tabel dataset ini
+        """
+        with self._index_lock:
+            self.indexes = {**self.indexes, key: index}
+        self.invalidate_size()
+
+    def get_or_build_index(self, key, build):
+        """
+        Mengambil indeks untuk key, atau membuat dan mendaftarkannya jika belum ada.
+        Pembuatan indeks per dataset berjalan satu per satu, sehingga dua request
+        yang membutuhkan indeks yang sama tidak membuatnya dua kali. Dipanggil di
+        bawah lock.read() atau lock.write().
+
+        Args:
+            key: Tuple spesifikasi sort
+            build: Fungsi tanpa argumen yang membuat SortedIndex
+
+        Returns:
+            Tuple (SortedIndex, True jika indeks baru dibuat)
+        """
+        index = self.indexes.get(key)
+        if index is not None:
+            return index, False
+        with self._index_lock:
+            index = self.indexes.get(key)
+            if index is not None:
+                return index, False
+            index = build()
+            self.indexes = {**self.indexes, key: index}
+        self.invalidate_size()
+        return index, True
+
+    def invalidate_size(self):
+        """Menandai perkiraan memori perlu dihitung ulang (mis. setelah indeks dibuat)."""
+        self._nbytes = None
+
+    def stats(self):
+        """Mengembalikan ringkasan dataset."""
+        return {
+            'dataset_id': self.id,
+            'version': self.version,
+            'rows': len(self.table),
+            'bytes': self.nbytes,
+            'source': self.source,
+            'indexes': len(self.indexes),
+            'created_at': self.created_at,
+            'last_access': self.last_access,
+        }
+
+
+class DatasetRegistry:
+    """
+    Registry dataset bernama dengan urutan LRU dan batas memori total.
+
+    Args:
+        max_bytes: Batas memori semua dataset; dataset yang paling lama tidak
+                   diakses dikeluarkan saat dataset baru dipublikasikan
+        on_invalidate: Callback on_invalidate(dataset) saat versi dataset tidak
+                       berlaku lagi: diganti, diubah, dihapus, atau dikeluarkan
+                       (mis. untuk membersihkan cache permutasinya)
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, on_invalidate=None):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._on_invalidate = on_invalidate
+        self._datasets = OrderedDict()
+        self._versions = count(1)
+        self._lock = Lock()
+
+    def publish(self, dataset_id, table, source=None):
+        """
+        Mempublikasikan tabel sebagai versi baru sebuah dataset.
+        Objek dataset lama tidak diubah, sehingga pembaca yang masih memakainya
+        tetap melihat data yang konsisten.
+
+        Args:
+            dataset_id: Nama dataset
+            table: ProductTable (atau list dictionary produk)
+            source: Keterangan asal data (mis. 'csv', 'snapshot', 'generate')
+
+        Returns:
+            Dataset yang baru dipublikasikan
+        """
+        dataset_id = validate_dataset_id(dataset_id)
+        if not isinstance(table, ProductTable):
+            table = ProductTable.from_dicts(table)
+
+        dataset = Dataset(dataset_id, table, next(self._versions), source)
+        dataset.nbytes  # dihitung di luar lock registry
+
+        stale = []
+        with self._lock:
+            old = self._datasets.pop(dataset_id, None)
+            if old is not None:
+                stale.append(old)
+            self._datasets[dataset_id] = dataset
+            stale.extend(self._evict(keep=dataset_id))
+
+        for old in stale:
+            self._invalidate(old)
+        return dataset
+
+    def _evict(self, keep):
+        """Mengeluarkan dataset LRU selain keep sampai total memori di bawah batas."""
+        evicted = []
+        total = sum(dataset.nbytes for dataset in self._datasets.values())
+        for dataset_id in list(self._datasets):
+            if total <= self.max_bytes:
+                break
+            if dataset_id == keep:
+                continue
+            dataset = self._datasets.pop(dataset_id)
+            total -= dataset.nbytes
+            evicted.append(dataset)
+            self.evictions += 1
+        return evicted
+
+    def _invalidate(self, dataset):
+        if self._on_invalidate is not None:
+            self._on_invalidate(dataset)
+
+    def get(self, dataset_id):
+        """
+        Mengambil dataset dan menandainya baru diakses.
+
+        Returns:
+            Dataset, atau None jika tidak ada
+        """
+        dataset_id = validate_dataset_id(dataset_id)
+        with self._lock:
+            dataset = self._datasets.get(dataset_id)
+            if dataset is not None:
+                self._datasets.move_to_end(dataset_id)
+                dataset.last_access = time.time()
+            return dataset
+
+    def remove(self, dataset_id):
+        """
+        Menghapus dataset dari registry.
+
+        Returns:
+            True jika dataset ada dan dihapus
+        """
+        dataset_id = validate_dataset_id(dataset_id)
+        with self._lock:
+            dataset = self._datasets.pop(dataset_id, None)
+        if dataset is None:
+            return False
+        self._invalidate(dataset)
+        return True
+
+    def bump_version(self, dataset):
+        """
+        Memberi versi baru setelah isi dataset diubah di tempat
+        (dipanggil di bawah dataset.lock.write()).
+        """
+        self._invalidate(dataset)
+        dataset.version = next(self._versions)
+        dataset.invalidate_size()
+
+    def __contains__(self, dataset_id):
+        with self._lock:
+            return dataset_id in self._datasets
+
+    def __len__(self):
+        with self._lock:
+            return len(self._datasets)
+
+    def stats(self):
+        """Mengembalikan ringkasan registry dan semua dataset (urutan LRU)."""
+        with self._lock:
+            datasets = list(self._datasets.values())
+        items = [dataset.stats() for dataset in datasets]
+        return {
+            'datasets': items,
+            'bytes': sum(item['bytes'] for item in items),
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,119 @@
+"""
+Fast JSON
+Serialisasi JSON cepat untuk response berisi banyak baris produk.
+
+Memakai orjson jika terpasang (opsional), atau json bawaan dengan separator
+ringkas. Byte JSON setiap baris disimpan dalam cache per versi dataset, sehingga
+response sort cukup disusun dengan menggabungkan byte yang sudah jadi.
+"""
+
+import json
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson bersifat opsional
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# Nama encoder yang dipakai (dilaporkan di response)
+ENCODER_NAME = 'orjson' if HAS_ORJSON else 'json'
+
+# Batas jumlah baris dan byte yang di-cache per versi dataset; baris di luar
+# batas tetap di-encode, hanya tidak disimpan
+ROW_CACHE_MAX_ROWS = int(os.environ.get('ROW_JSON_CACHE_MAX_ROWS', 500000))
+ROW_CACHE_MAX_BYTES = int(os.environ.get('ROW_JSON_CACHE_MAX_MB', 128)) * 1024 * 1024
+
+# Perkiraan overhead satu entri dict cache (slot hash + key int), di luar objek bytes
+_ENTRY_OVERHEAD = 64
+
+
+def dumps(obj):
+    """
+    Meng-encode objek menjadi byte JSON (UTF-8).
+
+    Args:
+        obj: Objek yang bisa diserialisasi JSON (dict, list, str, angka, None)
+
+    Returns:
+        bytes JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class RowJsonCache:
+    """
+    Cache byte JSON per baris untuk satu versi ProductTable.
+
+    Pemanggil wajib membuat cache baru (atau membuang yang lama) setiap kali
+    isi tabel berubah; cache tidak memeriksa perubahan sendiri.
+    """
+
+    def __init__(self, table, max_rows=ROW_CACHE_MAX_ROWS, max_bytes=ROW_CACHE_MAX_BYTES):
+        self.table = table
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._names = table.column_names()
+        self._rows = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def memory_usage(self):
+        """Perkiraan memori byte JSON yang tersimpan di cache (byte)."""
+        return self.nbytes
+
+    def _encode(self, row, columns):
+        return dumps(dict(zip(self._names, [column[row] for column in columns])))
+
+    def encode_rows(self, rows):
+        """
+        Meng-encode beberapa baris sebagai list byte JSON.
+
+        Args:
+            rows: Iterable indeks baris
+
+        Returns:
+            List bytes JSON, satu per baris, dalam urutan rows
+        """
+        cached = self._rows
+        columns = [self.table.column(name) for name in self._names]
+        encoded = []
+        for row in rows:
+            item = cached.get(row)
+            if item is None:
+                item = self._encode(row, columns)
+                if len(cached) < self.max_rows and self.nbytes < self.max_bytes:
+                    cached[row] = item
+                    self.nbytes += sys.getsizeof(item) + _ENTRY_OVERHEAD
+            encoded.append(item)
+        return encoded
+
+    def encode_array(self, rows):
+        """Meng-encode baris sebagai array JSON: b'[{...},{...}]'."""
+        return b'[' + b','.join(self.encode_rows(rows)) + b']'
+
+
+def encode_payload(payload, raw=None):
+    """
+    Meng-encode dictionary response, dengan field tambahan yang sudah berupa
+    byte JSON (mis. array baris dari RowJsonCache) disisipkan apa adanya.
+
+    Args:
+        payload: Dictionary field biasa
+        raw: Dictionary {nama field: bytes JSON} yang disisipkan tanpa encode ulang
+
+    Returns:
+        bytes JSON objek response
+    """
+    body = dumps(payload)
+    if not raw:
+        return body
+    parts = [dumps(name) + b':' + value for name, value in raw.items()]
+    separator = b',' if payload else b''
+    return body[:-1] + separator + b','.join(parts) + b'}'
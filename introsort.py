@@ -0,0 +1,253 @@
+"""
+Introsort
+Implementasi Introsort: Quick Sort dengan pivot median-of-three/ninther, insertion sort
+untuk range kecil, dan fallback ke Heapsort saat kedalaman rekursi melebihi batas.
+"""
+
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+
+# Range dengan ukuran <= nilai ini diselesaikan dengan insertion sort
+INSERTION_SORT_THRESHOLD = 16
+
+# Range dengan ukuran > nilai ini memakai ninther (median dari tiga median)
+NINTHER_THRESHOLD = 40
+
+
+def insertion_sort(keys, perm, low, high):
+    """
+    Insertion sort pada range keys[low..high] beserta permutasinya.
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+    """
+    for i in range(low + 1, high + 1):
+        current_key = keys[i]
+        current_idx = perm[i]
+        j = i - 1
+        while j >= low and keys[j] > current_key:
+            keys[j + 1] = keys[j]
+            perm[j + 1] = perm[j]
+            j -= 1
+        keys[j + 1] = current_key
+        perm[j + 1] = current_idx
+
+
+def _sift_down(keys, perm, low, root, end):
+    """Menurunkan elemen root pada max-heap yang dimulai di indeks low."""
+    while True:
+        child = 2 * (root - low) + 1 + low
+        if child > end:
+            return
+        if child + 1 <= end and keys[child] < keys[child + 1]:
+            child += 1
+        if keys[root] >= keys[child]:
+            return
+        keys[root], keys[child] = keys[child], keys[root]
+        perm[root], perm[child] = perm[child], perm[root]
+        root = child
+
+
+def heap_sort(keys, perm, low, high):
+    """
+    Heapsort pada range keys[low..high] beserta permutasinya.
+    Dipakai sebagai fallback agar worst case tetap O(n log n).
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+    """
+    size = high - low + 1
+    for root in range(low + size // 2 - 1, low - 1, -1):
+        _sift_down(keys, perm, low, root, high)
+
+    for end in range(high, low, -1):
+        keys[low], keys[end] = keys[end], keys[low]
+        perm[low], perm[end] = perm[end], perm[low]
+        _sift_down(keys, perm, low, low, end - 1)
+
+
+def _median_of_three(keys, a, b, c):
+    """Mengembalikan indeks dengan kunci median di antara a, b, c."""
+    ka, kb, kc = keys[a], keys[b], keys[c]
+    if ka < kb:
+        if kb < kc:
+            return b
+        return c if ka < kc else a
+    if ka < kc:
+        return a
+    return c if kb < kc else b
+
+
+def choose_pivot(keys, low, high):
+    """
+    Memilih indeks pivot: median-of-three untuk range sedang,
+    ninther (median dari tiga median-of-three) untuk range besar.
+
+    Args:
+        keys: List kunci bertipe
+        low: Indeks awal
+        high: Indeks akhir
+
+    Returns:
+        Indeks pivot
+    """
+    mid = (low + high) // 2
+    if high - low + 1 > NINTHER_THRESHOLD:
+        step = (high - low + 1) // 8
+        first = _median_of_three(keys, low, low + step, low + 2 * step)
+        middle = _median_of_three(keys, mid - step, mid, mid + step)
+        last = _median_of_three(keys, high - 2 * step, high - step, high)
+        return _median_of_three(keys, first, middle, last)
+    return _median_of_three(keys, low, mid, high)
+
+
+def partition(keys, perm, low, high):
+    """
+    Partisi Hoare di sekitar pivot hasil choose_pivot.
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris yang ikut ditukar bersama keys
+        low: Indeks awal
+        high: Indeks akhir
+
+    Returns:
+        Indeks j sehingga keys[low..j] <= pivot <= keys[j+1..high]
+    """
+    pivot = keys[choose_pivot(keys, low, high)]
+    i = low - 1
+    j = high + 1
+
+    while True:
+        i += 1
+        while keys[i] < pivot:
+            i += 1
+        j -= 1
+        while keys[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        keys[i], keys[j] = keys[j], keys[i]
+        perm[i], perm[j] = perm[j], perm[i]
+
+
+def introsort_keys(keys, perm, low, high, depth_limit):
+    """
+    Inti Introsort pada array kunci dan permutasi (in-place, ascending).
+    Sisi yang lebih kecil diproses secara rekursif dan sisi yang lebih besar
+    dengan loop, sehingga kedalaman stack paling banyak O(log n).
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+        depth_limit: Sisa kedalaman partisi sebelum beralih ke Heapsort
+    """
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            heap_sort(keys, perm, low, high)
+            return
+        depth_limit -= 1
+
+        split = partition(keys, perm, low, high)
+
+        if split - low < high - split:
+            introsort_keys(keys, perm, low, split, depth_limit)
+            low = split + 1
+        else:
+            introsort_keys(keys, perm, split + 1, high, depth_limit)
+            high = split
+
+    insertion_sort(keys, perm, low, high)
+
+
+def argsort_introsort(keys, reverse=False):
+    """
+    Mengurutkan array kunci (in-place) dan mengembalikan permutasi barisnya.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    n = len(keys)
+    perm = list(range(n))
+    if n > 1:
+        introsort_keys(keys, perm, 0, n - 1, 2 * n.bit_length())
+    if reverse:
+        keys.reverse()
+        perm.reverse()
+    return perm
+
+
+def quick_sort_introsort(arr, key=None, reverse=False):
+    """
+    Implementasi Introsort.
+
+    Kompleksitas Waktu:
+    - Best Case: O(n log n)
+    - Average Case: O(n log n)
+    - Worst Case: O(n log n) (fallback Heapsort)
+
+    Kompleksitas Ruang: O(log n) untuk call stack, O(n) untuk array kunci
+
+    Args:
+        arr: List data yang akan diurutkan
+        key: Fungsi untuk mengambil nilai kunci dari elemen
+        reverse: True untuk urutan descending
+
+    Returns:
+        List yang sudah diurutkan (in-place)
+    """
+    if len(arr) <= 1:
+        return arr
+
+    keys = extract_keys(arr, key)
+    perm = argsort_introsort(keys, reverse=reverse)
+    arr[:] = apply_permutation(arr, perm)
+
+    return arr
+
+
+def sort_products_introsort(products, sort_by='price', reverse=False):
+    """
+    Mengurutkan list produk menggunakan Introsort.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    if not products:
+        return products
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_introsort(keys, reverse=reverse)
+
+    return apply_permutation(products, perm)
+
+
+if __name__ == "__main__":
+    # Contoh penggunaan pada data yang sudah terurut (worst case Quick Sort biasa)
+    import time
+
+    sorted_input = [{"id": i, "price": i * 1000} for i in range(20000)]
+
+    print("=== Introsort Demo ===\n")
+    start = time.perf_counter()
+    result = sort_products_introsort(sorted_input, sort_by='price', reverse=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"20.000 data terurut diurutkan descending dalam {elapsed:.3f} ms")
+    print(f"Harga tertinggi: Rp {result[0]['price']:,}")
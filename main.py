@@ -4,16 +4,18 @@ Aplikasi utama untuk membandingkan Quick Sort Rekursif vs Iteratif pada data pro
 """
 
 import sys
-import copy
 from product_data import (
     load_products_from_csv, 
     generate_random_products, 
     display_products,
     get_column_names,
-    save_products_to_csv
+    export_sorted_csv,
+    external_sort_csv,
+    EXTERNAL_SORT_MEMORY_MB
 )
-from quicksort_recursive import sort_products_recursive
-from quicksort_iterative import sort_products_iterative
+from sort_engines import ENGINES, argsort_products, engine_label
+from partial_sort import top_k_permutation
+from sort_keys import parse_sort_spec, describe_sort_spec, apply_permutation
 from benchmark import (
     run_benchmark, 
     print_benchmark_table, 
@@ -51,6 +53,8 @@ def print_menu():
     print("7. Jalankan Benchmark Lengkap")
     print("8. Tampilkan Analisis Kompleksitas")
     print("9. Simpan data hasil sorting ke CSV")
+    print("10. Sorting dengan engine lain (Three-Way, Introsort, NumPy, Paralel, Radix)")
+    print("11. Sort eksternal file CSV besar (melebihi RAM)")
     print("0. Keluar")
     print("-" * 40)
 
@@ -58,78 +62,175 @@ def print_menu():
 def get_sort_options(products):
     """
     Meminta user memilih atribut sorting.
+    Mendukung multi-kolom dengan arah per kolom, mis. "4:D,3:A,2"
+    (stock descending, lalu price ascending, lalu name).
     
     Returns:
-        Tuple (sort_by, reverse)
+        Tuple (sort_by, reverse); sort_by berupa nama kolom atau
+        list spesifikasi (kolom, arah) untuk multi-kolom
     """
     columns = get_column_names(products)
     
     print("\nPilih atribut untuk pengurutan:")
     for i, col in enumerate(columns, 1):
         print(f"  {i}. {col}")
+    print("  (Multi-kolom: pisahkan dengan koma, arah per kolom dengan :A / :D, mis. 4:D,3:A,2)")
     
     while True:
         try:
-            choice = int(input("Pilihan: "))
-            if 1 <= choice <= len(columns):
-                sort_by = columns[choice - 1]
-                break
+            choice = input("Pilihan: ").strip()
+            specs = []
+            for part in choice.split(','):
+                number, _, direction = part.partition(':')
+                index = int(number)
+                if not 1 <= index <= len(columns):
+                    raise IndexError
+                direction = direction.strip().upper() or 'A'
+                if direction not in ('A', 'D'):
+                    raise IndexError
+                specs.append((columns[index - 1], 'desc' if direction == 'D' else 'asc'))
+            break
+        except IndexError:
             print("Pilihan tidak valid!")
         except ValueError:
             print("Masukkan angka yang valid!")
     
+    if len(specs) > 1 or ':' in choice:
+        return specs, False
+    
+    sort_by = specs[0][0]
     order = input("Urutan (A)scending / (D)escending [A]: ").strip().upper()
     reverse = order == 'D'
     
     return sort_by, reverse
 
 
-def run_sorting(products, algorithm='recursive'):
+def format_sort_by(sort_by, reverse=False):
+    """Mengembalikan teks atribut sorting untuk ditampilkan."""
+    if isinstance(sort_by, str):
+        return f"{sort_by} ({'Descending' if reverse else 'Ascending'})"
+    return describe_sort_spec(parse_sort_spec(sort_by, reverse))
+
+
+def choose_algorithm():
+    """
+    Meminta user memilih engine sorting dari sort_engines.ENGINES.
+    
+    Returns:
+        Tuple (algorithm, engine_options)
+    """
+    algorithms = list(ENGINES)
+    
+    print("\nPilih engine sorting:")
+    for i, algorithm in enumerate(algorithms, 1):
+        print(f"  {i}. {engine_label(algorithm)}")
+    
+    while True:
+        try:
+            choice = int(input("Pilihan: "))
+            if 1 <= choice <= len(algorithms):
+                algorithm = algorithms[choice - 1]
+                break
+            print("Pilihan tidak valid!")
+        except ValueError:
+            print("Masukkan angka yang valid!")
+    
+    engine_options = {}
+    if algorithm == 'parallel':
+        workers = input("Jumlah worker [semua core]: ").strip()
+        if workers:
+            engine_options['workers'] = int(workers)
+        threshold = input("Ukuran minimum untuk mode paralel [100000]: ").strip()
+        if threshold:
+            engine_options['threshold'] = int(threshold)
+    
+    return algorithm, engine_options
+
+
+def run_external_sort():
+    """
+    Mengurutkan file CSV langsung dari disk ke file output dengan external merge sort,
+    tanpa memuat seluruh data ke memori.
+    """
+    input_path = input("Masukkan path file CSV sumber [data.csv]: ").strip() or 'data.csv'
+    output_path = input("Masukkan path file output [sorted_data.csv]: ").strip() or 'sorted_data.csv'
+    
+    print("Atribut sorting, mis. price atau stock:desc,price:asc")
+    spec = input("Atribut [price]: ").strip() or 'price'
+    sort_by = [part.strip() for part in spec.split(',') if part.strip()]
+    
+    budget = input(f"Batas memori per chunk (MB) [{EXTERNAL_SORT_MEMORY_MB}]: ").strip()
+    memory_budget_mb = float(budget) if budget else EXTERNAL_SORT_MEMORY_MB
+    
+    algorithm, engine_options = choose_algorithm()
+    
+    try:
+        print(f"\nMengurutkan '{input_path}' berdasarkan {describe_sort_spec(parse_sort_spec(sort_by))}...")
+        external_sort_csv(input_path, output_path, sort_by=sort_by,
+                          memory_budget_mb=memory_budget_mb, algorithm=algorithm,
+                          engine_options=engine_options)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+
+
+def run_sorting(products, algorithm='recursive', engine_options=None):
     """
     Menjalankan sorting dan menampilkan hasil.
     
     Args:
         products: List produk
-        algorithm: 'recursive' atau 'iterative'
+        algorithm: Nama algoritma (lihat sort_engines.ENGINES)
+        engine_options: Opsi tambahan untuk engine (mis. {'workers': 8})
     
     Returns:
-        List produk yang sudah diurutkan
+        Tuple (products, permutasi terurut) untuk diekspor, atau None jika tidak ada data
     """
     if not products:
         print("Tidak ada data produk. Muat data terlebih dahulu.")
-        return products
+        return None
     
     sort_by, reverse = get_sort_options(products)
     
-    order_text = "Descending" if reverse else "Ascending"
-    algo_name = "Rekursif" if algorithm == 'recursive' else "Iteratif"
+    # Preview top-k cukup O(n + k log k); sort penuh hanya jika diminta
+    mode = input("Mode (F)ull sort / (T)op-k preview [F]: ").strip().upper()
+    top_k = None
+    if mode == 'T':
+        k_input = input("Jumlah data teratas (k) [50]: ").strip()
+        top_k = int(k_input) if k_input else 50
+    
+    algo_name = engine_label(algorithm) if top_k is None else "Top-K (Quickselect)"
     
     print(f"\nMenjalankan Quick Sort {algo_name}...")
-    print(f"Sorting berdasarkan: {sort_by} ({order_text})")
+    print(f"Sorting berdasarkan: {format_sort_by(sort_by, reverse)}")
     print(f"Jumlah data: {len(products):,}")
     
-    # Pilih fungsi sorting
-    if algorithm == 'recursive':
-        sorted_products, exec_time = measure_time(
-            sort_products_recursive, 
+    # Hanya permutasi yang dihitung; data produk tidak disalin
+    if top_k is None:
+        perm, exec_time = measure_time(
+            argsort_products, 
             products, 
             sort_by=sort_by, 
-            reverse=reverse
+            reverse=reverse,
+            algorithm=algorithm,
+            engine_options=engine_options
         )
     else:
-        sorted_products, exec_time = measure_time(
-            sort_products_iterative, 
-            products, 
-            sort_by=sort_by, 
+        perm, exec_time = measure_time(
+            top_k_permutation,
+            products,
+            k=top_k,
+            sort_by=sort_by,
             reverse=reverse
         )
     
     print(f"\n✓ Sorting selesai dalam {exec_time:.3f} ms")
     
-    print(f"\nHasil sorting (10 data pertama):")
-    display_products(sorted_products, limit=50)
+    print(f"\nHasil sorting (50 data pertama):")
+    display_products(apply_permutation(products, perm[:50]))
+    if top_k is not None:
+        print(f"(Mode top-k: hanya {len(perm):,} data teratas yang diurutkan)")
     
-    return sorted_products
+    return products, perm
 
 
 def compare_algorithms(products):
@@ -144,7 +245,7 @@ def compare_algorithms(products):
     
     print(f"\nMembandingkan Quick Sort Rekursif vs Iteratif...")
     print(f"Jumlah data: {len(products):,}")
-    print(f"Sorting berdasarkan: {sort_by}")
+    print(f"Sorting berdasarkan: {format_sort_by(sort_by, reverse)}")
     
     result = run_single_comparison(products, sort_by=sort_by, reverse=reverse)
     
@@ -162,7 +263,7 @@ def compare_algorithms(products):
 def main():
     """Fungsi utama aplikasi."""
     products = []
-    sorted_products = []
+    sorted_result = None
     
     print_header()
     
@@ -180,7 +281,9 @@ def main():
             filepath = input("Masukkan path file CSV [data.csv]: ").strip()
             if not filepath:
                 filepath = 'data.csv'
-            products = load_products_from_csv(filepath)
+            workers_input = input("Jumlah proses parsing [1]: ").strip()
+            workers = int(workers_input) if workers_input.isdigit() else 1
+            products = load_products_from_csv(filepath, report=True, workers=workers)
             if products:
                 print(f"\n✓ Berhasil memuat {len(products):,} produk dari '{filepath}'")
                 display_products(products, limit=5)
@@ -196,7 +299,10 @@ def main():
                 except ValueError:
                     print("Masukkan angka yang valid!")
             
-            products = generate_random_products(n)
+            seed_input = input("Seed random (Enter = acak): ").strip()
+            seed = int(seed_input) if seed_input.lstrip('-').isdigit() else None
+            
+            products = generate_random_products(n, seed=seed)
             print(f"\n✓ Berhasil generate {n:,} produk random")
             display_products(products, limit=5)
             
@@ -211,11 +317,11 @@ def main():
             
         elif choice == '4':
             # Quick Sort Rekursif
-            sorted_products = run_sorting(products, algorithm='recursive')
+            sorted_result = run_sorting(products, algorithm='recursive')
             
         elif choice == '5':
             # Quick Sort Iteratif
-            sorted_products = run_sorting(products, algorithm='iterative')
+            sorted_result = run_sorting(products, algorithm='iterative')
             
         elif choice == '6':
             # Bandingkan kedua algoritma
@@ -249,10 +355,21 @@ def main():
             iterations = input("Jumlah iterasi untuk rata-rata [3]: ").strip()
             iterations = int(iterations) if iterations else 3
             
+            # Pilih algoritma dan kolom (mis. 'radix,introsort' pada kolom 'stock')
+            print(f"Algoritma tersedia: {', '.join(ENGINES)}")
+            names = input("Algoritma (pisahkan dengan koma) [recursive,iterative]: ").strip()
+            algorithms = [x.strip() for x in names.split(',') if x.strip()] or None
+            sort_by = input("Kolom pengurutan [price]: ").strip() or 'price'
+            
             # Jalankan benchmark
-            results = run_benchmark(data_sizes=data_sizes, iterations=iterations)
-            print_benchmark_table(results)
-            analyze_growth_rate(results)
+            try:
+                results = run_benchmark(data_sizes=data_sizes, sort_by=sort_by,
+                                        iterations=iterations, algorithms=algorithms)
+            except ValueError as e:
+                print(f"Error: {e}")
+            else:
+                print_benchmark_table(results)
+                analyze_growth_rate(results)
             
         elif choice == '8':
             # Analisis kompleksitas
@@ -260,13 +377,31 @@ def main():
             
         elif choice == '9':
             # Simpan hasil sorting
-            if not sorted_products:
+            if not sorted_result:
                 print("Belum ada data hasil sorting. Jalankan sorting terlebih dahulu.")
             else:
-                filepath = input("Masukkan nama file output [sorted_data.csv]: ").strip()
+                filepath = input("Masukkan nama file output [sorted_data.csv] (.gz = gzip): ").strip()
                 if not filepath:
                     filepath = 'sorted_data.csv'
-                save_products_to_csv(sorted_products, filepath)
+                # Ekspor streaming: baris ditulis dari data sumber mengikuti permutasi
+                source, perm = sorted_result
+                try:
+                    export_sorted_csv(source, filepath, perm=perm)
+                except OSError as error:
+                    print(f"Error menyimpan file: {error}")
+            
+        elif choice == '10':
+            # Engine sorting lain
+            if not products:
+                print("Tidak ada data produk. Muat data terlebih dahulu.")
+            else:
+                algorithm, engine_options = choose_algorithm()
+                sorted_result = run_sorting(products, algorithm=algorithm,
+                                            engine_options=engine_options)
+            
+        elif choice == '11':
+            # Sort eksternal file CSV besar
+            run_external_sort()
             
         elif choice == '0':
             print("\nTerima kasih telah menggunakan aplikasi ini!")
@@ -274,7 +409,7 @@ def main():
             break
             
         else:
-            print("Pilihan tidak valid. Silakan pilih 0-9.")
+            print("Pilihan tidak valid. Silakan pilih 0-11.")
         
         input("\nTekan Enter untuk melanjutkan...")
 
@@ -0,0 +1,243 @@
+"""
+Metrics
+Metrik request dalam format teks Prometheus (counter, gauge, histogram berlabel)
+dan pencatat waktu per fase untuk satu request.
+
+Metrik disimpan per proses; pada mode prefork (serve.py) setiap worker
+melaporkan metriknya sendiri.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+
+# Batas bucket histogram durasi (detik)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Engine komparatif yang perbandingannya bisa dihitung dengan kunci pembungkus
+# (engine lain tidak membandingkan kunci Python atau mengirimnya ke proses lain)
+COMPARISON_ENGINES = ('recursive', 'iterative', 'three_way', 'introsort')
+
+
+def _escape(value):
+    """Escape nilai label sesuai format teks Prometheus."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{_escape(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Dasar metrik berlabel: satu nilai (atau state) per kombinasi label."""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Label metrik {self.name} harus: {', '.join(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Counter yang hanya bertambah."""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Gauge yang nilainya dibaca dari fungsi saat /metrics diminta."""
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, function):
+        super().__init__(name, documentation)
+        self._function = function
+
+    def render(self):
+        return self._header() + [f"{self.name} {_format_value(self._function())}"]
+
+
+class Histogram(_Metric):
+    """Histogram dengan bucket kumulatif, jumlah, dan total observasi."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect_left(self.buckets, value)] += 1
+            state[1] += value
+
+    def count(self, **labels):
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[0]) if state else 0
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Kumpulan metrik yang dirender bersama di endpoint /metrics."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, function):
+        return self._register(Gauge(name, documentation, function))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """Mengembalikan semua metrik dalam format teks Prometheus."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+class PhaseTimer:
+    """
+    Mencatat durasi setiap fase sebuah request.
+
+    Contoh:
+        timer = PhaseTimer()
+        with timer.phase('sort'):
+            ...
+        timer.as_ms()  # {'sort': 1.234}
+    """
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        """Menambahkan durasi (detik) ke sebuah fase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def as_ms(self):
+        """Durasi setiap fase dalam milidetik."""
+        return {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+
+    def server_timing(self):
+        """Nilai header Server-Timing, mis. 'keys;dur=1.2, sort;dur=3.4'."""
+        return ', '.join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items())
+
+
+def counting_keys(keys):
+    """
+    Membungkus kunci agar setiap perbandingan dihitung.
+    Memperlambat sorting, jadi hanya dipakai jika diminta.
+
+    Args:
+        keys: List kunci hasil build_sort_keys
+
+    Returns:
+        Tuple (list kunci terbungkus, list [jumlah perbandingan])
+    """
+    counter = [0]
+
+    class CountingKey:
+        __slots__ = ('value',)
+        __hash__ = None
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            counter[0] += 1
+            return self.value < other.value
+
+        def __le__(self, other):
+            counter[0] += 1
+            return self.value <= other.value
+
+        def __gt__(self, other):
+            counter[0] += 1
+            return self.value > other.value
+
+        def __ge__(self, other):
+            counter[0] += 1
+            return self.value >= other.value
+
+        def __eq__(self, other):
+            counter[0] += 1
+            return self.value == other.value
+
+        def __ne__(self, other):
+            counter[0] += 1
+            return self.value != other.value
+
+    return [CountingKey(key) for key in keys], counter
@@ -0,0 +1,112 @@
+"""
+NumPy Sort Backend
+Backend pengurutan kolom secara vektorisasi dengan NumPy (opsional).
+Jika NumPy tidak terpasang (atau kunci mencampur angka dan teks), pengurutan
+otomatis memakai Introsort (atau sorted() bawaan Python untuk varian stabil).
+"""
+
+from sort_keys import apply_permutation, build_sort_keys, infer_key_type
+from introsort import argsort_introsort
+
+try:
+    import numpy as np
+except ImportError:  # NumPy bersifat opsional
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def to_numpy_column(keys):
+    """
+    Mengubah array kunci bertipe menjadi array NumPy satu kali.
+
+    Args:
+        keys: List kunci hasil extract_keys (angka atau string)
+
+    Returns:
+        numpy.ndarray (int64/float64 untuk angka, unicode untuk string)
+    """
+    column = np.asarray(keys)
+    if column.dtype == object:
+        # Integer di luar rentang int64: bandingkan sebagai float
+        column = column.astype(np.float64)
+    return column
+
+
+def _numpy_compatible(keys):
+    """
+    False untuk kunci tuple yang salah satu kolomnya campuran angka/teks
+    (mis. kunci comparable_value kolom campuran); NumPy akan membandingkan
+    angkanya sebagai teks.
+    """
+    if keys and isinstance(keys[0], tuple):
+        return all(infer_key_type(column) != 'mixed' for column in zip(*keys))
+    return True
+
+
+def _argsort_ascending(keys, stable):
+    """np.argsort untuk kunci tunggal, np.lexsort untuk kunci komposit (tuple)."""
+    if keys and isinstance(keys[0], tuple):
+        columns = [to_numpy_column(column) for column in zip(*keys)]
+        # lexsort selalu stabil dan memakai kolom terakhir sebagai kunci utama
+        return np.lexsort(columns[::-1])
+    return np.argsort(to_numpy_column(keys), kind='stable' if stable else 'quicksort')
+
+
+def argsort_numpy(keys, reverse=False, stable=False):
+    """
+    Menghitung permutasi terurut dengan np.argsort.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys (atau tuple komposit
+              dari build_sort_keys)
+        reverse: True untuk urutan descending
+        stable: True agar kunci yang sama tetap dalam urutan asli
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    if np is None or not _numpy_compatible(keys):
+        if stable:
+            # Introsort tidak stabil; Timsort bawaan Python menjaga urutan asli
+            return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        return argsort_introsort(keys, reverse=reverse)
+
+    if not reverse:
+        order = _argsort_ascending(keys, stable)
+    elif stable:
+        # Descending stabil: argsort stabil pada kunci terbalik, lalu dibalik lagi
+        n = len(keys)
+        order = (n - 1) - _argsort_ascending(keys[::-1], True)[::-1]
+    else:
+        order = _argsort_ascending(keys, False)[::-1]
+
+    return order.tolist()
+
+
+def argsort_numpy_stable(keys, reverse=False):
+    """Varian stabil dari argsort_numpy."""
+    return argsort_numpy(keys, reverse=reverse, stable=True)
+
+
+def sort_products_numpy(products, sort_by='price', reverse=False, stable=False):
+    """
+    Mengurutkan list produk dengan backend NumPy.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+        stable: True untuk pengurutan stabil
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    if not products:
+        return products
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_numpy(keys, reverse=reverse, stable=stable)
+
+    return apply_permutation(products, perm)
@@ -0,0 +1,197 @@
+"""
+Parallel Quick Sort
+Quick Sort multi-core: level partisi teratas dikerjakan di proses utama, lalu
+sub-range yang saling independen diurutkan paralel oleh ProcessPoolExecutor.
+Kunci numerik dikirim lewat multiprocessing.shared_memory (bukan pickle dict produk).
+"""
+
+import os
+import heapq
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sort_keys import apply_permutation, infer_key_type, build_sort_keys
+from introsort import argsort_introsort, choose_pivot
+from quicksort_three_way import partition_three_way
+
+# Jumlah worker default: semua core yang tersedia
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+# Di bawah ukuran ini pengurutan tetap serial (overhead proses lebih mahal)
+PARALLEL_THRESHOLD = 100000
+
+# Jumlah sub-range per worker agar beban kerja tetap seimbang
+RANGES_PER_WORKER = 4
+
+
+def _compact_keys(keys):
+    """
+    Mengemas kunci numerik ke array.array yang ringkas.
+
+    Returns:
+        array.array bertipe 'q' (int64) atau 'd' (float64), atau None untuk kunci string
+    """
+    if infer_key_type(keys) != 'number':
+        return None
+    try:
+        return array('q', keys)
+    except (TypeError, OverflowError):
+        return array('d', keys)
+
+
+def _split_ranges(keys, perm, target, min_size):
+    """
+    Mempartisi level teratas sampai terdapat cukup sub-range independen.
+    Blok kunci yang sama dengan pivot sudah final dan tidak dikirim ke worker.
+
+    Args:
+        keys: List kunci bertipe (dipartisi in-place)
+        perm: List indeks baris
+        target: Jumlah sub-range yang diinginkan
+        min_size: Ukuran minimum sub-range yang masih layak dipartisi
+
+    Returns:
+        List tuple (low, high) yang belum terurut
+    """
+    pending = [(-len(keys), 0, len(keys) - 1)]
+    done = []
+
+    while pending and len(pending) + len(done) < target:
+        size, low, high = heapq.heappop(pending)
+        if -size < min_size:
+            done.append((low, high))
+            continue
+
+        # Pivot median-of-three/ninther dipindah ke akhir untuk partisi tiga arah
+        pivot_index = choose_pivot(keys, low, high)
+        keys[pivot_index], keys[high] = keys[high], keys[pivot_index]
+        perm[pivot_index], perm[high] = perm[high], perm[pivot_index]
+        lt, gt = partition_three_way(keys, perm, low, high)
+
+        for sub_low, sub_high in ((low, lt - 1), (gt + 1, high)):
+            if sub_low < sub_high:
+                heapq.heappush(pending, (-(sub_high - sub_low + 1), sub_low, sub_high))
+
+    done.extend((low, high) for _, low, high in pending)
+    return done
+
+
+def _sort_range_worker(shm_name, typecode, length, low, high, key_slice):
+    """
+    Dijalankan di proses worker: mengurutkan satu sub-range kunci.
+
+    Args:
+        shm_name: Nama shared memory berisi kunci numerik (None untuk string)
+        typecode: Typecode array.array kunci di shared memory
+        length: Jumlah kunci di shared memory
+        low: Indeks awal sub-range
+        high: Indeks akhir sub-range
+        key_slice: List kunci sub-range jika tidak memakai shared memory
+
+    Returns:
+        Tuple (low, array offset terurut relatif terhadap low)
+    """
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            itemsize = array(typecode).itemsize
+            view = shm.buf[:length * itemsize].cast(typecode)
+            key_slice = view[low:high + 1].tolist()
+            view.release()
+        finally:
+            shm.close()
+
+    offsets = argsort_introsort(key_slice)
+    return low, array('q', offsets)
+
+
+def argsort_parallel(keys, reverse=False, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Mengurutkan array kunci secara paralel dan mengembalikan permutasi barisnya.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+        workers: Jumlah proses worker (default: jumlah core)
+        threshold: Ukuran data minimum untuk mode paralel
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    n = len(keys)
+    workers = workers or DEFAULT_WORKERS
+    if n < threshold or workers <= 1:
+        return argsort_introsort(keys, reverse=reverse)
+
+    perm = list(range(n))
+    ranges = _split_ranges(keys, perm, workers * RANGES_PER_WORKER, max(n // (workers * RANGES_PER_WORKER), 2))
+
+    compact = _compact_keys(keys)
+    shm = None
+    try:
+        if compact is not None:
+            shm = shared_memory.SharedMemory(create=True, size=max(len(compact) * compact.itemsize, 1))
+            shm.buf[:len(compact) * compact.itemsize] = compact.tobytes()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for low, high in ranges:
+                if shm is not None:
+                    args = (shm.name, compact.typecode, len(compact), low, high, None)
+                else:
+                    args = (None, None, 0, low, high, keys[low:high + 1])
+                futures.append(executor.submit(_sort_range_worker, *args))
+
+            # Gabungkan hasil: setiap sub-range menempati posisi akhirnya sendiri
+            for future in futures:
+                low, offsets = future.result()
+                base = perm[low:low + len(offsets)]
+                perm[low:low + len(offsets)] = [base[o] for o in offsets]
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    if reverse:
+        perm.reverse()
+    return perm
+
+
+def sort_products_parallel(products, sort_by='price', reverse=False, workers=None,
+                           threshold=PARALLEL_THRESHOLD):
+    """
+    Mengurutkan list produk menggunakan Quick Sort paralel.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+        workers: Jumlah proses worker (default: jumlah core)
+        threshold: Ukuran data minimum untuk mode paralel
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    if not products:
+        return products
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_parallel(keys, reverse=reverse, workers=workers, threshold=threshold)
+
+    return apply_permutation(products, perm)
+
+
+if __name__ == "__main__":
+    import time
+    from product_data import generate_random_products
+
+    products = generate_random_products(500000)
+    print("=== Parallel Quick Sort Demo ===\n")
+    print(f"Jumlah data: {len(products):,} | Worker: {DEFAULT_WORKERS}")
+
+    for workers in (1, DEFAULT_WORKERS):
+        start = time.perf_counter()
+        sort_products_parallel(products, sort_by='price', workers=workers)
+        print(f"  {workers} worker: {(time.perf_counter() - start) * 1000:.3f} ms")
@@ -0,0 +1,103 @@
+"""
+Partial Sort (Top-K)
+Quickselect untuk memisahkan k data teratas, lalu hanya k data tersebut yang diurutkan.
+Biaya total sekitar O(n + k log k), lebih murah daripada sort penuh O(n log n)
+jika yang dibutuhkan hanya preview.
+"""
+
+from sort_keys import apply_permutation, build_sort_keys
+from introsort import argsort_introsort, choose_pivot
+from quicksort_three_way import partition_three_way
+
+
+def quickselect(keys, perm, k, reverse=False):
+    """
+    Menyusun ulang keys/perm (in-place) sehingga k posisi pertama berisi
+    k kunci terkecil (atau terbesar jika reverse), dalam urutan sembarang.
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris yang ikut ditukar bersama keys
+        k: Jumlah data teratas yang dipisahkan
+        reverse: True untuk mengambil k kunci terbesar
+    """
+    low = 0
+    high = len(keys) - 1
+    target = k - 1
+
+    while low < high:
+        # Pivot median-of-three/ninther dipindah ke akhir untuk partisi tiga arah
+        pivot_index = choose_pivot(keys, low, high)
+        keys[pivot_index], keys[high] = keys[high], keys[pivot_index]
+        perm[pivot_index], perm[high] = perm[high], perm[pivot_index]
+
+        lt, gt = partition_three_way(keys, perm, low, high, reverse)
+
+        if target < lt:
+            high = lt - 1
+        elif target > gt:
+            low = gt + 1
+        else:
+            return
+
+
+def argsort_top_k(keys, k, reverse=False):
+    """
+    Mengembalikan indeks k baris teratas dalam urutan terurut.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys (diubah in-place)
+        k: Jumlah data teratas
+        reverse: True untuk urutan descending
+
+    Returns:
+        List k indeks baris dalam urutan terurut
+    """
+    n = len(keys)
+    k = max(0, min(k, n))
+    perm = list(range(n))
+
+    if 0 < k < n:
+        quickselect(keys, perm, k, reverse)
+
+    top_keys = keys[:k]
+    order = argsort_introsort(top_keys, reverse=reverse)
+    return [perm[i] for i in order]
+
+
+def top_k_permutation(products, k=50, sort_by='price', reverse=False):
+    """
+    Menghitung indeks k produk teratas dalam urutan terurut tanpa menyusun ulang datanya.
+
+    Args:
+        products: List dictionary produk atau ProductTable
+        k: Jumlah produk yang diambil
+        sort_by: Atribut untuk pengurutan atau list spesifikasi multi-kolom
+        reverse: True untuk urutan descending
+
+    Returns:
+        List k indeks baris dalam urutan terurut
+    """
+    if not products:
+        return []
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    return argsort_top_k(keys, k, reverse=reverse)
+
+
+def top_k_products(products, k=50, sort_by='price', reverse=False):
+    """
+    Mengambil k produk teratas yang sudah terurut tanpa mengurutkan seluruh data.
+
+    Args:
+        products: List dictionary produk
+        k: Jumlah produk yang diambil
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+
+    Returns:
+        List k produk teratas yang sudah diurutkan
+    """
+    perm = top_k_permutation(products, k, sort_by, reverse)
+    return apply_permutation(products, perm)
@@ -4,54 +4,427 @@ Modul untuk membaca dan mengelola data produk dari file CSV.
 """
 
 import csv
+import gzip
+import heapq
+import io
+import os
+import pickle
 import random
+import re
 import string
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, count, islice
 
+from product_table import ProductTable
+from sort_keys import make_row_key_func, parse_sort_spec
+from sort_engines import get_engine
+from sorted_index import SortedIndex
 
-def load_products_from_csv(filepath):
+try:
+    import numpy as np
+except ImportError:  # NumPy bersifat opsional
+    np = None
+
+
+# Ukuran buffer baca file CSV (byte) dan jumlah baris per batch kolom
+CSV_BUFFER_SIZE = 1 << 20
+CSV_BATCH_SIZE = 50000
+
+# Jumlah baris contoh untuk menebak tipe setiap kolom
+SCHEMA_SAMPLE_SIZE = 1000
+
+# Sel yang mungkin menjadi int/float (int() / float() juga menerima spasi, tanda,
+# dan '_'); sel teks lain (mis. 'Laptop Pro 123') cukup di-strip tanpa dicoba
+_numeric_cell = re.compile(r'\s*[+-]?[\d_]*\.?[\d_]*(?:[eE][+-]?[\d_]+)?\s*').fullmatch
+
+
+def convert_cell(value):
+    """
+    Mengonversi satu sel CSV ke int/float/string (aturan konversi per sel).
+    
+    Args:
+        value: Teks sel (atau None untuk sel yang hilang)
+    
+    Returns:
+        int jika tanpa titik desimal, float jika ada titik, selain itu string
+    """
+    try:
+        if '.' in value:
+            return float(value)
+        return int(value)
+    except (ValueError, TypeError):
+        return value.strip() if value else ''
+
+
+def infer_column_type(values):
+    """
+    Menebak tipe kolom dari contoh nilai, sekali per kolom.
+    Sel kosong diabaikan karena selalu menjadi string kosong.
+    
+    Args:
+        values: List teks sel contoh
+    
+    Returns:
+        'int', 'float', 'number' (campuran int/float), 'str',
+        atau 'mixed' (angka dan teks, dikonversi per sel)
+    """
+    kinds = set()
+    for value in values:
+        if value:
+            kinds.add(type(convert_cell(value)))
+    if str in kinds:
+        return 'str' if kinds == {str} else 'mixed'
+    if kinds == {int}:
+        return 'int'
+    if kinds == {float}:
+        return 'float'
+    return 'number'
+
+
+def convert_column(values, column_type):
+    """
+    Mengonversi satu kolom sekaligus sesuai tipe hasil inferensi.
+    Jika ada sel yang tidak cocok dengan tipe numerik, kolom dikonversi ulang
+    per sel sehingga hasilnya sama dengan konversi per sel. Pada kolom 'str'
+    hanya sel berbentuk angka yang dikonversi per sel, sisanya di-strip (tipe
+    ditebak dari batch pertama, batch berikutnya bisa berisi angka).
+    
+    Args:
+        values: List teks sel
+        column_type: Hasil infer_column_type
+    
+    Returns:
+        List nilai hasil konversi
+    """
+    try:
+        if column_type == 'int':
+            return list(map(int, values))
+        if column_type == 'float' and all('.' in v for v in values):
+            return list(map(float, values))
+        if column_type == 'str':
+            return [convert_cell(v) if v and _numeric_cell(v) else (v.strip() if v else '')
+                    for v in values]
+    except (ValueError, TypeError):
+        pass
+    return list(map(convert_cell, values))
+
+
+def _normalize_rows(rows, width):
+    """
+    Baris kosong dilewati; baris yang lebih pendek/panjang dari header
+    disamakan lebarnya (sel yang hilang bernilai None).
+    """
+    if any(len(row) != width for row in rows):
+        return [row[:width] + [None] * (width - len(row)) for row in rows if row]
+    return rows
+
+
+def iter_csv_batches(filepath, batch_size=CSV_BATCH_SIZE, encoding='utf-8', errors='strict'):
+    """
+    Membaca file CSV secara streaming dalam batch kolom.
+    Header dibersihkan dan tipe kolom ditebak sekali dari batch pertama.
+    
+    Args:
+        filepath: Path ke file CSV
+        batch_size: Jumlah baris per batch
+        encoding: Encoding file
+        errors: Penanganan error encoding ('strict', 'ignore', ...)
+    
+    Yields:
+        Tuple (nama_kolom, list kolom) dengan setiap kolom berupa list nilai
+    """
+    with open(filepath, 'r', newline='', encoding=encoding, errors=errors,
+              buffering=CSV_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        names = [name.strip().lower() for name in header]
+        width = len(names)
+        schema = None
+        
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                return
+            
+            rows = _normalize_rows(rows, width)
+            if not rows:
+                continue
+            columns = list(zip(*rows))
+            
+            if schema is None:
+                schema = [infer_column_type(column[:SCHEMA_SAMPLE_SIZE]) for column in columns]
+            
+            yield names, [convert_column(column, column_type)
+                          for column, column_type in zip(columns, schema)]
+
+
+# Ukuran file minimum (byte) agar parsing paralel dipakai; file lebih kecil dibaca serial
+PARALLEL_LOAD_MIN_BYTES = 8 * 1024 * 1024
+
+
+def split_csv_ranges(filepath, parts):
+    """
+    Membagi bagian data file CSV (setelah header) menjadi rentang byte yang
+    selalu dimulai di awal baris.
+    
+    Args:
+        filepath: Path ke file CSV
+        parts: Jumlah rentang yang diinginkan
+    
+    Returns:
+        List tuple (start, end) offset byte
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as file:
+        file.readline()
+        bounds = [file.tell()]
+        data_size = size - bounds[0]
+        for i in range(1, parts):
+            target = bounds[0] + data_size * i // parts
+            if target <= bounds[-1]:
+                continue
+            # Mundur satu byte: jika target tepat di awal baris, readline() hanya membaca '\n'
+            file.seek(target - 1)
+            file.readline()
+            position = file.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _infer_csv_schema(filepath, encoding='utf-8', errors='strict'):
+    """
+    Membaca header dan menebak tipe kolom dari contoh yang sama dengan
+    iter_csv_batches (baris non-kosong pertama dari batch pertama).
+    
+    Returns:
+        Tuple (nama_kolom, list tipe kolom), atau None jika file kosong
+    """
+    with open(filepath, 'r', newline='', encoding=encoding, errors=errors) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return None
+        names = [name.strip().lower() for name in header]
+        sample = _normalize_rows(list(islice(reader, CSV_BATCH_SIZE)), len(names))
+    
+    sample = sample[:SCHEMA_SAMPLE_SIZE]
+    if not sample:
+        return names, ['str'] * len(names)
+    return names, [infer_column_type(list(column)) for column in zip(*sample)]
+
+
+def _parse_csv_range(task):
+    """
+    Dijalankan di proses worker: mem-parse satu rentang byte menjadi kolom.
+    
+    Args:
+        task: Tuple (filepath, start, end, width, schema, encoding, errors)
+    
+    Returns:
+        List kolom hasil konversi, atau None jika rentang berisi field
+        ber-quote dengan baris baru (harus dibaca serial)
+    """
+    filepath, start, end, width, schema, encoding, errors = task
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    
+    # Setiap baris fisik harus menjadi tepat satu record CSV
+    line_count = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+    rows = list(csv.reader(io.StringIO(data.decode(encoding, errors), newline='')))
+    if len(rows) != line_count:
+        return None
+    
+    rows = _normalize_rows(rows, width)
+    if not rows:
+        return [[] for _ in range(width)]
+    return [_pack_column(convert_column(column, column_type))
+            for column, column_type in zip(zip(*rows), schema)]
+
+
+def _pack_column(values):
+    """Mengemas kolom numerik ke array.array agar murah dikirim antar proses."""
+    types = set(map(type, values))
+    try:
+        if types == {int}:
+            return array('q', values)
+        if types == {float}:
+            return array('d', values)
+    except OverflowError:
+        pass
+    return values
+
+
+def _concat_columns(parts):
+    """
+    Menggabungkan potongan kolom sesuai urutan. Kolom tetap berupa array.array
+    jika semua potongan bertipe sama, selain itu menjadi list.
+    """
+    typecodes = {part.typecode if isinstance(part, array) else None for part in parts if len(part)}
+    if len(typecodes) == 1 and None not in typecodes:
+        merged = array(typecodes.pop())
+    else:
+        merged = []
+    for part in parts:
+        merged.extend(part)
+    return merged
+
+
+def load_csv_columns_parallel(filepath, workers=None, encoding='utf-8', errors='strict'):
+    """
+    Mem-parse file CSV secara paralel: file dibagi per rentang byte di batas
+    baris, setiap rentang di-parse oleh proses worker, lalu kolom digabung
+    sesuai urutan file. Tipe kolom ditebak sekali di proses utama agar semua
+    worker memakai skema yang sama dengan pembacaan serial.
+    
+    Args:
+        filepath: Path ke file CSV
+        workers: Jumlah proses worker (default: jumlah core)
+        encoding: Encoding file
+        errors: Penanganan error encoding ('strict', 'ignore', ...)
+    
+    Returns:
+        Tuple (nama_kolom, list kolom), atau None jika file berisi field
+        ber-quote dengan baris baru sehingga harus dibaca serial
+    """
+    workers = workers or os.cpu_count() or 1
+    schema = _infer_csv_schema(filepath, encoding, errors)
+    if schema is None:
+        return [], []
+    names, types = schema
+    
+    tasks = [(filepath, start, end, len(names), types, encoding, errors)
+             for start, end in split_csv_ranges(filepath, workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_parse_csv_range, tasks))
+    if any(part is None for part in parts):
+        return None
+    
+    return names, [_concat_columns(column_parts) for column_parts in zip(*parts)]
+
+
+def _load_csv_parallel(filepath, workers=1, errors='strict'):
+    """
+    Mencoba parsing paralel jika workers > 1 (atau None) dan file cukup besar.
+    
+    Returns:
+        Tuple (nama_kolom, list kolom), atau None jika harus dibaca serial
+    """
+    if workers is not None and workers <= 1:
+        return None
+    if os.path.getsize(filepath) < PARALLEL_LOAD_MIN_BYTES:
+        return None
+    
+    result = load_csv_columns_parallel(filepath, workers, errors=errors)
+    if result is None:
+        print("Info: field CSV berisi baris baru, memakai pembacaan serial.")
+    return result
+
+def iter_products_from_csv(filepath, batch_size=CSV_BATCH_SIZE):
+    """
+    Membaca file CSV secara streaming sebagai generator dictionary produk.
+    
+    Args:
+        filepath: Path ke file CSV
+        batch_size: Jumlah baris per batch baca
+    
+    Yields:
+        Dictionary produk
+    """
+    for names, columns in iter_csv_batches(filepath, batch_size):
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+def _report_load(filepath, count, elapsed):
+    """Mencetak throughput pemuatan CSV."""
+    rate = count / elapsed if elapsed > 0 else float('inf')
+    print(f"Memuat {count:,} baris dari '{filepath}' dalam {elapsed:.3f} s ({rate:,.0f} baris/detik)")
+
+
+def load_products_from_csv(filepath, report=False, workers=1):
     """
     Membaca data produk dari file CSV.
     
     Args:
         filepath: Path ke file CSV
+        report: True untuk mencetak jumlah baris per detik
+        workers: Jumlah proses parsing (>1 atau None untuk parsing paralel)
     
     Returns:
         List dictionary produk
     """
     products = []
+    start_time = time.perf_counter()
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                product = {}
-                for key, value in row.items():
-                    # Clean key name
-                    clean_key = key.strip().lower()
-                    
-                    # Coba konversi ke numerik jika memungkinkan
-                    try:
-                        if '.' in value:
-                            product[clean_key] = float(value)
-                        else:
-                            product[clean_key] = int(value)
-                    except (ValueError, TypeError):
-                        product[clean_key] = value.strip() if value else ''
-                
-                products.append(product)
+        parallel = _load_csv_parallel(filepath, workers)
+        if parallel is not None:
+            names, columns = parallel
+            products = [dict(zip(names, values)) for values in zip(*columns)]
+        else:
+            for names, columns in iter_csv_batches(filepath):
+                products.extend(dict(zip(names, values)) for values in zip(*columns))
     except FileNotFoundError:
         print(f"Error: File '{filepath}' tidak ditemukan.")
     except Exception as e:
         print(f"Error membaca file: {e}")
     
+    if report:
+        _report_load(filepath, len(products), time.perf_counter() - start_time)
     return products
 
 
+def load_product_table_from_csv(filepath, report=False, errors='strict', workers=1):
+    """
+    Membaca file CSV langsung ke ProductTable kolumnar (tanpa dict per baris).
+    
+    Args:
+        filepath: Path ke file CSV
+        report: True untuk mencetak jumlah baris per detik
+        errors: Penanganan error encoding ('strict', 'ignore', ...)
+        workers: Jumlah proses parsing (>1 atau None untuk parsing paralel)
+    
+    Returns:
+        ProductTable (kosong jika file gagal dibaca)
+    """
+    merged = {}
+    start_time = time.perf_counter()
+    try:
+        parallel = _load_csv_parallel(filepath, workers, errors)
+        if parallel is not None:
+            merged = dict(zip(*parallel))
+        else:
+            for names, columns in iter_csv_batches(filepath, errors=errors):
+                for name, values in zip(names, columns):
+                    merged.setdefault(name, []).extend(values)
+    except FileNotFoundError:
+        print(f"Error: File '{filepath}' tidak ditemukan.")
+        merged = {}
+    except Exception as e:
+        print(f"Error membaca file: {e}")
+        merged = {}
+    
+    table = ProductTable(merged)
+    if report:
+        _report_load(filepath, len(table), time.perf_counter() - start_time)
+    return table
+
+
 def save_products_to_csv(products, filepath):
     """
     Menyimpan data produk ke file CSV.
     
     Args:
-        products: List dictionary produk
+        products: List dictionary produk atau ProductTable
         filepath: Path ke file CSV
     """
     if not products:
@@ -59,6 +432,15 @@ def save_products_to_csv(products, filepath):
         return
     
     try:
+        if isinstance(products, ProductTable):
+            # Tabel kolumnar: tulis tuple per baris langsung dari kolom
+            with open(filepath, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(products.column_names())
+                writer.writerows(products.iter_tuples())
+            print(f"Data berhasil disimpan ke '{filepath}'")
+            return
+        
         fieldnames = products[0].keys()
         with open(filepath, 'w', newline='', encoding='utf-8') as file:
             writer = csv.DictWriter(file, fieldnames=fieldnames)
@@ -69,39 +451,551 @@ def save_products_to_csv(products, filepath):
         print(f"Error menyimpan file: {e}")
 
 
-def generate_random_products(n):
+# Jumlah baris yang dikumpulkan per blok saat ekspor streaming
+EXPORT_CHUNK_SIZE = 65536
+
+# Tingkat kompresi gzip ekspor (1 = tercepat, 9 = terkecil)
+EXPORT_GZIP_LEVEL = 6
+
+
+def iter_ordered_rows(products, names, perm=None):
     """
-    Menghasilkan n produk random untuk testing.
+    Menghasilkan baris (list/tuple nilai) sesuai urutan perm, blok demi blok,
+    tanpa membuat list produk terurut.
     
     Args:
-        n: Jumlah produk yang akan dibuat
+        products: List dictionary produk, ProductTable, atau iterable baris dict
+        names: Daftar kolom yang diambil
+        perm: Iterable indeks baris (None: urutan asli)
+    
+    Yields:
+        Tuple/list nilai sesuai urutan names
+    """
+    if isinstance(products, ProductTable):
+        columns = [products.column(name) for name in names]
+        if perm is None:
+            yield from zip(*columns)
+            return
+        order = iter(perm)
+        while True:
+            chunk = list(islice(order, EXPORT_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield from zip(*([column[i] for i in chunk] for column in columns))
+    
+    rows = products if perm is None else (products[i] for i in perm)
+    for row in rows:
+        yield [row.get(name, '') for name in names]
+
+
+def open_export_file(filepath, compress=None, encoding='utf-8'):
+    """
+    Membuka file teks untuk ekspor CSV dengan buffer tulis besar.
+    
+    Args:
+        filepath: Path file output
+        compress: True untuk gzip, None untuk menebak dari ekstensi '.gz'
+        encoding: Encoding file
     
     Returns:
-        List dictionary produk
+        File object teks (mode tulis)
     """
-    product_names = [
-        "Laptop", "Mouse", "Keyboard", "Monitor", "Headset",
-        "Speaker", "Webcam", "SSD", "RAM", "Processor",
-        "Motherboard", "VGA Card", "Power Supply", "Casing", "Cooler",
-        "Router", "Switch Hub", "UPS", "External HDD", "Flash Drive",
-        "Printer", "Scanner", "Projector", "Tablet", "Smartphone"
-    ]
+    if compress is None:
+        compress = filepath.endswith('.gz')
+    if compress:
+        return gzip.open(filepath, 'wt', compresslevel=EXPORT_GZIP_LEVEL,
+                         encoding=encoding, newline='')
+    return open(filepath, 'w', newline='', encoding=encoding, buffering=CSV_BUFFER_SIZE)
+
+
+def export_sorted_csv(products, filepath, perm=None, columns=None, compress=None, report=True):
+    """
+    Mengekspor data ke CSV secara streaming dalam urutan permutasi.
     
-    brands = ["Tech", "Pro", "Max", "Ultra", "Elite", "Premium", "Basic", "Advanced"]
+    Baris ditulis langsung dari data sumber mengikuti perm (hasil argsort),
+    sehingga list produk terurut tidak perlu dibuat di memori.
     
-    products = []
-    for i in range(1, n + 1):
-        name_base = random.choice(product_names)
-        brand = random.choice(brands)
+    Args:
+        products: List dictionary produk, ProductTable, atau iterable/generator baris dict
+        filepath: Path file output ('.gz' otomatis dikompres gzip)
+        perm: List indeks baris dalam urutan terurut (None: urutan asli)
+        columns: Daftar kolom yang diekspor (default: semua kolom)
+        compress: True/False untuk memaksa gzip; None menebak dari ekstensi
+        report: True untuk mencetak throughput
+    
+    Returns:
+        Jumlah baris yang ditulis
+    """
+    start_time = time.perf_counter()
+    
+    if not isinstance(products, (list, tuple, ProductTable)):
+        # Generator: baris pertama dipakai untuk menentukan header
+        products = iter(products)
+        first = next(products, None)
+        if first is None:
+            print("Tidak ada data untuk disimpan.")
+            return 0
+        names = columns or list(first.keys())
+        counter = count()
+        rows = iter_ordered_rows(chain([first], products), names)
+        rows = (row for row, _ in zip(rows, counter))
+    else:
+        if not products:
+            print("Tidak ada data untuk disimpan.")
+            return 0
+        names = columns or get_column_names(products)
+        counter = None
+        rows = iter_ordered_rows(products, names, perm)
+    
+    with open_export_file(filepath, compress) as file:
+        writer = csv.writer(file)
+        writer.writerow(names)
+        writer.writerows(rows)
+    
+    if counter is not None:
+        total = next(counter)
+    else:
+        total = len(products) if perm is None else len(perm)
+    
+    if report:
+        elapsed = time.perf_counter() - start_time
+        size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        rate = total / elapsed if elapsed > 0 else float('inf')
+        throughput = size_mb / elapsed if elapsed > 0 else 0.0
+        print(f"Ekspor selesai: {total:,} baris ke '{filepath}' ({size_mb:,.1f} MB) "
+              f"dalam {elapsed:.3f} s ({rate:,.0f} baris/detik, {throughput:,.1f} MB/detik)")
+    return total
+
+
+# Batas memori default sort eksternal (MB) dan jumlah run maksimum per penggabungan
+EXTERNAL_SORT_MEMORY_MB = 64
+EXTERNAL_MERGE_FAN_IN = 64
+
+# Jumlah baris per blok pickle di file run sementara
+RUN_BLOCK_SIZE = 8192
+
+
+def _external_key_func(names, specs):
+    """
+    Membuat fungsi kunci baris (tuple nilai) untuk sort eksternal.
+    Fungsi yang sama dipakai untuk mengurutkan chunk dan menggabungkan run,
+    sehingga urutan keduanya selalu konsisten.
+    
+    Returns:
+        Tuple (key_func, reverse)
+    """
+    positions = [names.index(column) for column, _ in specs]
+    return make_row_key_func(positions, [desc for _, desc in specs])
+
+
+def _argsort_chunk(algorithm, keys, reverse, engine_options=None):
+    """
+    Mengurutkan kunci satu chunk sort eksternal dengan engine yang dipilih.
+    
+    Kunci sort eksternal berupa tuple bertag dari make_row_key_func, yang tidak
+    bisa dijadikan array NumPy. Engine NumPy hanya dipakai untuk satu kolom
+    bertipe seragam (nilai aslinya yang diurutkan); selain itu memakai Introsort,
+    atau sorted() bawaan untuk varian stabil, seperti fallback numpy_sort.
+    
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    if algorithm not in ('numpy', 'numpy_stable'):
+        return get_engine(algorithm)(keys, reverse=reverse, **(engine_options or {}))
+    
+    if keys and isinstance(keys[0][0], int) and len({key[0] for key in keys}) == 1:
+        return get_engine(algorithm)([key[1] for key in keys], reverse=reverse)
+    if algorithm == 'numpy_stable':
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    return get_engine('introsort')(keys, reverse=reverse)
+
+
+def _estimate_rows_per_chunk(filepath, column_count, memory_budget_mb):
+    """Memperkirakan jumlah baris per chunk dari rata-rata panjang baris file."""
+    with open(filepath, 'rb') as file:
+        sample = file.read(1 << 16)
+    lines = max(sample.count(b'\n'), 1)
+    avg_line = len(sample) / lines
+    
+    # Perkiraan memori objek Python per baris: tuple, nilai per kolom, kunci, dan permutasi
+    row_bytes = 200 + 60 * column_count + 2 * avg_line
+    return max(1000, int(memory_budget_mb * 1024 * 1024 / row_bytes))
+
+
+def _write_run(rows, directory, index):
+    """Menulis satu run terurut ke file sementara dalam blok pickle."""
+    path = os.path.join(directory, f'run_{index:06d}.bin')
+    with open(path, 'wb') as file:
+        for start in range(0, len(rows), RUN_BLOCK_SIZE):
+            pickle.dump(rows[start:start + RUN_BLOCK_SIZE], file, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    """Membaca kembali baris dari file run secara streaming."""
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                block = pickle.load(file)
+            except EOFError:
+                return
+            yield from block
+
+
+def external_sort_csv(input_path, output_path, sort_by='price', reverse=False,
+                      memory_budget_mb=EXTERNAL_SORT_MEMORY_MB, algorithm='introsort',
+                      engine_options=None, temp_dir=None, report=True):
+    """
+    Mengurutkan file CSV yang lebih besar dari RAM (external merge sort).
+    
+    File dibaca per chunk sesuai batas memori, setiap chunk diurutkan dengan
+    engine Quick Sort proyek, ditulis sebagai run sementara, lalu semua run
+    digabung k-way (heapq.merge) ke file CSV output.
+    
+    Args:
+        input_path: Path file CSV sumber
+        output_path: Path file CSV hasil
+        sort_by: Atribut pengurutan atau list spesifikasi multi-kolom
+        reverse: True untuk urutan descending
+        memory_budget_mb: Perkiraan batas memori untuk satu chunk (MB)
+        algorithm: Engine pengurutan chunk (lihat sort_engines.ENGINES)
+        engine_options: Argumen tambahan untuk engine (mis. workers untuk 'parallel')
+        temp_dir: Direktori untuk file run sementara (default: direktori temp sistem)
+        report: True untuk mencetak progres dan throughput
+    
+    Returns:
+        Jumlah baris yang ditulis
+    """
+    get_engine(algorithm)
+    specs = parse_sort_spec(sort_by, reverse)
+    start_time = time.perf_counter()
+    total_rows = 0
+    names = None
+    
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs = []
+        key_func = None
+        
+        # Tahap 1: baca per chunk, urutkan, tulis run terurut
+        with open(input_path, 'r', newline='', encoding='utf-8') as file:
+            header = next(csv.reader(file), None)
+        if header is None:
+            return 0
+        rows_per_chunk = _estimate_rows_per_chunk(input_path, len(header), memory_budget_mb)
+        
+        for names, columns in iter_csv_batches(input_path, batch_size=rows_per_chunk):
+            if key_func is None:
+                missing = [column for column, _ in specs if column not in names]
+                if missing:
+                    raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+                key_func, merge_reverse = _external_key_func(names, specs)
+            
+            rows = list(zip(*columns))
+            del columns
+            keys = [key_func(row) for row in rows]
+            perm = _argsort_chunk(algorithm, keys, merge_reverse, engine_options)
+            runs.append(_write_run([rows[i] for i in perm], directory, len(runs)))
+            total_rows += len(rows)
+            
+            if report:
+                print(f"  Run {len(runs)}: {len(rows):,} baris diurutkan")
         
-        product = {
-            "id": i,
-            "name": f"{name_base} {brand} {random.randint(1, 999)}",
-            "price": random.randint(50000, 20000000),
-            "stock": random.randint(0, 100)
-        }
-        products.append(product)
+        run_count = len(runs)
+        
+        # Tahap 2: gabungkan run bertahap jika jumlahnya melebihi fan-in
+        while len(runs) > EXTERNAL_MERGE_FAN_IN:
+            merged_runs = []
+            for start in range(0, len(runs), EXTERNAL_MERGE_FAN_IN):
+                group = runs[start:start + EXTERNAL_MERGE_FAN_IN]
+                merged = heapq.merge(*(_read_run(p) for p in group), key=key_func, reverse=merge_reverse)
+                path = os.path.join(directory, f'merge_{len(runs)}_{start:06d}.bin')
+                with open(path, 'wb') as out:
+                    block = []
+                    for row in merged:
+                        block.append(row)
+                        if len(block) == RUN_BLOCK_SIZE:
+                            pickle.dump(block, out, pickle.HIGHEST_PROTOCOL)
+                            block = []
+                    if block:
+                        pickle.dump(block, out, pickle.HIGHEST_PROTOCOL)
+                for p in group:
+                    os.remove(p)
+                merged_runs.append(path)
+            runs = merged_runs
+        
+        # Tahap 3: k-way merge akhir langsung ke CSV output
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_BUFFER_SIZE) as out:
+            writer = csv.writer(out)
+            writer.writerow(names or [name.strip().lower() for name in header])
+            if runs:
+                writer.writerows(heapq.merge(*(_read_run(p) for p in runs),
+                                             key=key_func, reverse=merge_reverse))
+    
+    if report:
+        elapsed = time.perf_counter() - start_time
+        rate = total_rows / elapsed if elapsed > 0 else float('inf')
+        print(f"Sort eksternal selesai: {total_rows:,} baris, {run_count} run, "
+              f"{elapsed:.3f} s ({rate:,.0f} baris/detik) -> '{output_path}'")
+    return total_rows
+
+
+PRODUCT_NAMES = [
+    "Laptop", "Mouse", "Keyboard", "Monitor", "Headset",
+    "Speaker", "Webcam", "SSD", "RAM", "Processor",
+    "Motherboard", "VGA Card", "Power Supply", "Casing", "Cooler",
+    "Router", "Switch Hub", "UPS", "External HDD", "Flash Drive",
+    "Printer", "Scanner", "Projector", "Tablet", "Smartphone"
+]
+
+BRANDS = ["Tech", "Pro", "Max", "Ultra", "Elite", "Premium", "Basic", "Advanced"]
+
+# Rentang nilai kolom hasil generate (inklusif)
+PRICE_RANGE = (50000, 20000000)
+STOCK_RANGE = (0, 100)
+MODEL_RANGE = (1, 999)
+
+# Distribusi nilai kolom numerik yang didukung generator
+DISTRIBUTIONS = ('uniform', 'zipf', 'few_unique')
+
+# Parameter distribusi Zipf (jumlah level harga dan eksponen) dan few_unique
+ZIPF_LEVELS = 1000
+ZIPF_EXPONENT = 1.2
+FEW_UNIQUE_COUNT = 5
+
+# Jumlah baris per chunk generate (satu seed turunan per chunk)
+GENERATE_CHUNK_SIZE = 100000
+
+
+def _chunk_seed(seed, index):
+    """Seed turunan (64-bit) untuk satu chunk agar hasil sama baik serial maupun paralel."""
+    if seed is None:
+        return None
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+def _zipf_weights(levels):
+    """Bobot kumulatif Zipf untuk peringkat 1..levels."""
+    weights = [1 / rank ** ZIPF_EXPONENT for rank in range(1, levels + 1)]
+    total = 0.0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+def _draw_column(rng, distribution, value_range, k):
+    """
+    Mengambil k nilai integer sekaligus dengan random.Random.
+    
+    Args:
+        rng: Instance random.Random
+        distribution: 'uniform', 'zipf' (sedikit nilai sangat sering), atau
+                      'few_unique' (hanya FEW_UNIQUE_COUNT nilai berbeda)
+        value_range: Tuple (minimum, maksimum) inklusif
+        k: Jumlah nilai
+    
+    Returns:
+        List integer
+    """
+    low, high = value_range
+    if distribution == 'uniform':
+        return rng.choices(range(low, high + 1), k=k)
+    if distribution == 'zipf':
+        # Level harga diacak agar harga yang paling sering muncul tidak selalu yang termurah
+        levels = min(ZIPF_LEVELS, high - low + 1)
+        values = rng.sample(range(low, high + 1), levels)
+        return rng.choices(values, cum_weights=_zipf_weights(levels), k=k)
+    if distribution == 'few_unique':
+        values = rng.sample(range(low, high + 1), min(FEW_UNIQUE_COUNT, high - low + 1))
+        return rng.choices(values, k=k)
+    raise ValueError(f"Distribusi '{distribution}' tidak dikenal (pilih: {', '.join(DISTRIBUTIONS)})")
+
+
+def _draw_column_numpy(rng, distribution, value_range, k):
+    """Versi NumPy dari _draw_column (rng berupa numpy.random.Generator)."""
+    low, high = value_range
+    if distribution == 'uniform':
+        return rng.integers(low, high + 1, size=k)
+    if distribution == 'zipf':
+        levels = min(ZIPF_LEVELS, high - low + 1)
+        values = low + rng.choice(high - low + 1, size=levels, replace=False)
+        weights = 1 / np.arange(1, levels + 1) ** ZIPF_EXPONENT
+        return rng.choice(values, size=k, p=weights / weights.sum())
+    if distribution == 'few_unique':
+        values = low + rng.choice(high - low + 1, size=min(FEW_UNIQUE_COUNT, high - low + 1),
+                                  replace=False)
+        return rng.choice(values, size=k)
+    raise ValueError(f"Distribusi '{distribution}' tidak dikenal (pilih: {', '.join(DISTRIBUTIONS)})")
+
+
+def _generate_chunk(task):
+    """
+    Membuat satu chunk produk dalam bentuk kolom (dapat dijalankan di proses worker).
+    
+    Args:
+        task: Tuple (start_id, k, seed, price_distribution, stock_distribution, use_numpy)
     
+    Returns:
+        Dictionary {nama kolom: array/list nilai}
+    """
+    start_id, k, seed, price_distribution, stock_distribution, use_numpy = task
+    ids = array('q', range(start_id, start_id + k))
+    
+    if use_numpy:
+        rng = np.random.default_rng(seed)
+        bases = rng.integers(0, len(PRODUCT_NAMES), size=k).tolist()
+        brands = rng.integers(0, len(BRANDS), size=k).tolist()
+        models = rng.integers(MODEL_RANGE[0], MODEL_RANGE[1] + 1, size=k).tolist()
+        names = [f"{PRODUCT_NAMES[b]} {BRANDS[r]} {m}" for b, r, m in zip(bases, brands, models)]
+        prices = array('q', _draw_column_numpy(rng, price_distribution, PRICE_RANGE, k)
+                       .astype(np.int64).tobytes())
+        stocks = array('q', _draw_column_numpy(rng, stock_distribution, STOCK_RANGE, k)
+                       .astype(np.int64).tobytes())
+    else:
+        rng = random.Random(seed)
+        # Satu panggilan choices() per kolom, bukan random.choice per baris
+        names = list(map('{} {} {}'.format,
+                         rng.choices(PRODUCT_NAMES, k=k),
+                         rng.choices(BRANDS, k=k),
+                         rng.choices(range(MODEL_RANGE[0], MODEL_RANGE[1] + 1), k=k)))
+        prices = array('q', _draw_column(rng, price_distribution, PRICE_RANGE, k))
+        stocks = array('q', _draw_column(rng, stock_distribution, STOCK_RANGE, k))
+    
+    return {'id': ids, 'name': names, 'price': prices, 'stock': stocks}
+
+
+def iter_product_chunks(n, seed=None, price_distribution='uniform', stock_distribution='uniform',
+                        workers=1, chunk_size=GENERATE_CHUNK_SIZE, use_numpy=None):
+    """
+    Menghasilkan n produk random per chunk kolom.
+    
+    Setiap chunk memakai seed turunannya sendiri, sehingga dengan seed yang sama
+    hasilnya identik baik dijalankan serial maupun paralel.
+    
+    Args:
+        n: Jumlah produk
+        seed: Seed random (None: tidak reproducible)
+        price_distribution: Distribusi harga ('uniform', 'zipf', 'few_unique')
+        stock_distribution: Distribusi stok ('uniform', 'zipf', 'few_unique')
+        workers: Jumlah proses untuk generate chunk secara paralel
+        chunk_size: Jumlah baris per chunk
+        use_numpy: True/False untuk memaksa backend; None memakai NumPy jika tersedia
+    
+    Yields:
+        Dictionary {nama kolom: array/list nilai} per chunk, urut berdasarkan id
+    """
+    for distribution in (price_distribution, stock_distribution):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Distribusi '{distribution}' tidak dikenal (pilih: {', '.join(DISTRIBUTIONS)})")
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ValueError("NumPy tidak terpasang")
+    
+    tasks = [(start + 1, min(chunk_size, n - start), _chunk_seed(seed, index),
+              price_distribution, stock_distribution, use_numpy)
+             for index, start in enumerate(range(0, n, chunk_size))]
+    
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _generate_chunk(task)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() menjaga urutan chunk sesuai id
+        yield from executor.map(_generate_chunk, tasks)
+
+
+def generate_product_table(n, seed=None, price_distribution='uniform', stock_distribution='uniform',
+                           workers=1, use_numpy=None):
+    """
+    Menghasilkan n produk random langsung ke ProductTable kolumnar.
+    
+    Args:
+        n: Jumlah produk
+        seed: Seed random untuk hasil yang reproducible
+        price_distribution: Distribusi harga ('uniform', 'zipf', 'few_unique')
+        stock_distribution: Distribusi stok ('uniform', 'zipf', 'few_unique')
+        workers: Jumlah proses untuk generate paralel
+        use_numpy: True/False untuk memaksa backend NumPy
+    
+    Returns:
+        ProductTable
+    """
+    merged = {}
+    for chunk in iter_product_chunks(n, seed, price_distribution, stock_distribution,
+                                     workers=workers, use_numpy=use_numpy):
+        for name, values in chunk.items():
+            if name in merged:
+                merged[name].extend(values)
+            else:
+                merged[name] = values
+    
+    return ProductTable(merged)
+
+
+def generate_products_to_csv(filepath, n, seed=None, price_distribution='uniform',
+                             stock_distribution='uniform', workers=1, compress=None,
+                             use_numpy=None, report=True):
+    """
+    Menghasilkan n produk random dan menuliskannya langsung ke CSV secara streaming
+    (hanya satu chunk per worker yang berada di memori).
+    
+    Args:
+        filepath: Path file output ('.gz' otomatis dikompres gzip)
+        n: Jumlah produk
+        seed: Seed random untuk hasil yang reproducible
+        price_distribution: Distribusi harga ('uniform', 'zipf', 'few_unique')
+        stock_distribution: Distribusi stok ('uniform', 'zipf', 'few_unique')
+        workers: Jumlah proses untuk generate paralel
+        compress: True/False untuk memaksa gzip; None menebak dari ekstensi
+        use_numpy: True/False untuk memaksa backend NumPy
+        report: True untuk mencetak throughput
+    
+    Returns:
+        Jumlah baris yang ditulis
+    """
+    start_time = time.perf_counter()
+    total = 0
+    with open_export_file(filepath, compress) as file:
+        writer = csv.writer(file)
+        header_written = False
+        for chunk in iter_product_chunks(n, seed, price_distribution, stock_distribution,
+                                         workers=workers, use_numpy=use_numpy):
+            if not header_written:
+                writer.writerow(list(chunk))
+                header_written = True
+            writer.writerows(zip(*chunk.values()))
+            total += len(chunk['id'])
+    
+    if report:
+        elapsed = time.perf_counter() - start_time
+        rate = total / elapsed if elapsed > 0 else float('inf')
+        print(f"Generate selesai: {total:,} produk ke '{filepath}' dalam {elapsed:.3f} s "
+              f"({rate:,.0f} baris/detik)")
+    return total
+
+
+def generate_random_products(n, seed=None, price_distribution='uniform',
+                             stock_distribution='uniform'):
+    """
+    Menghasilkan n produk random untuk testing.
+    
+    Args:
+        n: Jumlah produk yang akan dibuat
+        seed: Seed random untuk hasil yang reproducible (opsional)
+        price_distribution: Distribusi harga ('uniform', 'zipf', 'few_unique')
+        stock_distribution: Distribusi stok ('uniform', 'zipf', 'few_unique')
+    
+    Returns:
+        List dictionary produk
+    """
+    products = []
+    for chunk in iter_product_chunks(n, seed, price_distribution, stock_distribution):
+        products.extend({"id": i, "name": name, "price": price, "stock": stock}
+                        for i, name, price, stock in zip(*chunk.values()))
     return products
 
 
@@ -110,7 +1004,7 @@ def display_products(products, limit=None):
     Menampilkan daftar produk dalam format tabel.
     
     Args:
-        products: List dictionary produk
+        products: List dictionary produk atau ProductTable
         limit: Batasan jumlah produk yang ditampilkan
     """
     if not products:
@@ -149,16 +1043,175 @@ def get_column_names(products):
     Mendapatkan nama kolom dari data produk.
     
     Args:
-        products: List dictionary produk
+        products: List dictionary produk atau ProductTable
     
     Returns:
         List nama kolom
     """
+    if isinstance(products, ProductTable):
+        return products.column_names()
     if not products:
         return []
     return list(products[0].keys())
 
 
+
+def insert_product(table, product, indexes=()):
+    """
+    Menambahkan satu produk ke ProductTable dan ke setiap indeks terurut.
+    
+    Args:
+        table: ProductTable
+        product: Dictionary produk
+        indexes: Iterable SortedIndex yang harus tetap konsisten
+    
+    Returns:
+        Indeks baris produk baru
+    """
+    row = table.append_row(product)
+    for index in indexes:
+        index.insert_row(row)
+    return row
+
+
+def update_product(table, row, changes, indexes=()):
+    """
+    Mengubah nilai kolom satu produk. Hanya indeks yang memakai kolom yang
+    berubah yang diperbarui (hapus entri lama, sisipkan entri baru).
+    
+    Args:
+        table: ProductTable
+        row: Indeks baris
+        changes: Dictionary {nama kolom: nilai baru}
+        indexes: Iterable SortedIndex yang harus tetap konsisten
+    """
+    if not 0 <= row < len(table):
+        raise IndexError("Indeks baris di luar jangkauan")
+    
+    affected = [index for index in indexes if index.depends_on(changes)]
+    for index in affected:
+        index.discard_row(row)
+    try:
+        table.update_row(row, changes)
+    finally:
+        for index in affected:
+            index.insert_row(row)
+
+
+def delete_product(table, row, indexes=()):
+    """
+    Menghapus satu produk. Baris terakhir dipindah ke posisi yang dihapus,
+    sehingga indeks cukup memperbarui dua entri.
+    
+    Args:
+        table: ProductTable
+        row: Indeks baris
+        indexes: Iterable SortedIndex yang harus tetap konsisten
+    
+    Returns:
+        Indeks lama baris yang dipindah ke posisi row, atau None
+    """
+    indexes = list(indexes)
+    last = len(table) - 1
+    if not 0 <= row <= last:
+        raise IndexError("Indeks baris di luar jangkauan")
+    
+    for index in indexes:
+        index.discard_row(row)
+        if row != last:
+            index.discard_row(last)
+    moved = table.delete_row(row)
+    if moved is not None:
+        for index in indexes:
+            index.insert_row(row)
+    return moved
+
+
+
+# Jumlah baris default per halaman hasil query
+QUERY_PAGE_SIZE = 50
+
+
+def _coerce_query_value(table, column, value):
+    """Mengubah nilai query berupa teks menjadi angka jika kolomnya numerik."""
+    values = table.column(column)
+    if isinstance(value, str) and isinstance(values, (array, memoryview)):
+        return convert_cell(value)
+    return value
+
+
+def column_index_key(column):
+    """Kunci indeks ascending satu kolom di dictionary indexes (dipakai query untuk kedua arah)."""
+    return tuple(parse_sort_spec(column))
+
+
+def find_column_index(indexes, column):
+    """
+    Mencari indeks satu kolom di dictionary indexes, ascending atau descending.
+
+    Returns:
+        SortedIndex, atau None jika kolom belum diindeks
+    """
+    index = indexes.get(column_index_key(column))
+    if index is None:
+        index = indexes.get(tuple(parse_sort_spec(column, True)))
+    return index
+
+
+def query_products(table, column, eq=None, low=None, high=None, prefix=None,
+                   include_low=True, include_high=True, offset=0, limit=QUERY_PAGE_SIZE,
+                   reverse=False, indexes=None):
+    """
+    Menjawab predikat kesamaan, rentang, atau prefix pada satu kolom dengan
+    binary search pada indeks terurut kolom tersebut (O(log n + k)).
+    Indeks kolom (ascending atau descending) yang sudah ada di indexes dipakai
+    ulang untuk kedua arah hasil; jika belum ada, indeks ascending sementara
+    dibuat untuk query ini saja (indexes tidak diubah).
+    
+    Args:
+        table: ProductTable
+        column: Nama kolom yang difilter
+        eq: Nilai yang dicari (kolom == eq)
+        low: Batas bawah rentang (None: tanpa batas)
+        high: Batas atas rentang (None: tanpa batas)
+        prefix: Awalan teks (tanpa membedakan huruf besar/kecil)
+        include_low: False untuk kolom > low (default >=)
+        include_high: False untuk kolom < high (default <=)
+        offset: Jumlah baris hasil yang dilewati
+        limit: Jumlah baris hasil maksimum
+        reverse: True untuk hasil urut descending
+        indexes: Dictionary {tuple spesifikasi: SortedIndex} untuk dipakai ulang
+    
+    Returns:
+        Tuple (jumlah baris yang cocok, list indeks baris halaman ini)
+    """
+    if column not in table.column_names():
+        raise ValueError(f"Kolom tidak ditemukan: {column}")
+    
+    index = find_column_index(indexes or {}, column)
+    if index is None:
+        index = SortedIndex(table, column)
+    
+    if prefix is not None:
+        start, stop = index.prefix_range(str(prefix))
+    elif eq is not None:
+        value = _coerce_query_value(table, column, eq)
+        start, stop = index.value_range(value, value)
+    else:
+        start, stop = index.value_range(_coerce_query_value(table, column, low),
+                                        _coerce_query_value(table, column, high),
+                                        include_low, include_high)
+    
+    # Arah hasil berbeda dengan arah indeks: rentang dibaca dari belakang
+    offset, limit = max(offset, 0), max(limit, 0)
+    if index.reverse == bool(reverse):
+        rows = list(index.iter_rows(start + offset, min(stop, start + offset + limit)))
+    else:
+        end = stop - offset
+        rows = list(index.iter_rows(max(start, end - limit), end, backwards=True)) if end > start else []
+    return stop - start, rows
+
+
 if __name__ == "__main__":
     # Demo
     print("=== Product Data Handler Demo ===\n")
@@ -0,0 +1,348 @@
+"""
+Product Table
+Penyimpanan data produk secara kolumnar: setiap kolom numerik disimpan sebagai
+array.array bertipe (int64/float64) dan kolom teks sebagai list string yang di-dedup,
+jauh lebih hemat memori daripada satu dict per baris.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+
+# Typecode array.array untuk setiap tipe kolom
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+
+# Rentang nilai kolom int64
+_INT_MIN, _INT_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class ProductRow(Mapping):
+    """
+    View satu baris ProductTable yang berperilaku seperti dict read-only
+    (mendukung row['price'], row.get(), keys(), items()).
+    """
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._table._columns[key][self._index]
+
+    def __iter__(self):
+        return iter(self._table._names)
+
+    def __len__(self):
+        return len(self._table._names)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        """Mengubah view menjadi dict biasa (mis. untuk JSON)."""
+        return {name: column[self._index] for name, column in self._table._columns.items()}
+
+
+def _build_column(values):
+    """
+    Membuat kolom ringkas dari list nilai.
+
+    Returns:
+        array('q') untuk bilangan bulat, array('d') untuk bilangan real,
+        list string ter-dedup untuk teks, atau list biasa untuk kolom campuran
+    """
+    types = set(map(type, values))
+    if types <= {int, bool}:
+        try:
+            return array(INT_TYPECODE, values)
+        except OverflowError:
+            return list(values)
+    if types <= {int, float, bool}:
+        return array(FLOAT_TYPECODE, values)
+    if types <= {str}:
+        # String yang sama (mis. nama merek berulang) hanya disimpan sekali
+        pool = {}
+        return [pool.setdefault(v, v) for v in values]
+    return list(values)
+
+
+def _exact_float(number):
+    """True jika bilangan bulat bisa disimpan sebagai float64 tanpa berubah."""
+    try:
+        return float(number) == number
+    except OverflowError:
+        return False
+
+
+def _typed_value(name, typecode, value):
+    """
+    Mengonversi nilai untuk kolom array bertipe tanpa kehilangan informasi.
+    Teks angka dikonversi seperti sel CSV ('.' berarti bilangan real).
+
+    Args:
+        name: Nama kolom (untuk pesan error)
+        typecode: Typecode kolom (INT_TYPECODE atau FLOAT_TYPECODE)
+        value: Nilai baru
+
+    Returns:
+        Tuple (nilai, typecode); typecode FLOAT_TYPECODE untuk bilangan real
+        pada kolom bilangan bulat (kolom perlu dipromosikan ke float)
+
+    Raises:
+        ValueError: Jika nilai bukan angka atau tidak bisa disimpan tanpa berubah
+    """
+    number = value
+    if isinstance(number, str):
+        text = number.strip()
+        try:
+            number = float(text) if '.' in text else int(text)
+        except ValueError:
+            number = None
+    if not isinstance(number, (int, float)):
+        raise ValueError(f"Kolom '{name}' membutuhkan angka, bukan {value!r}")
+
+    if typecode == INT_TYPECODE:
+        if isinstance(number, float) and number.is_integer() and _INT_MIN <= number <= _INT_MAX:
+            number = int(number)
+        if isinstance(number, float):
+            return number, FLOAT_TYPECODE
+        if not _INT_MIN <= number <= _INT_MAX:
+            raise ValueError(f"Nilai {value!r} di luar rentang int64 kolom '{name}'")
+        return int(number), INT_TYPECODE
+
+    if isinstance(number, int) and not _exact_float(number):
+        raise ValueError(f"Nilai {value!r} tidak bisa disimpan tepat di kolom float '{name}'")
+    return float(number), FLOAT_TYPECODE
+
+
+class ProductTable:
+    """
+    Tabel produk kolumnar.
+
+    Mendukung len(), iterasi baris, table[i] (ProductRow), table[a:b] (list ProductRow),
+    dan akses kolom langsung lewat table.column(nama).
+    """
+
+    def __init__(self, columns):
+        """
+        Args:
+            columns: Dictionary {nama kolom: sequence nilai}, urutan key = urutan kolom
+        """
+        self._names = list(columns)
+        self._columns = {name: _build_column(list(values)) if isinstance(values, list) else values
+                         for name, values in columns.items()}
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Semua kolom ProductTable harus memiliki panjang yang sama")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_dicts(cls, products):
+        """
+        Membuat ProductTable dari list dictionary produk.
+
+        Args:
+            products: List dictionary produk
+
+        Returns:
+            ProductTable
+        """
+        if not products:
+            return cls({})
+        names = list(products[0].keys())
+        return cls({name: [p.get(name) for p in products] for name in names})
+
+    def to_dicts(self):
+        """Mengubah tabel menjadi list dictionary produk."""
+        return [row.to_dict() for row in self]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ProductRow(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Indeks baris di luar jangkauan")
+        return ProductRow(self, index)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield ProductRow(self, i)
+
+    def column_names(self):
+        """Mengembalikan list nama kolom."""
+        return list(self._names)
+
+    def column(self, name):
+        """
+        Mengambil satu kolom secara langsung (tanpa membuat objek baris).
+
+        Args:
+            name: Nama kolom
+
+        Returns:
+            array.array atau list nilai kolom, None jika kolom tidak ada
+        """
+        return self._columns.get(name)
+
+    def _writable_column(self, name):
+        """
+        Mengembalikan kolom yang bisa diubah. Kolom read-only (mis. memoryview
+        dari snapshot mmap) disalin sekali saat pertama kali diubah.
+        """
+        column = self._columns[name]
+        if isinstance(column, (array, list)):
+            return column
+        if isinstance(column, memoryview):
+            writable = array(column.format)
+            writable.frombytes(column.cast('B'))
+        else:
+            writable = list(column)
+        self._columns[name] = writable
+        return writable
+
+    def _column_typecode(self, name):
+        """Typecode kolom numerik bertipe, atau None untuk kolom list."""
+        column = self._columns[name]
+        if isinstance(column, array):
+            return column.typecode
+        if isinstance(column, memoryview):
+            return column.format
+        return None
+
+    def _coerce_values(self, values):
+        """
+        Memeriksa dan mengonversi nilai untuk beberapa kolom sebelum tabel diubah,
+        sehingga nilai yang tidak valid tidak meninggalkan baris setengah jadi.
+
+        Returns:
+            Tuple (dictionary nilai hasil konversi, list kolom bilangan bulat
+            yang perlu dipromosikan ke float)
+
+        Raises:
+            ValueError: Jika nilai tidak cocok dengan tipe kolomnya
+        """
+        coerced = {}
+        promote = []
+        for name, value in values.items():
+            typecode = self._column_typecode(name)
+            if typecode is None:
+                coerced[name] = value
+                continue
+            coerced[name], needed = _typed_value(name, typecode, value)
+            if needed != typecode:
+                column = self._columns[name]
+                if not all(map(_exact_float, column)):
+                    raise ValueError(f"Kolom '{name}' tidak bisa diubah ke float tanpa kehilangan presisi")
+                promote.append(name)
+        return coerced, promote
+
+    def _promote_to_float(self, name):
+        """Mengubah kolom bilangan bulat menjadi kolom float (promosi int -> float)."""
+        self._columns[name] = array(FLOAT_TYPECODE, self._columns[name])
+
+    def _check_row(self, index):
+        """Memastikan indeks baris valid."""
+        if not 0 <= index < self._length:
+            raise IndexError("Indeks baris di luar jangkauan")
+
+    def _check_columns(self, values):
+        """Menolak nama kolom yang tidak ada di tabel."""
+        unknown = [name for name in values if name not in self._columns]
+        if unknown:
+            raise ValueError(f"Kolom tidak dikenal: {', '.join(map(str, unknown))}")
+
+    def append_row(self, values):
+        """
+        Menambahkan satu baris di akhir tabel.
+
+        Args:
+            values: Dictionary {nama kolom: nilai}; kolom yang tidak ada bernilai None
+                    (kolom numerik bertipe wajib diisi)
+
+        Returns:
+            Indeks baris baru
+
+        Raises:
+            ValueError: Jika kolom tidak dikenal atau nilai tidak cocok dengan tipe kolom
+        """
+        if not self._names:
+            self._names = list(values)
+            self._columns = {name: [] for name in self._names}
+        self._check_columns(values)
+
+        coerced, promote = self._coerce_values({name: values.get(name) for name in self._names})
+        for name in promote:
+            self._promote_to_float(name)
+        for name in self._names:
+            self._writable_column(name).append(coerced[name])
+        self._length += 1
+        return self._length - 1
+
+    def update_row(self, index, changes):
+        """
+        Mengubah nilai beberapa kolom pada satu baris.
+
+        Args:
+            index: Indeks baris
+            changes: Dictionary {nama kolom: nilai baru}
+
+        Raises:
+            ValueError: Jika kolom tidak dikenal atau nilai tidak cocok dengan tipe kolom
+        """
+        self._check_row(index)
+        self._check_columns(changes)
+        coerced, promote = self._coerce_values(changes)
+        for name in promote:
+            self._promote_to_float(name)
+        for name, value in coerced.items():
+            self._writable_column(name)[index] = value
+
+    def delete_row(self, index):
+        """
+        Menghapus satu baris dalam O(1): baris terakhir dipindah ke posisi yang dihapus.
+
+        Args:
+            index: Indeks baris
+
+        Returns:
+            Indeks lama baris yang dipindah, atau None jika yang dihapus baris terakhir
+        """
+        self._check_row(index)
+        last = self._length - 1
+        for name in self._names:
+            column = self._writable_column(name)
+            if index != last:
+                column[index] = column[last]
+            column.pop()
+        self._length -= 1
+        return last if index != last else None
+
+    def iter_tuples(self):
+        """Iterasi baris sebagai tuple nilai sesuai urutan column_names()."""
+        return zip(*(self._columns[name] for name in self._names))
+
+    def memory_usage(self):
+        """
+        Perkiraan memori yang dipakai kolom (byte).
+
+        Returns:
+            Jumlah byte
+        """
+        total = 0
+        for column in self._columns.values():
+            if isinstance(column, array):
+                total += len(column) * column.itemsize
+            elif hasattr(column, 'nbytes'):
+                # Kolom di atas buffer (mis. memoryview dari snapshot mmap)
+                total += column.nbytes
+            else:
+                total += sys.getsizeof(column)
+                total += sum(sys.getsizeof(v) for v in set(column))
+        return total
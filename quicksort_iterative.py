@@ -3,56 +3,106 @@ Quick Sort Iteratif
 Implementasi algoritma Quick Sort dengan pendekatan iteratif menggunakan stack eksplisit.
 """
 
-def partition(arr, low, high, key=None, reverse=False):
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+
+
+def partition(keys, perm, low, high, reverse=False):
     """
     Fungsi partisi untuk Quick Sort.
-    Memilih pivot (elemen terakhir) dan mempartisi array.
+    Memilih pivot (elemen terakhir) dan mempartisi array kunci beserta permutasinya.
     
     Args:
-        arr: List data yang akan dipartisi
+        keys: List kunci bertipe yang akan dipartisi
+        perm: List indeks baris yang ikut ditukar bersama keys
         low: Indeks awal
         high: Indeks akhir
-        key: Fungsi untuk mengambil nilai kunci dari elemen (opsional)
         reverse: True untuk urutan descending
     
     Returns:
         Indeks posisi pivot setelah partisi
     """
-    if key is None:
-        key = lambda x: x
-    
-    pivot_raw = key(arr[high])
-    # Convert to string for consistent comparison when types are mixed
-    pivot = str(pivot_raw) if pivot_raw is not None else ''
+    pivot = keys[high]
     i = low - 1
     
-    for j in range(low, high):
-        current_raw = key(arr[j])
-        current_val = str(current_raw) if current_raw is not None else ''
+    if reverse:
+        for j in range(low, high):
+            if keys[j] >= pivot:
+                i += 1
+                keys[i], keys[j] = keys[j], keys[i]
+                perm[i], perm[j] = perm[j], perm[i]
+    else:
+        for j in range(low, high):
+            if keys[j] <= pivot:
+                i += 1
+                keys[i], keys[j] = keys[j], keys[i]
+                perm[i], perm[j] = perm[j], perm[i]
+    
+    keys[i + 1], keys[high] = keys[high], keys[i + 1]
+    perm[i + 1], perm[high] = perm[high], perm[i + 1]
+    return i + 1
+
+
+def quick_sort_keys(keys, perm, low, high, reverse=False):
+    """
+    Inti Quick Sort Iteratif pada array kunci dan permutasi (in-place).
+    
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+        reverse: True untuk urutan descending
+    """
+    # Inisialisasi stack dengan range awal
+    stack = [(low, high)]
+    
+    # Proses selama stack tidak kosong
+    while stack:
+        # Pop dari stack
+        low, high = stack.pop()
         
-        if reverse:
-            condition = current_val >= pivot
-        else:
-            condition = current_val <= pivot
+        if low < high:
+            # Partisi dan dapatkan posisi pivot
+            pivot_index = partition(keys, perm, low, high, reverse)
             
-        if condition:
-            i += 1
-            arr[i], arr[j] = arr[j], arr[i]
+            # Push sub-array kiri ke stack (jika ada elemen)
+            if pivot_index - 1 > low:
+                stack.append((low, pivot_index - 1))
+            
+            # Push sub-array kanan ke stack (jika ada elemen)
+            if pivot_index + 1 < high:
+                stack.append((pivot_index + 1, high))
+
+
+def argsort_iterative(keys, reverse=False):
+    """
+    Mengurutkan array kunci (in-place) dan mengembalikan permutasi barisnya.
     
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+    
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    perm = list(range(len(keys)))
+    quick_sort_keys(keys, perm, 0, len(keys) - 1, reverse)
+    return perm
 
 
 def quick_sort_iterative(arr, key=None, reverse=False):
     """
     Implementasi Quick Sort Iteratif menggunakan stack eksplisit.
     
+    Kunci setiap elemen dihitung sekali di awal, kemudian array kunci
+    diurutkan bersama permutasi indeks yang akhirnya diterapkan ke arr.
+    
     Kompleksitas Waktu:
     - Best Case: O(n log n)
     - Average Case: O(n log n)
     - Worst Case: O(n²)
     
-    Kompleksitas Ruang: O(log n) untuk stack eksplisit
+    Kompleksitas Ruang: O(log n) untuk stack eksplisit, O(n) untuk array kunci
     
     Keunggulan dibanding rekursif:
     - Tidak terbatas oleh recursion depth limit Python
@@ -69,30 +119,9 @@ def quick_sort_iterative(arr, key=None, reverse=False):
     if len(arr) <= 1:
         return arr
     
-    # Inisialisasi stack dengan range awal
-    stack = []
-    low = 0
-    high = len(arr) - 1
-    
-    # Push range awal ke stack
-    stack.append((low, high))
-    
-    # Proses selama stack tidak kosong
-    while stack:
-        # Pop dari stack
-        low, high = stack.pop()
-        
-        if low < high:
-            # Partisi dan dapatkan posisi pivot
-            pivot_index = partition(arr, low, high, key, reverse)
-            
-            # Push sub-array kiri ke stack (jika ada elemen)
-            if pivot_index - 1 > low:
-                stack.append((low, pivot_index - 1))
-            
-            # Push sub-array kanan ke stack (jika ada elemen)
-            if pivot_index + 1 < high:
-                stack.append((pivot_index + 1, high))
+    keys = extract_keys(arr, key)
+    perm = argsort_iterative(keys, reverse=reverse)
+    arr[:] = apply_permutation(arr, perm)
     
     return arr
 
@@ -103,7 +132,8 @@ def sort_products_iterative(products, sort_by='price', reverse=False):
     
     Args:
         products: List dictionary produk
-        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll)
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
         reverse: True untuk urutan descending
     
     Returns:
@@ -112,16 +142,11 @@ def sort_products_iterative(products, sort_by='price', reverse=False):
     if not products:
         return products
     
-    # Buat salinan agar tidak mengubah data asli
-    products_copy = products.copy()
-    
-    # Tentukan key function berdasarkan atribut
-    if sort_by == 'name':
-        key_func = lambda x: x.get(sort_by, '').lower()
-    else:
-        key_func = lambda x: x.get(sort_by, 0)
+    # Kunci dihitung sekali per baris; data asli tidak diubah
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_iterative(keys, reverse=reverse)
     
-    return quick_sort_iterative(products_copy, key=key_func, reverse=reverse)
+    return apply_permutation(products, perm)
 
 
 if __name__ == "__main__":
@@ -3,56 +3,94 @@ Quick Sort Rekursif
 Implementasi algoritma Quick Sort dengan pendekatan rekursif untuk pengurutan data produk.
 """
 
-def partition(arr, low, high, key=None, reverse=False):
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+
+
+def partition(keys, perm, low, high, reverse=False):
     """
     Fungsi partisi untuk Quick Sort.
-    Memilih pivot (elemen terakhir) dan mempartisi array.
+    Memilih pivot (elemen terakhir) dan mempartisi array kunci beserta permutasinya.
     
     Args:
-        arr: List data yang akan dipartisi
+        keys: List kunci bertipe yang akan dipartisi
+        perm: List indeks baris yang ikut ditukar bersama keys
         low: Indeks awal
         high: Indeks akhir
-        key: Fungsi untuk mengambil nilai kunci dari elemen (opsional)
         reverse: True untuk urutan descending
     
     Returns:
         Indeks posisi pivot setelah partisi
     """
-    if key is None:
-        key = lambda x: x
-    
-    pivot_raw = key(arr[high])
-    # Convert to string for consistent comparison when types are mixed
-    pivot = str(pivot_raw) if pivot_raw is not None else ''
+    pivot = keys[high]
     i = low - 1
     
-    for j in range(low, high):
-        current_raw = key(arr[j])
-        current_val = str(current_raw) if current_raw is not None else ''
-        
-        if reverse:
-            condition = current_val >= pivot
-        else:
-            condition = current_val <= pivot
-            
-        if condition:
-            i += 1
-            arr[i], arr[j] = arr[j], arr[i]
-    
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    if reverse:
+        for j in range(low, high):
+            if keys[j] >= pivot:
+                i += 1
+                keys[i], keys[j] = keys[j], keys[i]
+                perm[i], perm[j] = perm[j], perm[i]
+    else:
+        for j in range(low, high):
+            if keys[j] <= pivot:
+                i += 1
+                keys[i], keys[j] = keys[j], keys[i]
+                perm[i], perm[j] = perm[j], perm[i]
+    
+    keys[i + 1], keys[high] = keys[high], keys[i + 1]
+    perm[i + 1], perm[high] = perm[high], perm[i + 1]
     return i + 1
 
 
+def quick_sort_keys(keys, perm, low, high, reverse=False):
+    """
+    Inti Quick Sort Rekursif pada array kunci dan permutasi (in-place).
+    
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+        reverse: True untuk urutan descending
+    """
+    if low < high:
+        # Partisi array dan dapatkan posisi pivot
+        pivot_index = partition(keys, perm, low, high, reverse)
+        
+        # Rekursif untuk sub-array kiri dan kanan
+        quick_sort_keys(keys, perm, low, pivot_index - 1, reverse)
+        quick_sort_keys(keys, perm, pivot_index + 1, high, reverse)
+
+
+def argsort_recursive(keys, reverse=False):
+    """
+    Mengurutkan array kunci (in-place) dan mengembalikan permutasi barisnya.
+    
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+    
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    perm = list(range(len(keys)))
+    quick_sort_keys(keys, perm, 0, len(keys) - 1, reverse)
+    return perm
+
+
 def quick_sort_recursive(arr, low=None, high=None, key=None, reverse=False):
     """
     Implementasi Quick Sort Rekursif.
     
+    Kunci setiap elemen dihitung sekali di awal, kemudian array kunci
+    diurutkan bersama permutasi indeks yang akhirnya diterapkan ke arr.
+    
     Kompleksitas Waktu:
     - Best Case: O(n log n)
     - Average Case: O(n log n)
     - Worst Case: O(n²)
     
-    Kompleksitas Ruang: O(log n) untuk call stack
+    Kompleksitas Ruang: O(log n) untuk call stack, O(n) untuk array kunci
     
     Args:
         arr: List data yang akan diurutkan
@@ -70,12 +108,10 @@ def quick_sort_recursive(arr, low=None, high=None, key=None, reverse=False):
         high = len(arr) - 1
     
     if low < high:
-        # Partisi array dan dapatkan posisi pivot
-        pivot_index = partition(arr, low, high, key, reverse)
-        
-        # Rekursif untuk sub-array kiri dan kanan
-        quick_sort_recursive(arr, low, pivot_index - 1, key, reverse)
-        quick_sort_recursive(arr, pivot_index + 1, high, key, reverse)
+        keys = extract_keys(arr[low:high + 1], key)
+        perm = list(range(low, high + 1))
+        quick_sort_keys(keys, perm, 0, len(keys) - 1, reverse)
+        arr[low:high + 1] = apply_permutation(arr, perm)
     
     return arr
 
@@ -86,7 +122,8 @@ def sort_products_recursive(products, sort_by='price', reverse=False):
     
     Args:
         products: List dictionary produk
-        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll)
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
         reverse: True untuk urutan descending
     
     Returns:
@@ -95,16 +132,11 @@ def sort_products_recursive(products, sort_by='price', reverse=False):
     if not products:
         return products
     
-    # Buat salinan agar tidak mengubah data asli
-    products_copy = products.copy()
-    
-    # Tentukan key function berdasarkan atribut
-    if sort_by == 'name':
-        key_func = lambda x: x.get(sort_by, '').lower()
-    else:
-        key_func = lambda x: x.get(sort_by, 0)
+    # Kunci dihitung sekali per baris; data asli tidak diubah
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_recursive(keys, reverse=reverse)
     
-    return quick_sort_recursive(products_copy, key=key_func, reverse=reverse)
+    return apply_permutation(products, perm)
 
 
 if __name__ == "__main__":
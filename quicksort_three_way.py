@@ -0,0 +1,169 @@
+"""
+Quick Sort Three-Way
+Implementasi Quick Sort dengan partisi tiga arah (Dutch National Flag / fat pivot)
+untuk data dengan banyak kunci duplikat.
+"""
+
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+from introsort import choose_pivot
+
+
+def partition_three_way(keys, perm, low, high, reverse=False):
+    """
+    Fungsi partisi tiga arah untuk Quick Sort.
+    Memakai keys[high] sebagai pivot (pemanggil memindahkan pivot pilihannya
+    ke sana) lalu membagi range menjadi tiga blok: lebih kecil, sama dengan,
+    dan lebih besar dari pivot.
+
+    Args:
+        keys: List kunci bertipe yang akan dipartisi
+        perm: List indeks baris yang ikut ditukar bersama keys
+        low: Indeks awal
+        high: Indeks akhir
+        reverse: True untuk urutan descending
+
+    Returns:
+        Tuple (lt, gt): blok keys[lt..gt] berisi semua kunci yang sama dengan pivot
+    """
+    pivot = keys[high]
+    lt = low
+    i = low
+    gt = high
+
+    while i <= gt:
+        current = keys[i]
+        if current == pivot:
+            i += 1
+        elif (current > pivot) if reverse else (current < pivot):
+            # Masuk ke blok kiri
+            keys[lt], keys[i] = current, keys[lt]
+            perm[lt], perm[i] = perm[i], perm[lt]
+            lt += 1
+            i += 1
+        else:
+            # Masuk ke blok kanan
+            keys[gt], keys[i] = current, keys[gt]
+            perm[gt], perm[i] = perm[i], perm[gt]
+            gt -= 1
+
+    return lt, gt
+
+
+def quick_sort_keys(keys, perm, low, high, reverse=False):
+    """
+    Inti Quick Sort Three-Way pada array kunci dan permutasi (in-place).
+    Blok kunci yang sama dengan pivot langsung selesai dalam satu partisi.
+    Pivot median-of-three/ninther mencegah O(n²) pada data yang sudah terurut.
+
+    Args:
+        keys: List kunci bertipe
+        perm: List indeks baris
+        low: Indeks awal
+        high: Indeks akhir
+        reverse: True untuk urutan descending
+    """
+    stack = [(low, high)]
+
+    while stack:
+        low, high = stack.pop()
+
+        if low < high:
+            # Pivot median-of-three/ninther dipindah ke akhir range
+            pivot_index = choose_pivot(keys, low, high)
+            keys[pivot_index], keys[high] = keys[high], keys[pivot_index]
+            perm[pivot_index], perm[high] = perm[high], perm[pivot_index]
+            lt, gt = partition_three_way(keys, perm, low, high, reverse)
+
+            # Blok tengah (lt..gt) sudah di posisi akhir
+            if lt - 1 > low:
+                stack.append((low, lt - 1))
+            if gt + 1 < high:
+                stack.append((gt + 1, high))
+
+
+def argsort_three_way(keys, reverse=False):
+    """
+    Mengurutkan array kunci (in-place) dan mengembalikan permutasi barisnya.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    perm = list(range(len(keys)))
+    quick_sort_keys(keys, perm, 0, len(keys) - 1, reverse)
+    return perm
+
+
+def quick_sort_three_way(arr, key=None, reverse=False):
+    """
+    Implementasi Quick Sort dengan partisi tiga arah.
+
+    Kompleksitas Waktu:
+    - Best Case: O(n) (semua kunci sama)
+    - Average Case: O(n log n), O(n log d) untuk d kunci berbeda
+    - Worst Case: O(n²) (jarang; data terurut tetap O(n log n) berkat pivot median)
+
+    Kompleksitas Ruang: O(log n) untuk stack eksplisit, O(n) untuk array kunci
+
+    Args:
+        arr: List data yang akan diurutkan
+        key: Fungsi untuk mengambil nilai kunci dari elemen
+        reverse: True untuk urutan descending
+
+    Returns:
+        List yang sudah diurutkan (in-place)
+    """
+    if len(arr) <= 1:
+        return arr
+
+    keys = extract_keys(arr, key)
+    perm = argsort_three_way(keys, reverse=reverse)
+    arr[:] = apply_permutation(arr, perm)
+
+    return arr
+
+
+def sort_products_three_way(products, sort_by='price', reverse=False):
+    """
+    Mengurutkan list produk menggunakan Quick Sort Three-Way.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    if not products:
+        return products
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_three_way(keys, reverse=reverse)
+
+    return apply_permutation(products, perm)
+
+
+if __name__ == "__main__":
+    # Contoh penggunaan dengan banyak stok yang sama
+    sample_products = [
+        {"id": 1, "name": "Laptop", "price": 15000000, "stock": 10},
+        {"id": 2, "name": "Mouse", "price": 250000, "stock": 50},
+        {"id": 3, "name": "Keyboard", "price": 500000, "stock": 10},
+        {"id": 4, "name": "Monitor", "price": 3500000, "stock": 50},
+        {"id": 5, "name": "Headset", "price": 750000, "stock": 10},
+    ]
+
+    print("=== Quick Sort Three-Way Demo ===\n")
+
+    print("--- Urut berdasarkan Stok (Ascending) ---")
+    for p in sort_products_three_way(sample_products, sort_by='stock'):
+        print(f"  {p['name']}: Stok {p['stock']}")
+
+    print("\n--- Urut berdasarkan Harga (Descending) ---")
+    for p in sort_products_three_way(sample_products, sort_by='price', reverse=True):
+        print(f"  {p['name']}: Rp {p['price']:,}")
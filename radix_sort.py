@@ -0,0 +1,214 @@
+"""
+Radix Sort
+Engine pengurutan non-komparatif untuk kunci bilangan bulat: counting sort untuk
+rentang nilai kecil (mis. stok) dan LSD radix sort per digit biner untuk rentang
+besar (mis. harga). Kompleksitas O(n * jumlah pass) alih-alih O(n log n).
+
+Nilai negatif ditangani dengan menggeser semua kunci sebesar nilai minimum,
+dan kedua metode bersifat stabil. Kunci non-integer (float, string) memakai
+engine komparatif sebagai fallback.
+"""
+
+from itertools import chain
+
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+from introsort import argsort_introsort
+
+# Lebar digit LSD radix (bit per pass); jumlah bucket per pass = 2^bit.
+# Bucket yang terlalu banyak (mis. 2^16) justru lambat karena boros cache
+RADIX_MIN_BITS = 8
+RADIX_MAX_BITS = 13
+
+# Rentang nilai (maks - min) sampai batas ini diurutkan dengan satu pass counting sort
+COUNTING_SORT_MAX_RANGE = 1 << RADIX_MAX_BITS
+
+# Rentang kunci lebih lebar dari ini (mis. integer Python raksasa) memakai fallback
+RADIX_MAX_KEY_BITS = 64
+
+_INTEGER_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q')
+
+
+def integer_columns(keys):
+    """
+    Memeriksa apakah kunci bisa diurutkan dengan radix sort dan memecahnya per kolom.
+
+    Args:
+        keys: List kunci hasil extract_keys, atau tuple komposit dari build_sort_keys
+
+    Returns:
+        List kolom integer (satu kolom untuk kunci tunggal), atau None jika ada
+        kunci non-integer atau rentang nilainya melebihi RADIX_MAX_KEY_BITS
+    """
+    if not len(keys):
+        return None
+    if isinstance(keys[0], tuple):
+        columns = list(zip(*keys))
+    else:
+        columns = [keys]
+
+    for column in columns:
+        if getattr(column, 'typecode', None) not in _INTEGER_TYPECODES:
+            if not set(map(type, column)) <= {int, bool}:
+                return None
+        if (max(column) - min(column)).bit_length() > RADIX_MAX_KEY_BITS:
+            return None
+    return columns
+
+
+def _radix_bits(n, key_bits):
+    """
+    Lebar digit per pass: jumlah pass seminimal mungkin dengan digit <= batas,
+    lalu bit dibagi rata antar pass (25 bit -> 2 pass x 13 bit, bukan 16 + 9).
+    """
+    limit = max(RADIX_MIN_BITS, min(RADIX_MAX_BITS, n.bit_length()))
+    passes = -(-key_bits // limit)
+    return -(-key_bits // passes)
+
+
+def _bucket_pass(digits, perm, size):
+    """Satu pass bucket stabil: indeks baris dikelompokkan menurut digits[baris]."""
+    buckets = [[] for _ in range(size)]
+    appends = [bucket.append for bucket in buckets]
+    if perm is None:
+        for i, digit in enumerate(digits):
+            appends[digit](i)
+    else:
+        for i in perm:
+            appends[digits[i]](i)
+    return list(chain.from_iterable(buckets))
+
+
+def stable_integer_argsort(values, perm=None):
+    """
+    Mengurutkan indeks baris secara stabil berdasarkan nilai integer.
+
+    Args:
+        values: Sequence nilai integer per baris
+        perm: Urutan awal indeks baris (default 0..n-1); urutan ini dipertahankan
+              untuk nilai yang sama, sehingga pass berikutnya bisa dirangkai (LSD)
+
+    Returns:
+        List indeks baris terurut naik menurut values
+    """
+    n = len(values)
+    if n <= 1:
+        return list(range(n)) if perm is None else list(perm)
+
+    low = min(values)
+    span = max(values) - low
+
+    if span < COUNTING_SORT_MAX_RANGE:
+        # Counting sort: satu bucket per nilai, satu pass
+        return _bucket_pass([v - low for v in values], perm, span + 1)
+
+    # LSD radix: pass stabil per digit dari digit terendah, atas nilai yang digeser ke >= 0
+    shifted = [v - low for v in values]
+    bits = _radix_bits(n, span.bit_length())
+    mask = (1 << bits) - 1
+    for shift in range(0, span.bit_length(), bits):
+        perm = _bucket_pass([(v >> shift) & mask for v in shifted], perm, mask + 1)
+    return perm
+
+
+def argsort_radix(keys, reverse=False):
+    """
+    Menghitung permutasi terurut dengan counting/LSD radix sort (stabil).
+
+    Kunci komposit (tuple) diurutkan kolom per kolom dari kolom terakhir ke kolom
+    pertama. Descending diurutkan sebagai ascending pada nilai yang dinegasikan,
+    sehingga kunci yang sama tetap dalam urutan asli. Kunci non-integer memakai
+    sorted() bawaan Python yang juga stabil.
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys (atau tuple komposit
+              dari build_sort_keys)
+        reverse: True untuk urutan descending
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    n = len(keys)
+    if n <= 1:
+        return list(range(n))
+
+    columns = integer_columns(keys)
+    if columns is None:
+        return sorted(range(n), key=keys.__getitem__, reverse=reverse)
+    return _radix_columns(columns, reverse)
+
+
+def _radix_columns(columns, reverse):
+    """LSD antar kolom: pass stabil dari kolom terakhir (kunci paling minor)."""
+    perm = None
+    for column in reversed(columns):
+        if reverse:
+            column = [-v for v in column]
+        perm = stable_integer_argsort(column, perm)
+    return perm
+
+
+def argsort_auto(keys, reverse=False):
+    """
+    Memilih engine otomatis: radix sort untuk kunci integer, Introsort untuk
+    kunci lain (float, string).
+
+    Args:
+        keys: List kunci bertipe hasil extract_keys
+        reverse: True untuk urutan descending
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    columns = integer_columns(keys) if len(keys) > 1 else None
+    if columns is not None:
+        return _radix_columns(columns, reverse)
+    return argsort_introsort(keys, reverse=reverse)
+
+
+def quick_sort_radix(arr, key=None, reverse=False):
+    """
+    Mengurutkan arr in-place dengan radix sort.
+
+    Kompleksitas Waktu: O(n * p), dengan p jumlah pass
+    (1 untuk counting sort, ceil(lebar rentang / lebar digit) untuk LSD)
+
+    Kompleksitas Ruang: O(n + jumlah bucket)
+
+    Args:
+        arr: List data yang akan diurutkan
+        key: Fungsi untuk mengambil nilai kunci dari elemen
+        reverse: True untuk urutan descending
+
+    Returns:
+        List yang sudah diurutkan (in-place)
+    """
+    if len(arr) <= 1:
+        return arr
+
+    keys = extract_keys(arr, key)
+    perm = argsort_radix(keys, reverse=reverse)
+    arr[:] = apply_permutation(arr, perm)
+
+    return arr
+
+
+def sort_products_radix(products, sort_by='price', reverse=False):
+    """
+    Mengurutkan list produk menggunakan radix sort.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    if not products:
+        return products
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    perm = argsort_radix(keys, reverse=reverse)
+
+    return apply_permutation(products, perm)
@@ -0,0 +1,201 @@
+"""
+Preforked Server
+Entry point produksi: dataset dimuat/di-generate sekali di proses induk, lalu
+proses induk mem-fork beberapa worker yang berbagi dataset tersebut secara
+copy-on-write dan menerima koneksi dari satu socket yang sama.
+
+Objek yang sudah ada sebelum fork dibekukan dengan gc.freeze() agar garbage
+collector di worker tidak menyentuh (dan menyalin) halaman memorinya.
+
+Contoh:
+    python serve.py --csv data.csv --workers 4
+    python serve.py --generate 1000000 --seed 42 --port 8000
+
+Batasan: setiap worker adalah proses terpisah dengan state sendiri. Hanya dataset
+yang dimuat sebelum fork yang dipakai bersama (read-only, copy-on-write). Dataset
+yang dimuat lewat API, perubahan baris (POST/PATCH/DELETE /api/products), dan job
+benchmark (/api/benchmark/jobs) hanya akan ada di worker yang kebetulan menerima
+request, sehingga endpoint tersebut ditolak dengan status 409 selama --workers > 1
+(lihat app.PROCESS_LOCAL_ENDPOINTS). Benchmark sinkron, sort, query, dan indeks
+tetap tersedia; indeks dan cache dibuat per worker. Gunakan --workers 1 jika
+endpoint yang mengubah data dibutuhkan.
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+from werkzeug.serving import make_server
+
+import app as web_app
+from dataset_registry import DEFAULT_DATASET_ID
+from product_data import generate_product_table
+from snapshot import load_product_table
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 5000
+
+# Jumlah koneksi yang boleh antri di socket sebelum diterima worker
+LISTEN_BACKLOG = 128
+
+# Jeda sebelum worker yang mati di-fork ulang (mencegah fork berulang terlalu cepat)
+RESPAWN_DELAY = 1.0
+
+
+def preload_dataset(csv_path=None, generate=None, seed=None, dataset_id=DEFAULT_DATASET_ID,
+                    workers=1):
+    """
+    Memuat dataset awal ke registry aplikasi sebelum worker di-fork.
+
+    Args:
+        csv_path: Path CSV (snapshot .snap dipakai jika masih valid)
+        generate: Jumlah produk random jika tidak memuat CSV
+        seed: Seed generator produk random
+        dataset_id: Nama dataset di registry
+        workers: Jumlah proses parsing CSV jika snapshot tidak dipakai
+
+    Returns:
+        Dataset yang dipublikasikan, atau None jika tidak ada dataset awal
+    """
+    start_time = time.perf_counter()
+    if csv_path:
+        table, source = load_product_table(csv_path, errors='ignore', workers=workers)
+    elif generate:
+        table, source = generate_product_table(generate, seed=seed), 'generate'
+    else:
+        return None
+
+    dataset = web_app.datasets.publish(dataset_id, table, source)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f"Dataset '{dataset.id}' dimuat dari {source}: {len(table):,} baris "
+          f"({dataset.nbytes / 1024 / 1024:.1f} MB) dalam {elapsed:.1f} ms")
+    return dataset
+
+
+def create_listen_socket(host, port):
+    """Membuat socket listening yang diwarisi semua worker."""
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve_worker(sock, host, port, threaded=True):
+    """Loop server satu worker di atas socket warisan proses induk (tidak kembali)."""
+    gc.enable()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    server = make_server(host, port, web_app.app, threaded=threaded, fd=sock.fileno())
+    try:
+        server.serve_forever()
+    finally:
+        os._exit(0)
+
+
+def spawn_worker(sock, host, port, threaded=True):
+    """Mem-fork satu worker; mengembalikan PID-nya di proses induk."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            serve_worker(sock, host, port, threaded)
+        except BaseException:
+            os._exit(1)
+    return pid
+
+
+def run_prefork(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, threaded=True):
+    """
+    Menjalankan server dengan beberapa worker hasil fork dan mengawasinya:
+    worker yang mati di-fork ulang, SIGINT/SIGTERM menghentikan semua worker.
+
+    Args:
+        host: Alamat bind
+        port: Port bind
+        workers: Jumlah proses worker (default jumlah core)
+        threaded: True agar setiap worker melayani request dengan banyak thread
+    """
+    workers = workers or os.cpu_count() or 1
+    sock = create_listen_socket(host, port)
+
+    # State per proses (dataset via API, baris, job benchmark) tidak terbagi antar worker
+    web_app.app.config['PREFORK_WORKERS'] = workers
+
+    # Objek dataset yang sudah dimuat dipindah ke generasi permanen sebelum fork,
+    # sehingga GC di worker tidak menulis ke header objeknya (copy-on-write tetap terbagi)
+    gc.collect()
+    gc.freeze()
+
+    children = {spawn_worker(sock, host, port, threaded) for _ in range(workers)}
+    print(f"Server berjalan di http://{host}:{port} dengan {workers} worker "
+          f"(PID induk {os.getpid()})")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} berhenti (status {status}), menjalankan worker baru")
+            time.sleep(RESPAWN_DELAY)
+            children.add(spawn_worker(sock, host, port, threaded))
+
+    sock.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server Quick Sort multi-worker (prefork)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int,
+                        default=int(os.environ.get('SERVER_WORKERS', os.cpu_count() or 1)),
+                        help="Jumlah proses worker (default: jumlah core / SERVER_WORKERS)")
+    parser.add_argument('--csv', help="File CSV yang dimuat sebelum fork")
+    parser.add_argument('--generate', type=int, help="Jumlah produk random yang di-generate sebelum fork")
+    parser.add_argument('--seed', type=int, help="Seed untuk --generate")
+    parser.add_argument('--dataset-id', default=DEFAULT_DATASET_ID)
+    parser.add_argument('--load-workers', type=int, default=1,
+                        help="Jumlah proses parsing CSV jika snapshot belum ada")
+    parser.add_argument('--no-threads', action='store_true',
+                        help="Setiap worker melayani satu request sekaligus")
+    args = parser.parse_args(argv)
+
+    # GC dimatikan selama memuat dataset: jutaan objek baru tidak memicu koleksi berulang
+    gc.disable()
+    preload_dataset(args.csv, args.generate, args.seed, args.dataset_id, args.load_workers)
+
+    if args.workers <= 1 or not hasattr(os, 'fork'):
+        # Tanpa fork (mis. Windows) atau satu worker: satu proses multi-thread
+        gc.enable()
+        print(f"Server berjalan di http://{args.host}:{args.port} (satu proses)")
+        make_server(args.host, args.port, web_app.app, threaded=not args.no_threads).serve_forever()
+        return
+
+    run_prefork(args.host, args.port, args.workers, threaded=not args.no_threads)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Dataset Snapshot
+Format snapshot biner kolumnar untuk memuat ulang dataset dengan cepat.
+
+Kolom numerik disimpan sebagai data lebar tetap (int64/float64) dan kolom teks
+sebagai heap string (offset + byte UTF-8) dengan kode per baris; kolom campuran
+(angka, teks, None) disimpan sebagai array JSON. File dibuka
+dengan mmap sehingga pemuatan ulang hanya membaca header, dan beberapa proses
+dapat berbagi halaman memori yang sama.
+
+Tata letak file:
+    MAGIC (8 byte) | panjang header (uint64) | header JSON | padding | section data
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Sequence
+
+from product_table import ProductTable, INT_TYPECODE, FLOAT_TYPECODE
+from product_data import load_product_table_from_csv
+
+SNAPSHOT_MAGIC = b'QSSNAP01'
+# Versi 2: kolom campuran disimpan sebagai JSON (snapshot versi lama dibuat ulang dari CSV)
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = '.snap'
+
+# Setiap section dimulai pada offset kelipatan 8 byte
+SECTION_ALIGNMENT = 8
+
+# Ukuran blok baca saat menghitung hash file sumber
+HASH_BLOCK_SIZE = 1 << 20
+
+_HEADER_LENGTH = struct.Struct('<Q')
+
+
+class StringHeapColumn(Sequence):
+    """
+    Kolom teks read-only di atas heap string.
+
+    Setiap baris menyimpan kode (indeks string unik); string unik ke-i berada
+    di heap[offsets[i]:offsets[i + 1]] dan baru di-decode saat diakses.
+    """
+
+    __slots__ = ('_codes', '_offsets', '_heap')
+
+    def __init__(self, codes, offsets, heap):
+        self._codes = codes
+        self._offsets = offsets
+        self._heap = heap
+
+    def _decode(self, code):
+        return str(self._heap[self._offsets[code]:self._offsets[code + 1]], 'utf-8')
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(code) for code in self._codes[index]]
+        return self._decode(self._codes[index])
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        # Setiap string unik hanya di-decode sekali selama iterasi
+        decoded = {}
+        for code in self._codes:
+            value = decoded.get(code)
+            if value is None:
+                value = decoded[code] = self._decode(code)
+            yield value
+
+    @property
+    def nbytes(self):
+        """Jumlah byte kode, offset, dan heap."""
+        return self._codes.nbytes + self._offsets.nbytes + self._heap.nbytes
+
+
+def snapshot_path(csv_path):
+    """Mengembalikan path snapshot untuk sebuah file CSV (di sebelah file CSV)."""
+    return csv_path + SNAPSHOT_SUFFIX
+
+
+def file_hash(filepath):
+    """
+    Menghitung hash BLAKE2b isi file.
+
+    Args:
+        filepath: Path file
+
+    Returns:
+        String hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_info(csv_path, errors='strict', with_hash=True):
+    """
+    Mengambil identitas file sumber (ukuran, mtime, hash) untuk validasi snapshot.
+
+    Args:
+        csv_path: Path file CSV
+        errors: Mode error encoding yang dipakai saat parsing
+        with_hash: True untuk ikut menghitung hash isi file
+
+    Returns:
+        Dictionary identitas sumber
+    """
+    stat = os.stat(csv_path)
+    info = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'errors': errors}
+    if with_hash:
+        info['hash'] = file_hash(csv_path)
+    return info
+
+
+def _encode_column(column):
+    """
+    Mengubah satu kolom ProductTable menjadi deskripsi dan daftar section.
+
+    Returns:
+        Tuple (kind, list buffer section)
+    """
+    if isinstance(column, array) and column.typecode in (INT_TYPECODE, FLOAT_TYPECODE):
+        return column.typecode, [column]
+    if isinstance(column, memoryview) and column.format in (INT_TYPECODE, FLOAT_TYPECODE):
+        return column.format, [column]
+    if isinstance(column, StringHeapColumn):
+        return 'str', [column._codes, column._offsets, column._heap]
+
+    values = list(column)
+    if all(isinstance(v, str) for v in values):
+        # Kamus string unik: kode per baris + offset + heap UTF-8
+        codes_by_value = {}
+        codes = array('I', [codes_by_value.setdefault(v, len(codes_by_value)) for v in values])
+        encoded = [v.encode('utf-8') for v in codes_by_value]
+        offsets = array('q', [0])
+        position = 0
+        for item in encoded:
+            position += len(item)
+            offsets.append(position)
+        return 'str', [codes, offsets, b''.join(encoded)]
+
+    # Kolom campuran (mis. berisi None) disimpan sebagai array JSON: int, float,
+    # str, dan None tetap bertipe sama saat dibaca (tanpa pickle yang bisa
+    # menjalankan kode saat snapshot dibuka)
+    if not all(v is None or type(v) in (int, float, str, bool) for v in values):
+        raise ValueError("Kolom snapshot hanya boleh berisi angka, teks, atau None")
+    return 'json', [json.dumps(values, ensure_ascii=False).encode('utf-8')]
+
+
+def _section_bytes(buffer):
+    """Jumlah byte sebuah buffer section."""
+    return memoryview(buffer).nbytes
+
+
+def _align(position):
+    """Membulatkan posisi ke kelipatan SECTION_ALIGNMENT."""
+    return -(-position // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+
+
+def write_snapshot(table, path, source=None):
+    """
+    Menulis ProductTable ke file snapshot biner.
+    File ditulis ke file sementara lalu di-rename agar pembaca tidak pernah
+    melihat snapshot setengah jadi.
+
+    Args:
+        table: ProductTable
+        path: Path file snapshot
+        source: Identitas file sumber dari source_info() (opsional)
+
+    Returns:
+        Ukuran file snapshot (byte)
+    """
+    columns = []
+    sections = []
+    position = 0
+    for name in table.column_names():
+        kind, buffers = _encode_column(table.column(name))
+        spans = []
+        for buffer in buffers:
+            size = _section_bytes(buffer)
+            spans.append([position, size])
+            sections.append((position, buffer))
+            position = _align(position + size)
+        columns.append({'name': name, 'kind': kind, 'sections': spans})
+
+    header = json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'byteorder': sys.byteorder,
+        'length': len(table),
+        'source': source or {},
+        'columns': columns,
+    }).encode('utf-8')
+    data_start = _align(len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size + len(header))
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header)))
+            file.write(header)
+            for offset, buffer in sections:
+                file.seek(data_start + offset)
+                file.write(buffer)
+            file.truncate(data_start + position)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return data_start + position
+
+
+def read_snapshot_header(path):
+    """
+    Membaca header snapshot tanpa memetakan datanya.
+
+    Args:
+        path: Path file snapshot
+
+    Returns:
+        Dictionary header, atau None jika file tidak ada atau formatnya tidak dikenal
+    """
+    try:
+        with open(path, 'rb') as file:
+            if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                return None
+            (length,) = _HEADER_LENGTH.unpack(file.read(_HEADER_LENGTH.size))
+            header = json.loads(file.read(length))
+    except (OSError, ValueError, struct.error):
+        return None
+    if header.get('version') != SNAPSHOT_VERSION or header.get('byteorder') != sys.byteorder:
+        return None
+    return header
+
+
+def open_snapshot(path):
+    """
+    Membuka snapshot dengan mmap dan mengembalikan ProductTable di atasnya.
+    Kolom numerik dan teks dibaca langsung dari halaman file (tanpa parsing).
+
+    Args:
+        path: Path file snapshot
+
+    Returns:
+        ProductTable, atau None jika snapshot tidak valid
+    """
+    header = read_snapshot_header(path)
+    if header is None:
+        return None
+
+    with open(path, 'rb') as file:
+        if header['length'] == 0 or os.fstat(file.fileno()).st_size == 0:
+            return ProductTable({})
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    header_size = len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size
+    (header_length,) = _HEADER_LENGTH.unpack(view[len(SNAPSHOT_MAGIC):header_size])
+    data_start = _align(header_size + header_length)
+
+    def section(span, typecode='B'):
+        offset, size = span
+        return view[data_start + offset:data_start + offset + size].cast(typecode)
+
+    columns = {}
+    for spec in header['columns']:
+        kind, spans = spec['kind'], spec['sections']
+        if kind in (INT_TYPECODE, FLOAT_TYPECODE):
+            columns[spec['name']] = section(spans[0], kind)
+        elif kind == 'str':
+            columns[spec['name']] = StringHeapColumn(section(spans[0], 'I'),
+                                                     section(spans[1], 'q'),
+                                                     section(spans[2]))
+        elif kind == 'json':
+            columns[spec['name']] = json.loads(str(section(spans[0]), 'utf-8'))
+        else:
+            return None
+    return ProductTable(columns)
+
+
+def snapshot_is_valid(header, csv_path, errors='strict'):
+    """
+    Memeriksa apakah snapshot masih sesuai dengan file CSV sumber.
+    Ukuran dan mtime dicek lebih dulu; hash isi file hanya dihitung jika
+    mtime berubah tetapi ukurannya sama (mis. file hanya di-touch).
+
+    Args:
+        header: Header snapshot dari read_snapshot_header()
+        csv_path: Path file CSV sumber
+        errors: Mode error encoding yang diminta
+
+    Returns:
+        True jika snapshot masih valid
+    """
+    if header is None:
+        return False
+    source = header.get('source', {})
+    current = source_info(csv_path, errors, with_hash=False)
+    if source.get('size') != current['size'] or source.get('errors') != errors:
+        return False
+    if source.get('mtime_ns') == current['mtime_ns']:
+        return True
+    return source.get('hash') == file_hash(csv_path)
+
+
+def load_product_table(csv_path, errors='strict', report=False, use_snapshot=True, workers=1):
+    """
+    Memuat ProductTable dari CSV, memakai snapshot biner jika masih valid.
+
+    Pada pemuatan pertama CSV di-parse lalu snapshot ditulis di sebelahnya;
+    pemuatan berikutnya cukup membuka snapshot dengan mmap.
+
+    Args:
+        csv_path: Path file CSV
+        errors: Penanganan error encoding ('strict', 'ignore', ...)
+        report: True untuk mencetak sumber data dan waktu muat
+        use_snapshot: False untuk selalu mem-parse CSV
+        workers: Jumlah proses parsing CSV jika snapshot tidak dipakai
+
+    Returns:
+        Tuple (ProductTable, sumber) dengan sumber 'snapshot' atau 'csv'
+    """
+    start_time = time.perf_counter()
+    path = snapshot_path(csv_path)
+
+    if use_snapshot and os.path.exists(csv_path):
+        header = read_snapshot_header(path)
+        if snapshot_is_valid(header, csv_path, errors):
+            table = open_snapshot(path)
+            if table is not None:
+                if report:
+                    elapsed = (time.perf_counter() - start_time) * 1000
+                    print(f"Snapshot '{path}' dimuat: {len(table):,} baris dalam {elapsed:.3f} ms")
+                return table, 'snapshot'
+
+    try:
+        source = source_info(csv_path, errors, with_hash=False) if use_snapshot else None
+    except OSError:
+        source = None
+    table = load_product_table_from_csv(csv_path, report=report, errors=errors, workers=workers)
+
+    if source is not None and len(table):
+        try:
+            source['hash'] = file_hash(csv_path)
+            write_snapshot(table, path, source)
+        except (OSError, ValueError) as e:
+            print(f"Peringatan: snapshot tidak dapat ditulis ({e})")
+    return table, 'csv'
@@ -0,0 +1,126 @@
+"""
+Sort Cache
+Cache LRU untuk permutasi hasil sorting, dengan kunci (versi dataset, spesifikasi sort)
+dan batas memori yang bisa dikonfigurasi.
+"""
+
+from array import array
+from collections import OrderedDict
+from threading import Lock
+
+# Batas memori default cache permutasi (byte)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def compact_permutation(perm):
+    """
+    Menyimpan permutasi sebagai array.array agar hemat memori
+    (4 byte per baris untuk dataset < 2^32 baris, bukan ~36 byte per int Python).
+
+    Args:
+        perm: List indeks baris
+
+    Returns:
+        array.array berisi indeks yang sama
+    """
+    typecode = 'I' if len(perm) < 2 ** 32 and array('I').itemsize >= 4 else 'Q'
+    return array(typecode, perm)
+
+
+class PermutationCache:
+    """
+    Cache LRU permutasi sorting.
+
+    Kunci cache disusun oleh pemanggil, biasanya
+    (versi dataset, tuple spesifikasi (kolom, reverse)).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        """
+        Mengambil permutasi dari cache.
+
+        Args:
+            key: Kunci cache
+
+        Returns:
+            array.array permutasi, atau None jika tidak ada (miss)
+        """
+        with self._lock:
+            perm = self._entries.get(key)
+            if perm is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return perm
+
+    def put(self, key, perm):
+        """
+        Menyimpan permutasi dan mengeluarkan entri terlama jika melebihi batas memori.
+        Permutasi yang lebih besar dari seluruh batas memori tidak disimpan.
+
+        Args:
+            key: Kunci cache
+            perm: List atau array indeks baris
+
+        Returns:
+            array.array permutasi yang disimpan (atau hasil konversinya)
+        """
+        perm = perm if isinstance(perm, array) else compact_permutation(perm)
+        size = len(perm) * perm.itemsize
+        if size > self.max_bytes:
+            return perm
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old) * old.itemsize
+
+            self._entries[key] = perm
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted) * evicted.itemsize
+
+        return perm
+
+    def discard_where(self, predicate):
+        """
+        Menghapus semua entri yang kuncinya memenuhi predicate(key),
+        mis. semua permutasi milik satu versi dataset.
+
+        Returns:
+            Jumlah entri yang dihapus
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                perm = self._entries.pop(key)
+                self.current_bytes -= len(perm) * perm.itemsize
+            return len(keys)
+
+    def clear(self):
+        """Menghapus semua entri (dipanggil saat dataset diganti)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Mengembalikan statistik cache."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
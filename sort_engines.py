@@ -0,0 +1,130 @@
+"""
+Sort Engines
+Registry semua engine Quick Sort agar bisa dipilih dengan nama algoritma
+dari aplikasi web, CLI, dan benchmark.
+"""
+
+from sort_keys import extract_keys, apply_permutation, build_sort_keys
+from quicksort_recursive import argsort_recursive
+from quicksort_iterative import argsort_iterative
+from quicksort_three_way import argsort_three_way
+from introsort import argsort_introsort
+from numpy_sort import HAS_NUMPY, argsort_numpy, argsort_numpy_stable
+from parallel_quicksort import argsort_parallel
+from radix_sort import argsort_radix, argsort_auto
+
+
+# Label engine NumPy menandai fallback jika NumPy tidak terpasang
+_NUMPY_LABEL = 'NumPy' if HAS_NUMPY else 'NumPy (fallback Introsort)'
+
+# Nama algoritma -> (label tampilan, fungsi argsort(keys, reverse))
+ENGINES = {
+    'recursive': ('Rekursif', argsort_recursive),
+    'iterative': ('Iteratif', argsort_iterative),
+    'three_way': ('Three-Way', argsort_three_way),
+    'introsort': ('Introsort', argsort_introsort),
+    'numpy': (_NUMPY_LABEL, argsort_numpy),
+    'numpy_stable': (_NUMPY_LABEL + ' Stable', argsort_numpy_stable),
+    'parallel': ('Paralel', argsort_parallel),
+    'radix': ('Radix/Counting', argsort_radix),
+    'auto': ('Otomatis (Radix/Introsort)', argsort_auto),
+}
+
+
+def get_engine(algorithm):
+    """
+    Mengambil fungsi argsort untuk sebuah algoritma.
+
+    Args:
+        algorithm: Nama algoritma (lihat ENGINES)
+
+    Returns:
+        Fungsi argsort(keys, reverse=False) yang mengembalikan permutasi
+
+    Raises:
+        ValueError: Jika algoritma tidak dikenal
+    """
+    try:
+        return ENGINES[algorithm][1]
+    except KeyError:
+        raise ValueError(
+            f"Algoritma '{algorithm}' tidak dikenal. Pilihan: {', '.join(ENGINES)}"
+        ) from None
+
+
+def engine_label(algorithm):
+    """Mengembalikan label tampilan sebuah algoritma."""
+    return ENGINES[algorithm][0] if algorithm in ENGINES else algorithm
+
+
+def quick_sort(arr, key=None, reverse=False, algorithm='recursive', engine_options=None):
+    """
+    Mengurutkan arr in-place dengan engine yang dipilih.
+
+    Args:
+        arr: List data yang akan diurutkan
+        key: Fungsi untuk mengambil nilai kunci dari elemen
+        reverse: True untuk urutan descending
+        algorithm: Nama algoritma (lihat ENGINES)
+        engine_options: Argumen tambahan untuk engine, misalnya
+                        {'workers': 8} untuk engine 'parallel'
+
+    Returns:
+        List yang sudah diurutkan (in-place)
+    """
+    argsort = get_engine(algorithm)
+    if len(arr) <= 1:
+        return arr
+
+    keys = extract_keys(arr, key)
+    perm = argsort(keys, reverse=reverse, **(engine_options or {}))
+    arr[:] = apply_permutation(arr, perm)
+
+    return arr
+
+
+def argsort_products(products, sort_by='price', reverse=False, algorithm='recursive',
+                     engine_options=None):
+    """
+    Menghitung permutasi terurut list produk tanpa menyusun ulang datanya.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan atau list spesifikasi multi-kolom
+        reverse: True untuk urutan descending
+        algorithm: Nama algoritma (lihat ENGINES)
+        engine_options: Argumen tambahan untuk engine (lihat quick_sort)
+
+    Returns:
+        List indeks baris dalam urutan terurut
+    """
+    argsort = get_engine(algorithm)
+    if not products:
+        return []
+
+    keys, reverse = build_sort_keys(products, sort_by, reverse)
+    return argsort(keys, reverse=reverse, **(engine_options or {}))
+
+
+def sort_products(products, sort_by='price', reverse=False, algorithm='recursive',
+                  engine_options=None):
+    """
+    Mengurutkan list produk dengan engine yang dipilih.
+
+    Args:
+        products: List dictionary produk
+        sort_by: Atribut untuk pengurutan ('price', 'name', 'stock', dll) atau list
+                 spesifikasi multi-kolom, mis. [('stock', 'desc'), ('price', 'asc')]
+        reverse: True untuk urutan descending
+        algorithm: Nama algoritma (lihat ENGINES)
+        engine_options: Argumen tambahan untuk engine (lihat quick_sort)
+
+    Returns:
+        List produk yang sudah diurutkan
+    """
+    get_engine(algorithm)
+    if not products:
+        return products
+
+    perm = argsort_products(products, sort_by, reverse, algorithm, engine_options)
+    return apply_permutation(products, perm)
@@ -0,0 +1,309 @@
+"""
+Sort Keys
+Tahap ekstraksi kunci untuk Quick Sort: kunci setiap baris dihitung tepat satu kali
+menjadi array kunci bertipe (int/float/str), lalu diurutkan bersama permutasi baris.
+"""
+
+from functools import total_ordering
+
+# Urutan nilai None: selalu dianggap paling kecil (muncul pertama saat ascending)
+NONE_NUMBER = float('-inf')
+NONE_STRING = ''
+
+_NUMBER_TYPES = {int, float, bool, type(None)}
+_STRING_TYPES = {str, type(None)}
+
+# Nilai arah pengurutan yang diterima pada spesifikasi multi-kolom
+_DESCENDING = {'desc', 'descending', 'd', 'dsc'}
+_ASCENDING = {'asc', 'ascending', 'a', ''}
+
+
+def make_key_func(sort_by):
+    """
+    Membuat key function untuk sebuah kolom produk.
+    Nilai string dibandingkan tanpa membedakan huruf besar/kecil.
+
+    Args:
+        sort_by: Nama kolom ('price', 'name', 'stock', dll)
+
+    Returns:
+        Fungsi yang mengambil nilai kunci dari sebuah produk
+    """
+    def key_func(item):
+        value = item.get(sort_by)
+        if isinstance(value, str):
+            return value.lower()
+        return value
+
+    return key_func
+
+
+def infer_key_type(raw_keys):
+    """
+    Menentukan tipe array kunci.
+
+    Args:
+        raw_keys: List nilai kunci mentah
+
+    Returns:
+        'number', 'str', atau 'mixed'
+    """
+    types = set(map(type, raw_keys))
+    if types <= _NUMBER_TYPES:
+        return 'number'
+    if types <= _STRING_TYPES:
+        return 'str'
+    return 'mixed'
+
+
+def normalize_keys(raw_keys):
+    """
+    Mengubah list kunci mentah menjadi array kunci bertipe seragam.
+
+    - Kolom numerik tetap numerik (dibandingkan secara angka), None -> -inf
+    - Kolom string tetap string, None -> ''
+    - Kolom campuran memakai comparable_value: angka (numerik) sebelum teks,
+      None paling awal; aturan yang sama dipakai SortedIndex
+
+    Args:
+        raw_keys: List nilai kunci mentah (boleh diubah in-place)
+
+    Returns:
+        List kunci yang siap dibandingkan
+    """
+    kind = infer_key_type(raw_keys)
+
+    if kind == 'number':
+        if None in raw_keys:
+            return [NONE_NUMBER if k is None else k for k in raw_keys]
+        return raw_keys
+    if kind == 'str':
+        if None in raw_keys:
+            return [NONE_STRING if k is None else k for k in raw_keys]
+        return raw_keys
+    return [comparable_value(k) for k in raw_keys]
+
+
+def extract_keys(items, key=None):
+    """
+    Menghitung kunci setiap elemen tepat satu kali.
+
+    Args:
+        items: List data
+        key: Fungsi untuk mengambil nilai kunci dari elemen (opsional)
+
+    Returns:
+        List kunci bertipe, sejajar dengan items
+    """
+    if key is None:
+        raw_keys = list(items)
+    else:
+        raw_keys = [key(item) for item in items]
+    return normalize_keys(raw_keys)
+
+
+def column_keys(items, column):
+    """
+    Menghitung kunci satu kolom. Jika items kolumnar (punya method column(),
+    mis. ProductTable) kolom dibaca langsung tanpa membuat objek baris.
+
+    Args:
+        items: List dictionary produk atau ProductTable
+        column: Nama kolom
+
+    Returns:
+        List kunci bertipe, sejajar dengan items
+    """
+    get_column = getattr(items, 'column', None)
+    if get_column is None:
+        return extract_keys(items, make_key_func(column))
+
+    values = get_column(column)
+    if values is None:
+        return normalize_keys([None] * len(items))
+    return normalize_keys([v.lower() if isinstance(v, str) else v for v in values])
+
+
+def apply_permutation(items, perm):
+    """
+    Menyusun ulang elemen sesuai permutasi indeks.
+
+    Args:
+        items: List data asli
+        perm: List indeks hasil pengurutan
+
+    Returns:
+        List baru berisi elemen dalam urutan permutasi
+    """
+    return [items[i] for i in perm]
+
+
+def _parse_direction(direction):
+    """Mengubah arah ('asc'/'desc'/bool) menjadi flag reverse."""
+    if isinstance(direction, bool):
+        return direction
+    text = str(direction).strip().lower()
+    if text in _DESCENDING:
+        return True
+    if text in _ASCENDING:
+        return False
+    raise ValueError(f"Arah pengurutan '{direction}' tidak valid (gunakan 'asc' atau 'desc')")
+
+
+def _parse_spec_item(item):
+    """Mengubah satu item spesifikasi menjadi tuple (kolom, reverse)."""
+    if isinstance(item, str):
+        column, _, direction = item.partition(':')
+        return column.strip(), _parse_direction(direction)
+    if isinstance(item, dict):
+        column = item.get('column', item.get('sort_by'))
+        if 'reverse' in item:
+            return column, bool(item['reverse'])
+        return column, _parse_direction(item.get('direction', 'asc'))
+    column, direction = item
+    return column, _parse_direction(direction)
+
+
+def parse_sort_spec(sort_by, reverse=False):
+    """
+    Menormalkan spesifikasi pengurutan menjadi list (kolom, reverse).
+
+    Bentuk yang diterima:
+    - 'price' atau 'price:desc'
+    - [('stock', 'desc'), ('price', 'asc'), 'name']
+    - [{'column': 'stock', 'direction': 'desc'}, ...]
+
+    Args:
+        sort_by: Nama kolom atau list spesifikasi multi-kolom
+        reverse: True untuk membalik seluruh urutan
+
+    Returns:
+        List tuple (kolom, reverse) sesuai urutan prioritas
+    """
+    items = [sort_by] if isinstance(sort_by, (str, dict)) else list(sort_by)
+    specs = [_parse_spec_item(item) for item in items]
+    if not specs or any(not column for column, _ in specs):
+        raise ValueError("Spesifikasi pengurutan membutuhkan minimal satu nama kolom")
+    if reverse:
+        specs = [(column, not desc) for column, desc in specs]
+    return specs
+
+
+def describe_sort_spec(specs):
+    """Mengembalikan teks spesifikasi, mis. 'stock DESC, price ASC'."""
+    return ", ".join(f"{column} {'DESC' if desc else 'ASC'}" for column, desc in specs)
+
+
+@total_ordering
+class Descending:
+    """Pembungkus kunci yang membalik urutan (untuk kolom descending pada multi-kolom)."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def comparable_value(value):
+    """
+    Kunci satu nilai yang selalu bisa dibandingkan dengan nilai lain:
+    angka diurutkan sebelum teks (teks tanpa membedakan huruf besar/kecil),
+    dan None paling awal seperti pada sort di memori.
+    """
+    if isinstance(value, str):
+        return (1, value.lower())
+    if value is None:
+        return (0, NONE_NUMBER)
+    return (0, value)
+
+
+def descending_value(value):
+    """
+    Kebalikan comparable_value untuk kolom descending pada kunci multi-kolom.
+    Angka cukup dinegasikan; hanya teks yang memakai pembungkus Descending.
+    """
+    if isinstance(value, str):
+        return (0, Descending(value.lower()))
+    if value is None:
+        return (1, -NONE_NUMBER)
+    return (1, -value)
+
+
+def make_row_key_func(positions, directions):
+    """
+    Membuat fungsi kunci untuk baris berupa sequence nilai, dihitung per baris
+    (tanpa melihat baris lain) sehingga cocok untuk merge dan indeks inkremental.
+
+    Args:
+        positions: Posisi kolom di dalam baris, sesuai urutan prioritas
+        directions: List flag descending per kolom
+
+    Returns:
+        Tuple (key_func, reverse); arah campuran memakai pembungkus Descending
+    """
+    if len(set(directions)) == 1:
+        if len(positions) == 1:
+            position = positions[0]
+            return (lambda row: comparable_value(row[position])), directions[0]
+        return (lambda row: tuple(comparable_value(row[p]) for p in positions)), directions[0]
+
+    converters = [(p, descending_value if desc else comparable_value)
+                  for p, desc in zip(positions, directions)]
+
+    def key_func(row):
+        return tuple(convert(row[p]) for p, convert in converters)
+    return key_func, False
+
+
+def _rank_keys(keys):
+    """
+    Mengganti kunci string dengan peringkat (dense rank) bertipe int
+    agar bisa dinegasikan untuk arah descending.
+    """
+    # Import di sini untuk menghindari import melingkar (introsort memakai modul ini)
+    from introsort import argsort_introsort
+
+    unique = list(set(keys))
+    argsort_introsort(unique)
+    rank = {value: i for i, value in enumerate(unique)}
+    return [rank[k] for k in keys]
+
+
+def build_sort_keys(items, sort_by, reverse=False):
+    """
+    Mengompilasi spesifikasi pengurutan menjadi satu array kunci yang dihitung
+    sekali per baris.
+
+    Satu kolom menghasilkan array kunci biasa. Multi-kolom menghasilkan tuple
+    kunci komposit: kolom numerik dinegasikan untuk arah descending, kolom
+    string diganti peringkatnya dulu lalu dinegasikan.
+
+    Args:
+        items: List dictionary produk atau ProductTable
+        sort_by: Nama kolom atau list spesifikasi (lihat parse_sort_spec)
+        reverse: True untuk urutan descending
+
+    Returns:
+        Tuple (keys, reverse) siap dipakai engine argsort
+    """
+    specs = parse_sort_spec(sort_by)
+    if len(specs) == 1:
+        column, desc = specs[0]
+        return column_keys(items, column), desc != bool(reverse)
+
+    columns = []
+    for column, desc in parse_sort_spec(sort_by, reverse):
+        keys = column_keys(items, column)
+        if infer_key_type(keys) != 'number':
+            keys = _rank_keys(keys)
+        if desc:
+            keys = [-k for k in keys]
+        columns.append(keys)
+
+    return list(zip(*columns)), False
@@ -0,0 +1,271 @@
+"""
+Sorted Index
+Indeks terurut yang diperbarui secara inkremental saat baris ditambah, diubah,
+atau dihapus, sehingga perubahan satu baris tidak memerlukan sort ulang penuh.
+
+Entri (kunci, indeks baris) disimpan dalam list-of-blocks terurut: pencarian blok
+dengan binary search pada nilai maksimum tiap blok, lalu sisip/hapus di dalam blok
+berukuran terbatas (O(log n + ukuran blok) per perubahan).
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, islice
+
+from sort_keys import parse_sort_spec, describe_sort_spec, make_row_key_func, comparable_value
+
+# Ukuran blok target; blok dipecah jika melebihi dua kali ukuran ini
+INDEX_BLOCK_SIZE = 1000
+
+
+class SortedIndex:
+    """
+    Indeks terurut satu spesifikasi sort di atas ProductTable.
+
+    Mendukung len(), index[a:b] (list indeks baris terurut), iter_rows(), dan
+    pembaruan inkremental lewat insert_row() / discard_row().
+    """
+
+    def __init__(self, table, sort_by='price', reverse=False, block_size=INDEX_BLOCK_SIZE):
+        """
+        Args:
+            table: ProductTable yang diindeks
+            sort_by: Atribut pengurutan atau list spesifikasi multi-kolom
+            reverse: True untuk urutan descending
+            block_size: Ukuran blok target
+        """
+        self.table = table
+        self.specs = parse_sort_spec(sort_by, reverse)
+        self.columns = [column for column, _ in self.specs]
+        self._key, self.reverse = make_row_key_func(range(len(self.specs)),
+                                                    [desc for _, desc in self.specs])
+        self._block_size = block_size
+
+        # Build awal sekali O(n log n) per kolom; urutan seri ditentukan indeks baris
+        n = len(table)
+        columns = [table.column(name) for name in self.columns]
+        columns = [[None] * n if column is None else column for column in columns]
+        entries = sorted(zip(map(self._key, zip(*columns)), range(n)))
+        self._blocks = [entries[i:i + block_size] for i in range(0, len(entries), block_size)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._length = len(entries)
+        self._starts = None
+
+    def row_key(self, row):
+        """Menghitung kunci indeks untuk satu baris tabel."""
+        values = []
+        for name in self.columns:
+            column = self.table.column(name)
+            values.append(None if column is None else column[row])
+        return self._key(values)
+
+    def depends_on(self, columns):
+        """True jika perubahan pada kolom-kolom ini memengaruhi urutan indeks."""
+        return any(name in columns for name in self.columns)
+
+    def describe(self):
+        """Mengembalikan teks spesifikasi indeks, mis. 'stock DESC, price ASC'."""
+        return describe_sort_spec(self.specs)
+
+    def __len__(self):
+        return self._length
+
+    def _add(self, entry):
+        """Menyisipkan entri ke blok yang tepat dan memecah blok yang terlalu besar."""
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+        else:
+            i = min(bisect_left(self._maxes, entry), len(self._maxes) - 1)
+            block = self._blocks[i]
+            insort(block, entry)
+            self._maxes[i] = block[-1]
+            if len(block) > 2 * self._block_size:
+                half = len(block) // 2
+                self._blocks[i:i + 1] = [block[:half], block[half:]]
+                self._maxes[i:i + 1] = [block[half - 1], block[-1]]
+        self._length += 1
+        self._starts = None
+
+    def _remove(self, entry):
+        """Menghapus entri; KeyError jika entri tidak ada di indeks."""
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            raise KeyError(entry[1])
+        block = self._blocks[i]
+        j = bisect_left(block, entry)
+        if j == len(block) or block[j] != entry:
+            raise KeyError(entry[1])
+        del block[j]
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+        self._length -= 1
+        self._starts = None
+
+    def insert_row(self, row):
+        """Menambahkan baris ke indeks sesuai nilai kolomnya saat ini."""
+        self._add((self.row_key(row), row))
+
+    def discard_row(self, row):
+        """Menghapus baris dari indeks (dipanggil sebelum nilai barisnya berubah)."""
+        self._remove((self.row_key(row), row))
+
+    def _block_starts(self):
+        """Posisi awal setiap blok (dihitung ulang hanya setelah indeks berubah)."""
+        if self._starts is None:
+            self._starts = [0, *accumulate(len(block) for block in self._blocks)][:-1]
+        return self._starts
+
+    def _iter_positions(self, start, stop, backwards=False):
+        """Iterasi indeks baris pada posisi [start, stop) dalam urutan kunci naik (atau mundur)."""
+        remaining = stop - start
+        if remaining <= 0:
+            return
+        starts = self._block_starts()
+
+        if not backwards:
+            i = bisect_right(starts, start) - 1
+            offset = start - starts[i]
+            for block in islice(self._blocks, i, None):
+                for _, row in block[offset:offset + remaining]:
+                    yield row
+                remaining -= len(block) - offset
+                if remaining <= 0:
+                    return
+                offset = 0
+            return
+
+        i = bisect_right(starts, stop - 1) - 1
+        end = stop - starts[i]
+        for block in reversed(self._blocks[:i + 1]):
+            if end is None:
+                end = len(block)
+            low = max(0, end - remaining)
+            for _, row in reversed(block[low:end]):
+                yield row
+            remaining -= end - low
+            if remaining <= 0:
+                return
+            end = None
+
+    def iter_rows(self, start=0, stop=None, backwards=False):
+        """
+        Iterasi indeks baris dalam urutan spesifikasi indeks.
+
+        Args:
+            start: Posisi awal (inklusif)
+            stop: Posisi akhir (eksklusif), default akhir indeks
+            backwards: True untuk membaca posisi [start, stop) dari belakang
+                       (urutan kebalikan indeks, tanpa indeks terpisah)
+
+        Yields:
+            Indeks baris tabel
+        """
+        stop = self._length if stop is None else min(stop, self._length)
+        start = max(start, 0)
+        if not self.reverse:
+            return self._iter_positions(start, stop, backwards)
+        # Descending: posisi cermin [n - stop, n - start) dibaca dari arah sebaliknya
+        return self._iter_positions(self._length - stop, self._length - start, not backwards)
+
+    def _bisect(self, entry):
+        """Posisi (urutan kunci naik) entri pertama yang >= entry."""
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            return self._length
+        return self._block_starts()[i] + bisect_left(self._blocks[i], entry)
+
+    def value_range(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Mencari rentang posisi baris yang nilai kolomnya berada di antara low dan high
+        dengan binary search (O(log n)). Hanya untuk indeks satu kolom.
+
+        Args:
+            low: Batas bawah (None: tanpa batas)
+            high: Batas atas (None: tanpa batas)
+            include_low: True jika low ikut (>=), False untuk >
+            include_high: True jika high ikut (<=), False untuk <
+
+        Returns:
+            Tuple (start, stop) posisi dalam urutan indeks, untuk iter_rows(start, stop)
+        """
+        return self._key_range(None if low is None else comparable_value(low),
+                               None if high is None else comparable_value(high),
+                               include_low, include_high)
+
+    def _key_range(self, low_key, high_key, include_low=True, include_high=True):
+        """value_range() untuk batas yang sudah berupa kunci indeks (hasil comparable_value)."""
+        if len(self.columns) != 1:
+            raise ValueError("Query rentang membutuhkan indeks satu kolom")
+
+        # (kunci,) lebih kecil dari semua (kunci, baris); (kunci, inf) lebih besar
+        if low_key is None:
+            start = 0
+        else:
+            start = self._bisect((low_key,) if include_low else (low_key, float('inf')))
+        if high_key is None:
+            stop = self._length
+        else:
+            stop = self._bisect((high_key, float('inf')) if include_high else (high_key,))
+        stop = max(start, stop)
+
+        if self.reverse:
+            return self._length - stop, self._length - start
+        return start, stop
+
+    def prefix_range(self, prefix):
+        """
+        Mencari rentang posisi baris yang nilai teksnya diawali prefix
+        (tanpa membedakan huruf besar/kecil).
+
+        Returns:
+            Tuple (start, stop) posisi dalam urutan indeks
+        """
+        prefix = prefix.lower()
+        if not prefix:
+            return self.value_range(low='')
+        # Batas atas dibuat dari prefix yang sudah lowercase dan dipakai langsung
+        # sebagai kunci (tidak di-lowercase lagi: '@' + 1 = 'A' tidak boleh menjadi 'a')
+        last = ord(prefix[-1])
+        upper = None if last == sys.maxunicode else (1, prefix[:-1] + chr(last + 1))
+        return self._key_range(comparable_value(prefix), upper, include_high=False)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("SortedIndex hanya mendukung akses slice, mis. index[0:50]")
+        start, stop, step = index.indices(self._length)
+        if step != 1:
+            raise ValueError("Slice SortedIndex tidak mendukung step")
+        return list(self.iter_rows(start, stop))
+
+    def permutation(self):
+        """Mengembalikan seluruh urutan baris sebagai array indeks."""
+        return array('q', self.iter_rows())
+
+    def memory_usage(self):
+        """
+        Perkiraan memori entri indeks (byte), diekstrapolasi dari satu entri contoh.
+
+        Returns:
+            Jumlah byte
+        """
+        if not self._length:
+            return 0
+        entry = self._blocks[0][0]
+        key = entry[0]
+        entry_bytes = sys.getsizeof(entry) + sys.getsizeof(key)
+        if isinstance(key, tuple):
+            entry_bytes += sum(sys.getsizeof(part) for part in key)
+        return self._length * (entry_bytes + 8) + sys.getsizeof(self._blocks) * 2
+
+    def stats(self):
+        """Mengembalikan ringkasan indeks."""
+        return {
+            'sort_spec': self.describe(),
+            'rows': self._length,
+            'blocks': len(self._blocks),
+        }